@@ -20,6 +20,7 @@ from hydrolib.core.base.models import (
     ParsableFileModel,
     SerializerConfig,
 )
+from hydrolib.core.base.parse_cache import PersistentParseCache
 
 __all__ = [
     # models
@@ -34,4 +35,6 @@ __all__ = [
     "FileLoadContext",
     "ResolveRelativeMode",
     "PathOrStr",
+    # parse_cache
+    "PersistentParseCache",
 ]
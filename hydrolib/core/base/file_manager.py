@@ -1,14 +1,38 @@
 """File Manager Module."""
 
+import logging
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
 from contextlib import contextmanager
 from contextvars import ContextVar
 from enum import IntEnum
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, Generator, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+
+from strenum import StrEnum
 
+from hydrolib.core.base.parse_cache import PersistentParseCache
 from hydrolib.core.base.utils import (
+    FileChangeDetection,
     FileChecksumCalculator,
     FilePathStyleConverter,
+    FileStat,
     OperatingSystem,
     PathStyle,
     get_operating_system,
@@ -17,7 +41,9 @@ from hydrolib.core.base.utils import (
 )
 
 if TYPE_CHECKING:
-    from hydrolib.core.base.models import FileModel
+    from hydrolib.core.base.models import FileModel, ParsableFileModel
+
+logger = logging.getLogger(__name__)
 
 PathOrStr = Union[Path, str]
 # We use ContextVars to keep a reference to the folder
@@ -323,6 +349,19 @@ class FilePathResolver:
         if relative_mode == ResolveRelativeMode.ToAnchor:
             self._anchors.pop()
 
+    def copy(self) -> "FilePathResolver":
+        """Create a copy of this FilePathResolver with the current state.
+
+        Parents pushed on or popped from the copy do not affect this FilePathResolver.
+
+        Returns:
+            FilePathResolver: The copy of this FilePathResolver.
+        """
+        path_resolver = FilePathResolver()
+        path_resolver._anchors = list(self._anchors)
+        path_resolver._parents = list(self._parents)
+        return path_resolver
+
 
 class PathStyleValidator:
     """Class to take care of path style validation."""
@@ -357,11 +396,152 @@ class PathStyleValidator:
         )
 
 
+class ParallelLoadMode(StrEnum):
+    """Parallel load mode.
+
+    ParallelLoadMode defines how child files are parsed while recursively loading
+    a model tree.
+
+    Options:
+        NONE:
+            Child files are parsed one after another while the model tree is built.
+        THREADS:
+            Child files are parsed ahead of time on a pool of worker threads.
+        PROCESSES:
+            Child files are parsed ahead of time on a pool of worker processes.
+    """
+
+    NONE = "none"
+    THREADS = "threads"
+    PROCESSES = "processes"
+
+
+def parse_file(
+    path: Path,
+    model_type: type,
+    parse: Callable[[Path], Dict[str, Any]],
+    parse_cache: Optional[PersistentParseCache] = None,
+) -> Dict[str, Any]:
+    """Parse the file at the (absolute) path, using the persistent parse cache if provided.
+
+    Args:
+        path (Path): The absolute path of the file to parse.
+        model_type (type): The model type used to parse the file.
+        parse (Callable[[Path], Dict[str, Any]]): The function that parses the file.
+        parse_cache (Optional[PersistentParseCache], optional): The persistent parse cache. Defaults to None.
+
+    Returns:
+        Dict[str, Any]: The parsed data.
+    """
+    if parse_cache is None:
+        return parse(path)
+    return parse_cache.parse(path, model_type, parse)
+
+
+class ParsedFilePrefetcher:
+    """ParsedFilePrefetcher parses files on a worker pool ahead of their FileModel construction.
+
+    The model tree itself is always built sequentially, such that the FileModelCache
+    and FilePathResolver behave exactly the same as during a sequential load. The
+    prefetcher only moves the parsing of the (independent) files to a worker pool:
+    the parsed data of a file is requested when its FileModel is constructed. Each
+    combination of file and model type is parsed at most once.
+    """
+
+    def __init__(
+        self,
+        mode: ParallelLoadMode,
+        max_workers: Optional[int],
+        parse_cache: Optional[PersistentParseCache] = None,
+    ) -> None:
+        """Create a new ParsedFilePrefetcher.
+
+        Args:
+            mode (ParallelLoadMode): The type of worker pool, either threads or processes.
+            max_workers (Optional[int]): The maximum number of workers. Defaults to the executor default.
+            parse_cache (Optional[PersistentParseCache], optional): The persistent parse cache used by the workers. Defaults to None.
+
+        Raises:
+            ValueError: When the mode is ParallelLoadMode.NONE.
+        """
+        executor_types: Dict[ParallelLoadMode, Type[Executor]] = {
+            ParallelLoadMode.THREADS: ThreadPoolExecutor,
+            ParallelLoadMode.PROCESSES: ProcessPoolExecutor,
+        }
+        if mode not in executor_types:
+            raise ValueError(f"Parallel load mode '{mode}' does not use a worker pool.")
+
+        self._executor = executor_types[mode](max_workers=max_workers)
+        self._parse_cache = parse_cache
+        self._futures: Dict[Tuple[Path, type], Future] = {}
+        self._submitted: Set[Tuple[Path, type]] = set()
+
+    def submit(self, path: Path, model_type: Type["ParsableFileModel"]) -> None:
+        """Schedule the parsing of the file at the (absolute) path with the model type.
+
+        Files that have been submitted before are ignored.
+
+        Args:
+            path (Path): The absolute path of the file to parse.
+            model_type (Type[ParsableFileModel]): The model type used to parse the file.
+        """
+        key = (path, model_type)
+        if key in self._submitted:
+            return
+
+        self._submitted.add(key)
+        self._futures[key] = self._executor.submit(
+            parse_file, path, model_type, model_type._parse, self._parse_cache
+        )
+
+    def retrieve(
+        self, path: Path, model_type: Type["ParsableFileModel"]
+    ) -> Optional[Dict[str, Any]]:
+        """Retrieve the parsed data of the file at the (absolute) path.
+
+        The data is handed out only once. If the file was not submitted, or parsing
+        it failed, None is returned and the caller is expected to parse the file
+        itself, such that any error is raised within the regular loading flow. A
+        failure is logged as a warning, since it is only reported here.
+
+        Args:
+            path (Path): The absolute path of the parsed file.
+            model_type (Type[ParsableFileModel]): The model type used to parse the file.
+
+        Returns:
+            Optional[Dict[str, Any]]: The parsed data, or None if not available.
+        """
+        future = self._futures.pop((path, model_type), None)
+        if future is None:
+            return None
+
+        try:
+            return future.result()
+        except Exception:
+            logger.warning(
+                f"Parsing {path} in parallel failed, it is parsed sequentially instead.",
+                exc_info=True,
+            )
+            return None
+
+    def shutdown(self) -> None:
+        """Shut down the worker pool and discard any parsed data that was not retrieved."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._futures.clear()
+
+
 class ModelLoadSettings:
     """A class that holds the global settings for model loading."""
 
     def __init__(
-        self, recurse: bool, resolve_casing: bool, path_style: PathStyle
+        self,
+        recurse: bool,
+        resolve_casing: bool,
+        path_style: PathStyle,
+        parallel_mode: ParallelLoadMode = ParallelLoadMode.NONE,
+        max_workers: Optional[int] = None,
+        parse_cache: Optional[PersistentParseCache] = None,
+        lazy: bool = False,
     ) -> None:
         """Initializes a new instance of the ModelLoadSettings class.
 
@@ -369,10 +549,18 @@ class ModelLoadSettings:
             recurse (bool): Whether or not to recursively load the whole model.
             resolve_casing (bool): Whether or not to resolve the file casing.
             path_style (PathStyle): Which path style is used in the loaded files.
+            parallel_mode (ParallelLoadMode, optional): How child files are parsed. Defaults to ParallelLoadMode.NONE.
+            max_workers (Optional[int], optional): The maximum number of parallel workers. Defaults to None.
+            parse_cache (Optional[PersistentParseCache], optional): The persistent cache for parsed file data. Defaults to None.
+            lazy (bool, optional): Whether or not child models are only loaded on first access. Defaults to False.
         """
         self._recurse = recurse
         self._resolve_casing = resolve_casing
         self._path_style = path_style
+        self._parallel_mode = parallel_mode
+        self._max_workers = max_workers
+        self._parse_cache = parse_cache
+        self._lazy = lazy
 
     @property
     def recurse(self) -> bool:
@@ -401,12 +589,49 @@ class ModelLoadSettings:
         """
         return self._path_style
 
+    @property
+    def parallel_mode(self) -> ParallelLoadMode:
+        """Gets the parallel load mode setting.
+
+        Returns:
+            ParallelLoadMode: How child files are parsed.
+        """
+        return self._parallel_mode
+
+    @property
+    def max_workers(self) -> Optional[int]:
+        """Gets the maximum number of parallel workers.
+
+        Returns:
+            Optional[int]: The maximum number of workers, None for the executor default.
+        """
+        return self._max_workers
+
+    @property
+    def parse_cache(self) -> Optional[PersistentParseCache]:
+        """Gets the persistent parse cache setting.
+
+        Returns:
+            Optional[PersistentParseCache]: The persistent cache for parsed file data, if any.
+        """
+        return self._parse_cache
+
+    @property
+    def lazy(self) -> bool:
+        """Gets the lazy load setting.
+
+        Returns:
+            bool: Whether or not child models are only loaded on first access.
+        """
+        return self._lazy
+
 
 class CachedFileModel:
-    """CachedFileModel provides a simple structure to keep the Filemodel and checksum together."""
+    """CachedFileModel provides a simple structure to keep the Filemodel, checksum and file stat together."""
 
     _model: "FileModel"
-    _checksum: str
+    _checksum: Optional[str]
+    _stat: Optional[FileStat]
 
     @property
     def model(self) -> "FileModel":
@@ -414,27 +639,55 @@ class CachedFileModel:
         return self._model
 
     @property
-    def checksum(self) -> str:
-        """Checksum of the file the filemodel is based on."""
+    def checksum(self) -> Optional[str]:
+        """Checksum of the file the filemodel is based on, None if it has not been calculated."""
         return self._checksum
 
-    def __init__(self, model: "FileModel", checksum: str) -> None:
+    @property
+    def stat(self) -> Optional[FileStat]:
+        """File stat of the file the filemodel is based on, at the moment its checksum was last verified."""
+        return self._stat
+
+    @stat.setter
+    def stat(self, value: Optional[FileStat]) -> None:
+        self._stat = value
+
+    def __init__(
+        self,
+        model: "FileModel",
+        checksum: Optional[str],
+        stat: Optional[FileStat] = None,
+    ) -> None:
         """Create a new empty CachedFileModel.
 
         Args:
             model (FileModel): filemodel to cache.
-            checksum (str): checksum of the file.
+            checksum (Optional[str]): checksum of the file, None if it has not been calculated.
+            stat (Optional[FileStat], optional): file stat of the file. Defaults to None.
         """
         self._model = model
         self._checksum = checksum
+        self._stat = stat
 
 
 class FileModelCache:
     """FileModelCache provides a simple structure to register and retrieve FileModel objects."""
 
-    def __init__(self):
-        """Create a new empty FileModelCache."""
+    def __init__(self, change_detection: Optional[FileChangeDetection] = None):
+        """Create a new empty FileModelCache.
+
+        Args:
+            change_detection (Optional[FileChangeDetection], optional):
+                The strategy used to detect whether a cached file has changed.
+                Defaults to the FILE_CHANGE_DETECTION setting.
+        """
+        if change_detection is None:
+            from hydrolib.core.config import settings
+
+            change_detection = settings.FILE_CHANGE_DETECTION
+
         self._cache_dict: Dict[Path, CachedFileModel] = {}
+        self._change_detection = FileChangeDetection(change_detection)
 
     def retrieve_model(self, path: Path) -> Optional["FileModel"]:
         """Retrieve model.
@@ -452,15 +705,26 @@ class FileModelCache:
             return None
         return cached_file_model.model
 
-    def register_model(self, path: Path, model: "FileModel") -> None:
+    def register_model(
+        self, path: Path, model: "FileModel", calculate_checksum: bool = True
+    ) -> None:
         """Register the model with the specified path in this FileModelCache.
 
         Args:
             path (Path): The path to associate the model with.
             model (FileModel): The model to be associated with the path.
+            calculate_checksum (bool, optional):
+                Whether or not to calculate the checksum of the file. With the
+                FileChangeDetection.STAT strategy the checksum can be omitted, in which
+                case any change of the file stat marks the file as changed. Defaults to True.
         """
-        checksum = self._get_checksum(path)
-        self._cache_dict[path] = CachedFileModel(model, checksum)
+        # The stat is retrieved before the checksum, such that a change during
+        # the checksum calculation results in a mismatching stat later on.
+        stat = FileStat.from_path(path)
+        checksum = None
+        if calculate_checksum or self._change_detection != FileChangeDetection.STAT:
+            checksum = self._get_checksum(path)
+        self._cache_dict[path] = CachedFileModel(model, checksum, stat)
 
     def unregister_model(self, path: Path) -> None:
         """Remove the model associated with the specified path from the cache.
@@ -492,6 +756,11 @@ class FileModelCache:
     def has_changed(self, path: Path) -> bool:
         """Whether or not the file in the filepath has changed from the cache.
 
+        With the FileChangeDetection.STAT strategy, the checksum is only calculated
+        when the size, modification time or inode of the file differ from the cached
+        values. When the checksum turns out to be unchanged, the cached file stat is
+        updated, such that subsequent calls are cheap again.
+
         Args:
             path (Path): The path to verify verify against.
 
@@ -504,8 +773,24 @@ class FileModelCache:
         if not self._exists(path):
             return True
 
+        cached_file_model = self._cache_dict[path]
+        stat = FileStat.from_path(path)
+        if (
+            self._change_detection == FileChangeDetection.STAT
+            and stat is not None
+            and stat == cached_file_model.stat
+        ):
+            return False
+
+        if cached_file_model.checksum is None:
+            return True
+
         checksum = self._get_checksum(path)
-        return checksum != self._cache_dict.get(path).checksum
+        if checksum != cached_file_model.checksum:
+            return True
+
+        cached_file_model.stat = stat
+        return False
 
     def _get_checksum(self, path: Path) -> Optional[str]:
         return FileChecksumCalculator.calculate_checksum(path)
@@ -580,9 +865,17 @@ class FileLoadContext:
         self._file_casing_resolver = FileCasingResolver()
         self._file_path_style_converter = FilePathStyleConverter()
         self._load_settings: Optional[ModelLoadSettings] = None
+        self._prefetcher: Optional[ParsedFilePrefetcher] = None
 
     def initialize_load_settings(
-        self, recurse: bool, resolve_casing: bool, path_style: PathStyle
+        self,
+        recurse: bool,
+        resolve_casing: bool,
+        path_style: PathStyle,
+        parallel_mode: ParallelLoadMode = ParallelLoadMode.NONE,
+        max_workers: Optional[int] = None,
+        parse_cache: Optional[PersistentParseCache] = None,
+        lazy: bool = False,
     ):
         """Initialize the global model load setting. Can only be set once.
 
@@ -590,9 +883,26 @@ class FileLoadContext:
             recurse (bool): Whether or not to recursively load the whole model.
             resolve_casing (bool): Whether or not to resolve the file casing.
             path_style (PathStyle): Which path style is used in the loaded files.
+            parallel_mode (ParallelLoadMode, optional): How child files are parsed. Defaults to ParallelLoadMode.NONE.
+            max_workers (Optional[int], optional): The maximum number of parallel workers. Defaults to None.
+            parse_cache (Optional[PersistentParseCache], optional): The persistent cache for parsed file data. Defaults to None.
+            lazy (bool, optional): Whether or not child models are only loaded on first access. Defaults to False.
         """
         if self._load_settings is None:
-            self._load_settings = ModelLoadSettings(recurse, resolve_casing, path_style)
+            self._load_settings = ModelLoadSettings(
+                recurse,
+                resolve_casing,
+                path_style,
+                parallel_mode,
+                max_workers,
+                parse_cache,
+                lazy,
+            )
+            # Lazily loaded child models are not parsed ahead of time.
+            if recurse and not lazy and parallel_mode != ParallelLoadMode.NONE:
+                self._prefetcher = ParsedFilePrefetcher(
+                    parallel_mode, max_workers, parse_cache
+                )
 
     @property
     def load_settings(self) -> ModelLoadSettings:
@@ -629,7 +939,9 @@ class FileLoadContext:
         absolute_path = self._path_resolver.resolve(path)
         return self._cache.retrieve_model(absolute_path)
 
-    def register_model(self, path: Path, model: "FileModel") -> None:
+    def register_model(
+        self, path: Path, model: "FileModel", calculate_checksum: bool = True
+    ) -> None:
         """Associate the provided model with the provided path.
 
         Relative paths will be resolved based on the current state of the
@@ -638,9 +950,11 @@ class FileLoadContext:
         Args:
             path (Path): The relative path from which the model was loaded.
             model (FileModel): The loaded model.
+            calculate_checksum (bool, optional):
+                Whether or not to calculate the checksum of the file. Defaults to True.
         """
         absolute_path = self._path_resolver.resolve(path)
-        self._cache.register_model(absolute_path, model)
+        self._cache.register_model(absolute_path, model, calculate_checksum)
 
     def unregister_model(self, path: Path) -> None:
         """Remove the model associated with the provided path from the cache.
@@ -752,22 +1066,118 @@ class FileLoadContext:
         absolute_path = self._path_resolver.resolve(path)
         return self._cache.has_changed(absolute_path)
 
+    def prefetch(self, path: Path, model_type: Type["ParsableFileModel"]) -> None:
+        """Schedule the parsing of a child file when parallel loading is enabled.
+
+        The path is resolved exactly as it will be when the child model is
+        constructed. Files that are already cached or do not exist are skipped.
+
+        Args:
+            path (Path): The (relative) path of the child file, as referenced in its parent.
+            model_type (Type[ParsableFileModel]): The model type used to parse the file.
+        """
+        if self._prefetcher is None:
+            return
+
+        file_path = self.convert_path_style(path)
+        if self.retrieve_model(file_path) is not None:
+            return
+
+        loading_path = self.resolve_casing(self.resolve(file_path))
+        if loading_path.is_file():
+            self._prefetcher.submit(loading_path, model_type)
+
+    def retrieve_prefetched(
+        self, loading_path: Path, model_type: Type["ParsableFileModel"]
+    ) -> Optional[Dict[str, Any]]:
+        """Retrieve the data parsed ahead of time for the provided loading path.
+
+        Args:
+            loading_path (Path): The absolute path of the file.
+            model_type (Type[ParsableFileModel]): The model type used to parse the file.
+
+        Returns:
+            Optional[Dict[str, Any]]: The parsed data, or None if it is not available.
+        """
+        if self._prefetcher is None:
+            return None
+        return self._prefetcher.retrieve(loading_path, model_type)
+
+    def parse(
+        self,
+        loading_path: Path,
+        model_type: Type["ParsableFileModel"],
+        parse: Callable[[Path], Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Parse the file at the loading path for the model type.
+
+        Data that has been parsed ahead of time is used when available. Otherwise the
+        file is parsed with the provided parse function, using the persistent parse
+        cache when it is configured.
+
+        Args:
+            loading_path (Path): The absolute path of the file.
+            model_type (Type[ParsableFileModel]): The model type used to parse the file.
+            parse (Callable[[Path], Dict[str, Any]]): The function that parses the file.
+
+        Returns:
+            Dict[str, Any]: The parsed data.
+        """
+        data = self.retrieve_prefetched(loading_path, model_type)
+        if data is not None:
+            return data
+
+        parse_cache = (
+            self._load_settings.parse_cache if self._load_settings is not None else None
+        )
+        return parse_file(loading_path, model_type, parse, parse_cache)
+
+    def create_lazy_load_context(self) -> "FileLoadContext":
+        """Create the FileLoadContext in which a lazily loaded child model is loaded later on.
+
+        The new context starts from the current parents of this context and shares its
+        load settings and file model cache, such that the child model is resolved and
+        loaded as if it was loaded as part of this context.
+
+        Returns:
+            FileLoadContext: The context for loading the child model.
+        """
+        context = FileLoadContext()
+        context._path_resolver = self._path_resolver.copy()
+        context._cache = self._cache
+        context._load_settings = self._load_settings
+        return context
+
+    def close(self) -> None:
+        """Release the resources held by this FileLoadContext, such as the parallel worker pool."""
+        if self._prefetcher is not None:
+            self._prefetcher.shutdown()
+            self._prefetcher = None
+
 
 @contextmanager
-def file_load_context() -> Generator[FileLoadContext, None, None]:
+def file_load_context(
+    context: Optional[FileLoadContext] = None,
+) -> Generator[FileLoadContext, None, None]:
     """file_load_context.
 
     Provide a FileLoadingContext. If none has been created in the context of
     this call stack yet, a new one will be created, which will be maintained
     until it goes out of scope.
 
+    Args:
+        context (Optional[FileLoadContext], optional):
+            A context to provide instead, until it goes out of scope. Defaults to None.
+
     Yields:
         [FileLoadContext]: The file load context.
     """
-    file_loading_context = context_file_loading.get(None)
+    file_loading_context = context or context_file_loading.get(None)
     context_reset_token = None
 
-    if not file_loading_context:
+    if context is not None:
+        context_reset_token = context_file_loading.set(context)
+    elif not file_loading_context:
         file_loading_context = FileLoadContext()
         context_reset_token = context_file_loading.set(file_loading_context)
 
@@ -776,6 +1186,7 @@ def file_load_context() -> Generator[FileLoadContext, None, None]:
     finally:
         if context_reset_token is not None:
             context_file_loading.reset(context_reset_token)
+            file_loading_context.close()
 
 
 path_style_validator = PathStyleValidator()
@@ -7,27 +7,49 @@ also represents a file on disk.
 
 import logging
 import shutil
+import types
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, Generic, List, Optional, Set, TypeVar
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
 from weakref import WeakValueDictionary
 
 from pydantic import BaseModel as PydanticBaseModel
 from pydantic import (
     ConfigDict,
     PrivateAttr,
+    SerializerFunctionWrapHandler,
     ValidationError,
     ValidationInfo,
     field_validator,
+    model_serializer,
 )
 
 from hydrolib.core.base.file_manager import (
     FileLoadContext,
+    ParallelLoadMode,
     PathOrStr,
     ResolveRelativeMode,
     file_load_context,
     path_style_validator,
 )
+from hydrolib.core.base.parse_cache import PersistentParseCache
 from hydrolib.core.base.parser import DummmyParser
 from hydrolib.core.base.serializer import DummySerializer
 from hydrolib.core.base.utils import (
@@ -58,6 +80,105 @@ def set_default_disk_only_file_model(v: Any):
     return v
 
 
+def _get_annotated_types(annotation: Any) -> Tuple[List[type], bool]:
+    """Get the classes contained in a (possibly nested) Optional, Union, Annotated or List annotation.
+
+    Returns:
+        Tuple[List[type], bool]: The classes in order of appearance, and whether a list is involved.
+    """
+    stack = [annotation]
+    result = []
+    is_list = False
+    while stack:
+        current = stack.pop()
+        origin = get_origin(current)
+        if origin is Annotated:
+            stack.append(get_args(current)[0])
+        elif origin in (Union, types.UnionType, list):
+            is_list = is_list or origin is list
+            stack.extend(reversed(get_args(current)))
+        elif isinstance(current, type):
+            result.append(current)
+    return result, is_list
+
+
+@lru_cache(maxsize=None)
+def _get_file_reference_fields(
+    model_type: type,
+) -> Dict[str, Tuple[str, bool, List[type], List[type]]]:
+    """Get the fields of a model type which (indirectly) refer to parsable child files.
+
+    Returns:
+        Dict[str, Tuple[str, bool, List[type], List[type]]]:
+            The field name, whether it is a list, the parsable file model types and
+            the nested model types, keyed by both the field name and its (converted) alias.
+    """
+    fields = {}
+    for name, field in model_type.model_fields.items():
+        annotated_types, is_list = _get_annotated_types(field.annotation)
+        file_model_types = [
+            t
+            for t in annotated_types
+            if issubclass(t, ParsableFileModel) and t._get_parser() is not None
+        ]
+        nested_model_types = [
+            t
+            for t in annotated_types
+            if issubclass(t, BaseModel) and not issubclass(t, FileModel)
+        ]
+        if not file_model_types and not nested_model_types:
+            continue
+
+        field_reference = (name, is_list, file_model_types, nested_model_types)
+        fields[name] = field_reference
+        if field.alias is not None:
+            fields[to_key(field.alias)] = field_reference
+    return fields
+
+
+def _collect_child_file_references(
+    model_type: type, data: Any
+) -> Iterator[Tuple[Type["ParsableFileModel"], Path]]:
+    """Collect the child file references from the parsed, unvalidated data of a model.
+
+    The data is traversed guided by the field annotations of the model type. Every
+    string or path value of a field annotated with a ParsableFileModel is yielded
+    together with the first such model type, which is the type pydantic will try first.
+
+    Args:
+        model_type (type): The model type the data belongs to.
+        data (Any): The parsed data of the model.
+
+    Yields:
+        Tuple[Type[ParsableFileModel], Path]: The file model type and the referenced path.
+    """
+    if not isinstance(data, dict):
+        return
+
+    fields = _get_file_reference_fields(model_type)
+    for key, value in data.items():
+        if key not in fields or value is None:
+            continue
+
+        name, is_list, file_model_types, nested_model_types = fields[key]
+        values = value if isinstance(value, list) else [value]
+        if file_model_types:
+            for v in values:
+                if isinstance(v, Path):
+                    yield file_model_types[0], v
+                elif isinstance(v, str):
+                    items = [v]
+                    if is_list and hasattr(model_type, "get_list_field_delimiter"):
+                        items = v.split(model_type.get_list_field_delimiter(name))
+                    for item in (item.strip() for item in items):
+                        if item:
+                            yield file_model_types[0], Path(item)
+
+        for nested_model_type in nested_model_types:
+            for v in values:
+                yield from _collect_child_file_references(nested_model_type, v)
+
+
 class BaseModel(PydanticBaseModel):
     """Base Pydantic model with shared configuration for all HYDROLIB-core models."""
 
@@ -259,13 +380,17 @@ class ModelSaveSettings:
     _os_path_style = get_path_style_for_current_operating_system()
 
     def __init__(
-        self, path_style: Optional[PathStyle] = None, exclude_unset: bool = False
+        self,
+        path_style: Optional[PathStyle] = None,
+        exclude_unset: bool = False,
+        incremental: bool = False,
     ) -> None:
         """Initializes a new instance of the ModelSaveSettings class.
 
         Args:
             path_style (Optional[PathStyle], optional): Which file path style to use when saving the model. Defaults to the path style that matches the current operating system.
             exclude_unset (bool, optional): Whether or not to exclude unset values when saving the model. Defaults to False.
+            incremental (bool, optional): Whether or not models that support it only rewrite their modified data in the existing file. Defaults to False.
         """
         if path_style is None:
             path_style = self._os_path_style
@@ -273,6 +398,7 @@ class ModelSaveSettings:
         self._path_style = path_style
 
         self._exclude_unset = exclude_unset
+        self._incremental = incremental
 
     @property
     def path_style(self) -> PathStyle:
@@ -283,6 +409,15 @@ class ModelSaveSettings:
         """
         return self._path_style
 
+    @property
+    def incremental(self) -> bool:
+        """Gets the incremental setting.
+
+        Returns:
+            bool: Whether or not models that support it only rewrite their modified data.
+        """
+        return self._incremental
+
 
 class FileModel(BaseModel, ABC):
     """Base class to represent models with a file representation.
@@ -319,6 +454,11 @@ class FileModel(BaseModel, ABC):
     filepath: Optional[Path] = None
     # Absolute anchor is used to resolve the save location when the filepath is relative.
     _absolute_anchor_path: Path = PrivateAttr(default_factory=Path.cwd)
+    # The original filepath, the loading path and the context of a lazily loaded model
+    # which has not been loaded yet.
+    _lazy_load_state: Optional[Tuple[Path, Path, FileLoadContext]] = PrivateAttr(
+        default=None
+    )
 
     def __new__(
         cls, filepath: Optional[PathOrStr] = None, *args, **kwargs
@@ -349,6 +489,10 @@ class FileModel(BaseModel, ABC):
         resolve_casing: bool = False,
         recurse: bool = True,
         path_style: Optional[str] = None,
+        parallel_mode: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        parse_cache: Optional[PersistentParseCache] = None,
+        lazy: bool = False,
         *args,
         **kwargs,
     ):
@@ -367,9 +511,24 @@ class FileModel(BaseModel, ABC):
                 Whether or not to recursively load the model. Defaults to True.
             path_style (Optional[str], optional):
                 Which path style is used in the loaded files. Defaults to the path style that matches the current operating system. Options: 'unix', 'windows'.
+            parallel_mode (Optional[str], optional):
+                How child files are parsed when recursively loading the model. With 'threads'
+                or 'processes' the child files are parsed ahead of time on a worker pool,
+                while the model tree itself is still built in order. Defaults to 'none'.
+                Options: 'none', 'threads', 'processes'.
+            max_workers (Optional[int], optional):
+                The maximum number of parallel workers. Defaults to the executor default.
+            parse_cache (Optional[PersistentParseCache], optional):
+                A persistent on-disk cache for the parsed data of the loaded files. Unchanged
+                files are then not parsed again in subsequent loads. Defaults to None.
+            lazy (bool, optional):
+                Whether or not to load the child models only on first access. When True,
+                the child models only keep their resolved file path, and the file is
+                parsed and validated the first time one of their fields is accessed.
+                Only applies when recurse is True. Defaults to False.
 
         Raises:
-            ValueError: When an unsupported path style is passed.
+            ValueError: When an unsupported path style or parallel mode is passed.
         """
         if self._has_been_loaded_from_cache:
             return
@@ -380,9 +539,18 @@ class FileModel(BaseModel, ABC):
 
         filepath = FileModel._change_to_path(filepath)
         path_style = path_style_validator.validate(path_style)
+        parallel_mode = ParallelLoadMode(parallel_mode or ParallelLoadMode.NONE)
 
         with file_load_context() as context:
-            context.initialize_load_settings(recurse, resolve_casing, path_style)
+            context.initialize_load_settings(
+                recurse,
+                resolve_casing,
+                path_style,
+                parallel_mode,
+                max_workers,
+                parse_cache,
+                lazy,
+            )
 
             filepath = context.convert_path_style(filepath)
 
@@ -397,30 +565,160 @@ class FileModel(BaseModel, ABC):
             if context.load_settings.resolve_casing:
                 filepath = self._get_updated_file_path(filepath, loading_path)
 
-            logger.info(f"Loading data from {filepath}")
+            if self._should_load_lazily(context, loading_path):
+                self._initialize_lazy_load(context, filepath, loading_path)
+                return
+
+            self._load_from_file(context, filepath, loading_path, *args, **kwargs)
 
-            data = self._load(loading_path)
-            context.register_model(filepath, self)
-            data["filepath"] = filepath
-            kwargs.update(data)
+    def _load_from_file(
+        self,
+        context: FileLoadContext,
+        filepath: Path,
+        loading_path: Path,
+        *args,
+        **kwargs,
+    ) -> None:
+        logger.info(f"Loading data from {filepath}")
 
-            # Note: the relative mode needs to be obtained from the data directly
-            # because self._relative_mode has not been resolved yet (this is done as
-            # part of the __init__), however during the __init__ we need to already
-            # have pushed the new parent. As such we cannot move this call later.
-            relative_mode = self._get_relative_mode_from_data(data)
-            context.push_new_parent(filepath.parent, relative_mode)
+        data = self._load(loading_path)
+        context.register_model(filepath, self)
+        data["filepath"] = filepath
+        kwargs.update(data)
 
-            try:
-                super().__init__(*args, **kwargs)
-            except Exception:
-                context.unregister_model(filepath)
-                context.pop_last_parent()
-                raise
+        # Note: the relative mode needs to be obtained from the data directly
+        # because self._relative_mode has not been resolved yet (this is done as
+        # part of the __init__), however during the __init__ we need to already
+        # have pushed the new parent. As such we cannot move this call later.
+        relative_mode = self._get_relative_mode_from_data(data)
+        context.push_new_parent(filepath.parent, relative_mode)
 
-            self._post_init_load()
+        for model_type, child_path in _collect_child_file_references(type(self), data):
+            context.prefetch(child_path, model_type)
 
+        try:
+            super().__init__(*args, **kwargs)
+        except Exception:
+            context.unregister_model(filepath)
             context.pop_last_parent()
+            raise
+
+        self._post_init_load()
+
+        context.pop_last_parent()
+
+    @classmethod
+    def _should_load_lazily(cls, context: FileLoadContext, loading_path: Path) -> bool:
+        """Determine whether the file model should only be loaded on first access.
+
+        Only child models are loaded lazily, i.e. when a file model has been loaded
+        already, and only when the file model type supports it for the loading path.
+
+        Returns:
+            bool: Whether or not the file model should be loaded lazily.
+        """
+        return (
+            context.load_settings.lazy
+            and not context.cache_is_empty()
+            and cls._can_load_lazily(loading_path)
+        )
+
+    @classmethod
+    def _can_load_lazily(cls, loading_path: Path) -> bool:
+        """Whether or not the file at the loading path can be loaded lazily as this model type.
+
+        Validation errors of lazily loaded models are only raised on first access. As
+        such, a model type should only be loaded lazily when the file is expected to
+        match it. By default, file models are not loaded lazily.
+
+        Args:
+            loading_path (Path): The absolute path of the file.
+
+        Returns:
+            bool: Whether or not the file can be loaded lazily.
+        """
+        return False
+
+    def _initialize_lazy_load(
+        self, context: FileLoadContext, filepath: Path, loading_path: Path
+    ) -> None:
+        """Initialize this model with only the filepath, to be loaded on first access.
+
+        The field values are left out of the model, such that accessing any of
+        them ends up in `__getattr__`, which loads the model.
+        """
+        constructed_model = self.model_construct(filepath=filepath)
+        object.__setattr__(self, "__dict__", {"filepath": filepath})
+        object.__setattr__(self, "__pydantic_fields_set__", {"filepath"})
+        object.__setattr__(self, "__pydantic_extra__", None)
+        object.__setattr__(
+            self, "__pydantic_private__", constructed_model.__pydantic_private__
+        )
+
+        self._absolute_anchor_path = context.get_current_parent()
+        self._lazy_load_state = (
+            filepath,
+            loading_path,
+            context.create_lazy_load_context(),
+        )
+        # The checksum is calculated once the model is actually loaded.
+        context.register_model(filepath, self, calculate_checksum=False)
+
+    def _ensure_loaded(self) -> None:
+        """Load this model if it has been lazily loaded and has not been loaded yet."""
+        lazy_load_state = self._lazy_load_state
+        if lazy_load_state is None:
+            return
+
+        filepath, loading_path, lazy_load_context = lazy_load_state
+        self._lazy_load_state = None
+        try:
+            with file_load_context(lazy_load_context) as context:
+                self._load_from_file(context, filepath, loading_path)
+        except Exception:
+            self._lazy_load_state = lazy_load_state
+            raise
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether or not the content of this model is loaded.
+
+        This is only False for lazily loaded models which have not been accessed yet.
+
+        Returns:
+            bool: Whether or not the content of this model is loaded.
+        """
+        return self._lazy_load_state is None
+
+    def __getattr__(self, item: str) -> Any:
+        """Load a lazily loaded model when one of its fields is accessed for the first time."""
+        if item in type(self).model_fields and self._lazy_load_state is not None:
+            self._ensure_loaded()
+            return getattr(self, item)
+        return super().__getattr__(item)  # type: ignore[misc]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Load a lazily loaded model before one of its fields is assigned."""
+        if name in type(self).model_fields:
+            self._ensure_loaded()
+        super().__setattr__(name, value)
+
+    def __iter__(self) -> Any:
+        """Load a lazily loaded model before iterating over its fields."""
+        self._ensure_loaded()
+        return super().__iter__()
+
+    def __eq__(self, other: Any) -> bool:
+        """Load lazily loaded models before comparing them."""
+        self._ensure_loaded()
+        if isinstance(other, FileModel):
+            other._ensure_loaded()
+        return super().__eq__(other)
+
+    @model_serializer(mode="wrap")
+    def _serialize_loaded(self, handler: SerializerFunctionWrapHandler) -> Any:
+        self._ensure_loaded()
+        return handler(self)
 
     @classmethod
     def _should_load_model(cls, context: FileLoadContext) -> bool:
@@ -515,6 +813,7 @@ class FileModel(BaseModel, ABC):
         recurse: bool = False,
         path_style: Optional[str] = None,
         exclude_unset: bool = False,
+        incremental: bool = False,
     ) -> None:
         """Save the model to disk.
 
@@ -551,6 +850,9 @@ class FileModel(BaseModel, ABC):
             exclude_unset (bool, optional):
                 Whether or not to exclude unset values when saving the model.
                 Defaults to False.
+            incremental (bool, optional):
+                Whether or not models that support it, such as the NetworkModel,
+                only rewrite their modified data in the existing file. Defaults to False.
 
         Raises:
             ValueError: When an unsupported path style is passed.
@@ -560,7 +862,7 @@ class FileModel(BaseModel, ABC):
 
         path_style = path_style_validator.validate(path_style)
         save_settings = ModelSaveSettings(
-            path_style=path_style, exclude_unset=exclude_unset
+            path_style=path_style, exclude_unset=exclude_unset, incremental=incremental
         )
 
         # Handle save
@@ -780,10 +1082,18 @@ class ParsableFileModel(FileModel):
 
     serializer_config: SerializerConfig = SerializerConfig()
 
+    @classmethod
+    def _can_load_lazily(cls, loading_path: Path) -> bool:
+        # Only load files lazily with the extension of this model, such that a file
+        # referenced in a field with multiple model types is not loaded lazily as the
+        # wrong model type.
+        return loading_path.is_file() and loading_path.suffix.lower() == cls._ext()
+
     def _load(self, filepath: Path) -> Dict:
         # Make this lazy in some cases so it doesn't become slow
         if filepath.is_file():
-            return self._parse(filepath)
+            with file_load_context() as context:
+                return context.parse(filepath, type(self), self._parse)
         else:
             raise ValueError(f"File: `{filepath}` not found, skipped parsing.")
 
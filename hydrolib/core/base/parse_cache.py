@@ -0,0 +1,276 @@
+"""Persistent on-disk cache for the parsed data of ParsableFileModel files."""
+
+import logging
+import os
+import pickle
+import threading
+from hashlib import sha256
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from hydrolib.core import __version__ as version
+from hydrolib.core.base.utils import FileChecksumCalculator, FileStat
+
+logger = logging.getLogger(__name__)
+
+
+class PersistentParseCache:
+    """PersistentParseCache stores the parsed data of files in a cache directory.
+
+    Each entry is keyed by the absolute path of the parsed file, the model type
+    used to parse it and the HYDROLIB-core version. Next to the parsed data, an
+    entry stores the checksum and the file stat of the parsed file. An entry is
+    only used when the file is unchanged: the file stat is compared first, and
+    the checksum is only calculated when the file stat differs.
+
+    The total size of the cache directory is bounded by `max_size`. The size is
+    determined once and then kept up to date while storing and removing entries.
+    When it exceeds `max_size`, the least recently used entries are removed until
+    the size is below a fraction `eviction_ratio` of `max_size`, such that the
+    directory is not scanned again for every stored entry.
+
+    Note that the entries are stored with `pickle`. Only use a cache directory
+    which is not writable by untrusted parties.
+
+    Examples:
+        ```python
+        >>> from hydrolib.core.base.parse_cache import PersistentParseCache
+        >>> from hydrolib.core.dflowfm.mdu.models import FMModel
+        >>> cache = PersistentParseCache("path/to/cache", max_size=2 * 1024**3)  # doctest: +SKIP
+        >>> model = FMModel("path/to/FlowFM.mdu", parse_cache=cache)  # doctest: +SKIP
+
+        ```
+    """
+
+    _entry_suffix = ".pickle"
+    _eviction_ratio = 0.9
+
+    def __init__(
+        self, directory: Union[Path, str], max_size: Optional[int] = 1024**3
+    ) -> None:
+        """Create a new PersistentParseCache.
+
+        Args:
+            directory (Union[Path, str]):
+                The cache directory. It is created when it does not exist yet.
+            max_size (Optional[int], optional):
+                The maximum total size of the cache entries in bytes. None for no limit.
+                Defaults to 1 GiB.
+        """
+        self._directory = Path(directory)
+        self._max_size = max_size
+        self._size: Optional[int] = None
+        self._size_lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Get the state to pickle, e.g. to use the cache in a process pool.
+
+        The lock cannot be pickled and is recreated when unpickling.
+        """
+        state = self.__dict__.copy()
+        del state["_size_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the pickled state, with a new lock."""
+        self.__dict__.update(state)
+        self._size_lock = threading.Lock()
+
+    @property
+    def directory(self) -> Path:
+        """The cache directory."""
+        return self._directory
+
+    @property
+    def max_size(self) -> Optional[int]:
+        """The maximum total size of the cache entries in bytes."""
+        return self._max_size
+
+    def retrieve(self, path: Path, model_type: type) -> Optional[Dict[str, Any]]:
+        """Retrieve the cached parsed data of the file at the (absolute) path.
+
+        Args:
+            path (Path): The absolute path of the parsed file.
+            model_type (type): The model type used to parse the file.
+
+        Returns:
+            Optional[Dict[str, Any]]:
+                The parsed data, or None if no valid entry exists for the current
+                content of the file.
+        """
+        entry_path = self._get_entry_path(path, model_type)
+        if not entry_path.is_file():
+            return None
+
+        try:
+            with open(entry_path, "rb") as entry_file:
+                entry = pickle.load(entry_file)
+        except Exception:
+            logger.warning(f"Removing unreadable parse cache entry {entry_path}")
+            self._remove_entry(entry_path)
+            return None
+
+        if not self._is_valid_for(entry, path):
+            return None
+
+        # Mark the entry as recently used for the eviction.
+        os.utime(entry_path)
+        return entry["data"]
+
+    def register(self, path: Path, model_type: type, data: Dict[str, Any]) -> None:
+        """Store the parsed data of the file at the (absolute) path.
+
+        Data that cannot be pickled is not cached.
+
+        Args:
+            path (Path): The absolute path of the parsed file.
+            model_type (type): The model type used to parse the file.
+            data (Dict[str, Any]): The parsed data.
+        """
+        self._store(path, model_type, data, self._get_fingerprint(path))
+
+    def invalidate(self, path: Path) -> None:
+        """Remove the cached data of the file at the (absolute) path for all model types.
+
+        Args:
+            path (Path): The absolute path of the parsed file.
+        """
+        for entry_path in self._get_entry_paths(f"{self._hash(str(path))}-*"):
+            self._remove_entry(entry_path)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        for entry_path in self._get_entry_paths():
+            entry_path.unlink(missing_ok=True)
+        with self._size_lock:
+            self._size = 0
+
+    def parse(
+        self, path: Path, model_type: type, parse: Callable[[Path], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Retrieve the parsed data of the file from the cache, or parse and cache it.
+
+        Args:
+            path (Path): The absolute path of the file to parse.
+            model_type (type): The model type used to parse the file.
+            parse (Callable[[Path], Dict[str, Any]]): The function that parses the file.
+
+        Returns:
+            Dict[str, Any]: The parsed data.
+        """
+        data = self.retrieve(path, model_type)
+        if data is None:
+            # The fingerprint is determined before parsing, such that a change
+            # during parsing invalidates the entry.
+            fingerprint = self._get_fingerprint(path)
+            data = parse(path)
+            self._store(path, model_type, data, fingerprint)
+        return data
+
+    def _store(
+        self,
+        path: Path,
+        model_type: type,
+        data: Dict[str, Any],
+        fingerprint: Tuple[Optional[FileStat], Optional[str]],
+    ) -> None:
+        stat, checksum = fingerprint
+        entry = {"stat": stat, "checksum": checksum, "data": data}
+        try:
+            content = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            logger.info(f"Parsed data of {path} cannot be cached.")
+            return
+
+        self._directory.mkdir(parents=True, exist_ok=True)
+        entry_path = self._get_entry_path(path, model_type)
+        temporary_path = entry_path.with_name(
+            f"{entry_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        previous_size = self._get_file_size(entry_path)
+        temporary_path.write_bytes(content)
+        os.replace(temporary_path, entry_path)
+
+        self._add_size(len(content) - previous_size)
+
+    @staticmethod
+    def _get_fingerprint(path: Path) -> Tuple[Optional[FileStat], Optional[str]]:
+        return FileStat.from_path(path), FileChecksumCalculator.calculate_checksum(path)
+
+    def _is_valid_for(self, entry: Dict[str, Any], path: Path) -> bool:
+        stat = FileStat.from_path(path)
+        if stat is None:
+            return False
+        if stat == entry.get("stat"):
+            return True
+        return FileChecksumCalculator.calculate_checksum(path) == entry.get("checksum")
+
+    def _get_entry_path(self, path: Path, model_type: type) -> Path:
+        model_key = f"{version}|{model_type.__module__}.{model_type.__qualname__}"
+        name = f"{self._hash(str(path))}-{self._hash(model_key)[:16]}"
+        return self._directory / f"{name}{self._entry_suffix}"
+
+    def _get_entry_paths(self, pattern: str = "*") -> List[Path]:
+        if not self._directory.is_dir():
+            return []
+        return list(self._directory.glob(f"{pattern}{self._entry_suffix}"))
+
+    @staticmethod
+    def _hash(value: str) -> str:
+        return sha256(value.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _get_file_size(path: Path) -> int:
+        try:
+            return path.stat().st_size
+        except OSError:
+            return 0
+
+    def _remove_entry(self, entry_path: Path) -> None:
+        size = self._get_file_size(entry_path)
+        entry_path.unlink(missing_ok=True)
+        with self._size_lock:
+            if self._size is not None:
+                self._size -= size
+
+    def _add_size(self, size: int) -> None:
+        if self._max_size is None:
+            return
+
+        with self._size_lock:
+            if self._size is None:
+                # The directory is only scanned for the first stored entry, which
+                # is then included in the scanned size.
+                self._size = sum(size for _, size, _ in self._scan_entries())
+            else:
+                self._size += size
+
+            if self._size > self._max_size:
+                self._size = self._evict()
+
+    def _scan_entries(self) -> List[Tuple[int, int, Path]]:
+        entries = []
+        for entry_path in self._get_entry_paths():
+            try:
+                stat = entry_path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry_path))
+        return entries
+
+    def _evict(self) -> int:
+        """Remove the least recently used entries and return the remaining size.
+
+        The directory is scanned again, such that entries stored or removed by
+        other processes are taken into account.
+        """
+        entries = self._scan_entries()
+        target_size = self._eviction_ratio * self._max_size
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry_path in sorted(entries, key=lambda entry: entry[0]):
+            if total_size <= target_size:
+                break
+            entry_path.unlink(missing_ok=True)
+            total_size -= size
+        return total_size
@@ -2,7 +2,7 @@
 
 import logging
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +39,68 @@ def open_file_with_fallback_encoding(filepath: Path) -> str:
     raise RuntimeError("All fallback encodings failed.")  # pragma: no cover
 
 
+def decode_with_fallback_encoding(content: bytes) -> str:
+    """Decode bytes trying UTF-8 first, then falling back to Latin-1.
+
+    Args:
+        content: The bytes to decode, e.g. a part of a file.
+
+    Returns:
+        The decoded string.
+
+    Raises:
+        RuntimeError: If the bytes cannot be decoded with any of the attempted
+            encodings (should not happen because Latin-1 accepts every byte).
+    """
+    for encoding in _FALLBACK_ENCODINGS:
+        try:
+            return content.decode(encoding)
+        except UnicodeDecodeError:
+            logger.debug(
+                f"Failed to decode content with {encoding}, trying next encoding."
+            )
+
+    raise RuntimeError("All fallback encodings failed.")  # pragma: no cover
+
+
+def iter_lines_with_fallback_encoding(filepath: Path) -> Iterator[str]:
+    """Read a file line by line trying UTF-8 first, then falling back to Latin-1.
+
+    Unlike `open_file_with_fallback_encoding`, the file is not read into memory
+    at once. The lines are decoded with UTF-8 until a line cannot be decoded,
+    after which that line and all following lines are decoded with Latin-1.
+
+    Args:
+        filepath: Path to the file to read.
+
+    Yields:
+        The lines of the file, including the line endings.
+
+    Raises:
+        RuntimeError: If a line cannot be decoded with any of the attempted
+            encodings (should not happen because Latin-1 accepts every byte).
+    """
+    encodings = iter(_FALLBACK_ENCODINGS)
+    encoding = next(encodings)
+
+    with open(filepath, "rb") as file:
+        for raw_line in file:
+            while True:
+                try:
+                    line = raw_line.decode(encoding)
+                    break
+                except UnicodeDecodeError:
+                    logger.debug(
+                        f"Failed to decode {filepath} with {encoding}, trying next encoding.",
+                    )
+                    encoding = next(encodings, None)
+                    if encoding is None:
+                        raise RuntimeError(
+                            "All fallback encodings failed."
+                        )  # pragma: no cover
+            yield line
+
+
 class BaseParser:
     """Base class providing shared parsing utilities for file parsers."""
 
@@ -2,6 +2,7 @@
 
 import platform
 import re
+from dataclasses import dataclass
 from enum import Enum, auto
 from hashlib import md5
 from operator import eq, ge, gt, le, lt, ne
@@ -477,9 +478,87 @@ class FilePathStyleConverter:
         return posix_path
 
 
+class FileChangeDetection(StrEnum):
+    """Strategy used to detect whether a cached file has changed on disk."""
+
+    CHECKSUM = "checksum"
+    """Always compare the checksum of the file content."""
+    STAT = "stat"
+    """Compare the size, modification time and inode first, and only compare the checksum when these differ."""
+
+
+class DatablockStorage(StrEnum):
+    """Storage used for the numeric datablocks of INI based models."""
+
+    LIST = "list"
+    """Store the datablock as a list of rows, each row being a list of floats."""
+    ARRAY = "array"
+    """Store the datablock as a 2-D float64 NumPy array."""
+
+
+class IniParserType(StrEnum):
+    """Parser used to read INI based models, such as .ini and .bc files."""
+
+    DEFAULT = "default"
+    """Parse with the Parser."""
+    FAST = "fast"
+    """Parse with the FastParser, which has a higher throughput for large files."""
+
+
+class XYZStorage(StrEnum):
+    """Storage used for the points of sample (xyz) files."""
+
+    LIST = "list"
+    """Store the points as a list of XYZPoint models."""
+    ARRAY = "array"
+    """Store the points in NumPy arrays, with XYZPoints."""
+
+
+@dataclass(frozen=True)
+class FileStat:
+    """The file system metadata used to cheaply detect that a file has not changed.
+
+    Note that a file that is rewritten with the same size within the timestamp
+    resolution of the file system cannot be distinguished by its FileStat.
+
+    Attributes:
+        size (int): The size of the file in bytes.
+        mtime_ns (int): The modification time of the file in nanoseconds.
+        inode (int): The inode (or file index on Windows) of the file.
+    """
+
+    size: int
+    mtime_ns: int
+    inode: int
+
+    @classmethod
+    def from_path(cls, filepath: Path) -> Optional["FileStat"]:
+        """Get the FileStat of the file at the given filepath.
+
+        Args:
+            filepath (Path): The filepath to the file.
+
+        Returns:
+            Optional[FileStat]:
+                The FileStat of the file.
+                When the filepath doesn't exist or the filepath isn't a file, None.
+        """
+        try:
+            stat = filepath.stat()
+        except OSError:
+            return None
+
+        if not filepath.is_file():
+            return None
+
+        return cls(size=stat.st_size, mtime_ns=stat.st_mtime_ns, inode=stat.st_ino)
+
+
 class FileChecksumCalculator:
     """FileChecksumCalculator calculator used to calculate the checksum of a file."""
 
+    _chunk_size: int = 1024 * 1024
+
     @staticmethod
     def calculate_checksum(filepath: Path) -> Optional[str]:
         """Calculate the checksum of the file from the given filepath.
@@ -517,7 +596,9 @@ class FileChecksumCalculator:
         """
         md5_hash = md5(usedforsecurity=False)
         with open(filepath, "rb") as file:
-            for chunk in iter(lambda: file.read(4096), b""):
+            for chunk in iter(
+                lambda: file.read(FileChecksumCalculator._chunk_size), b""
+            ):
                 md5_hash.update(chunk)
         return md5_hash.hexdigest()
 
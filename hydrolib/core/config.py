@@ -2,6 +2,13 @@
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from hydrolib.core.base.utils import (
+    DatablockStorage,
+    FileChangeDetection,
+    IniParserType,
+    XYZStorage,
+)
+
 
 class Settings(BaseSettings):
     """Configuration management, can be derived from ENV of .env file."""
@@ -13,6 +20,10 @@ class Settings(BaseSettings):
     )
 
     FM_EXECUTABLE: str = "fm.exe"
+    FILE_CHANGE_DETECTION: FileChangeDetection = FileChangeDetection.STAT
+    DATABLOCK_STORAGE: DatablockStorage = DatablockStorage.LIST
+    INI_PARSER: IniParserType = IniParserType.DEFAULT
+    XYZ_STORAGE: XYZStorage = XYZStorage.LIST
 
 
 settings = Settings()
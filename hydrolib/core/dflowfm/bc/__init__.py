@@ -1,5 +1,6 @@
 """Boundary conditions (.bc) file model and related classes."""
 
+from .index import ForcingIndex, ForcingIndexEntry
 from .models import (
     T3D,
     Astronomic,
@@ -36,4 +37,6 @@ __all__ = [
     "ForcingGeneral",
     "ForcingModel",
     "RealTime",
+    "ForcingIndex",
+    "ForcingIndexEntry",
 ]
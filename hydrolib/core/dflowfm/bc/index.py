@@ -0,0 +1,321 @@
+"""Sidecar index for random access to the forcing blocks of large .bc files."""
+
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from hydrolib.core.base.file_manager import PathOrStr
+from hydrolib.core.base.parser import decode_with_fallback_encoding
+from hydrolib.core.base.utils import FileChecksumCalculator, FileStat, to_key
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ForcingIndexEntry:
+    """The location of a single `[Forcing]` block within a .bc file.
+
+    Attributes:
+        name (Optional[str]): The name of the forcing block, None if it has no name.
+        quantities (Tuple[str, ...]):
+            The quantities of the forcing block, including the names of its vector quantities.
+        offset (int): The byte offset of the block header within the file.
+        length (int): The length of the block in bytes.
+    """
+
+    name: Optional[str]
+    quantities: Tuple[str, ...]
+    offset: int
+    length: int
+
+
+class ForcingIndex:
+    """ForcingIndex maps the forcing blocks of a .bc file to their location in the file.
+
+    The index maps the `name` and quantities of each `[Forcing]` block to its byte
+    offset and length, such that a single block can be read without parsing the
+    whole file. The index is stored in a sidecar file next to the .bc file,
+    together with the fingerprint (file stat and checksum) of the .bc file. When
+    the fingerprint of the .bc file changes, the index is rebuilt.
+
+    Examples:
+        ```python
+        >>> from hydrolib.core.dflowfm.bc.index import ForcingIndex
+        >>> index = ForcingIndex.load("path/to/boundaryconditions.bc")  # doctest: +SKIP
+        >>> index.find("boundary_node_1", "waterlevelbnd")  # doctest: +SKIP
+        [ForcingIndexEntry(name='boundary_node_1', quantities=('time', 'waterlevelbnd'), offset=83, length=12410)]
+
+        ```
+    """
+
+    _format_version = 1
+    _sidecar_suffix = ".idx"
+
+    def __init__(
+        self,
+        filepath: Path,
+        entries: List[ForcingIndexEntry],
+        stat: Optional[FileStat],
+        checksum: Optional[str],
+    ) -> None:
+        """Create a new ForcingIndex.
+
+        Use `ForcingIndex.build` or `ForcingIndex.load` to create the index of a file.
+
+        Args:
+            filepath (Path): The absolute path of the indexed .bc file.
+            entries (List[ForcingIndexEntry]): The forcing blocks in the order of the file.
+            stat (Optional[FileStat]): The file stat of the indexed file.
+            checksum (Optional[str]): The checksum of the indexed file.
+        """
+        self._filepath = filepath
+        self._stat = stat
+        self._checksum = checksum
+        self._set_entries(entries)
+
+    @property
+    def filepath(self) -> Path:
+        """The absolute path of the indexed .bc file."""
+        return self._filepath
+
+    @property
+    def sidecar_path(self) -> Path:
+        """The path of the sidecar file in which the index is stored."""
+        return self.get_sidecar_path(self._filepath)
+
+    @property
+    def entries(self) -> List[ForcingIndexEntry]:
+        """The forcing blocks in the order of the file."""
+        return list(self._entries)
+
+    @classmethod
+    def get_sidecar_path(cls, filepath: PathOrStr) -> Path:
+        """Get the path of the sidecar file of the index of the .bc file.
+
+        Args:
+            filepath (PathOrStr): The path of the .bc file.
+
+        Returns:
+            Path: The path of the sidecar file, i.e. the .bc file path with an additional ".idx" suffix.
+        """
+        filepath = Path(filepath)
+        return filepath.with_name(f"{filepath.name}{cls._sidecar_suffix}")
+
+    @classmethod
+    def build(cls, filepath: PathOrStr) -> "ForcingIndex":
+        """Build the index of the .bc file, without storing it.
+
+        Args:
+            filepath (PathOrStr): The path of the .bc file.
+
+        Returns:
+            ForcingIndex: The index of the file.
+        """
+        filepath = Path(filepath).resolve()
+        # The fingerprint is determined before indexing, such that a change
+        # during indexing results in a rebuild.
+        stat = FileStat.from_path(filepath)
+        checksum = FileChecksumCalculator.calculate_checksum(filepath)
+        return cls(filepath, _scan_forcings(filepath), stat, checksum)
+
+    @classmethod
+    def load(cls, filepath: PathOrStr) -> "ForcingIndex":
+        """Load the index of the .bc file from its sidecar file.
+
+        When the sidecar file does not exist, cannot be read or belongs to a
+        different version of the .bc file, the index is built and the sidecar
+        file is (re)written.
+
+        Args:
+            filepath (PathOrStr): The path of the .bc file.
+
+        Returns:
+            ForcingIndex: The up-to-date index of the file.
+        """
+        filepath = Path(filepath).resolve()
+        index = cls._read_sidecar(filepath)
+        if index is None:
+            index = cls.build(filepath)
+            index.save()
+        else:
+            index.refresh()
+        return index
+
+    def save(self) -> None:
+        """Store this index in its sidecar file.
+
+        When the sidecar file cannot be written, e.g. because the directory is
+        read-only, the index is only kept in memory.
+        """
+        content = {
+            "version": self._format_version,
+            "stat": asdict(self._stat) if self._stat is not None else None,
+            "checksum": self._checksum,
+            "entries": [
+                [entry.name, list(entry.quantities), entry.offset, entry.length]
+                for entry in self._entries
+            ],
+        }
+
+        sidecar_path = self.sidecar_path
+        temporary_path = sidecar_path.with_name(
+            f"{sidecar_path.name}.{os.getpid()}.tmp"
+        )
+        try:
+            temporary_path.write_text(json.dumps(content), encoding="utf-8")
+            os.replace(temporary_path, sidecar_path)
+        except OSError:
+            logger.info(
+                f"Index of {self._filepath} cannot be stored in {sidecar_path}."
+            )
+            temporary_path.unlink(missing_ok=True)
+
+    def is_up_to_date(self) -> bool:
+        """Whether the .bc file is unchanged since this index was built.
+
+        The file stat is compared first, and the checksum is only calculated when
+        the file stat differs.
+
+        Returns:
+            bool: True if the index is up to date, otherwise False.
+        """
+        stat = FileStat.from_path(self._filepath)
+        if stat is None:
+            return False
+        if stat == self._stat:
+            return True
+        return (
+            FileChecksumCalculator.calculate_checksum(self._filepath) == self._checksum
+        )
+
+    def refresh(self) -> None:
+        """Rebuild this index and its sidecar file when the .bc file has changed."""
+        stat = FileStat.from_path(self._filepath)
+        if stat is not None and stat == self._stat:
+            return
+
+        if self.is_up_to_date():
+            # The file was touched, but its content is unchanged.
+            self._stat = stat
+        else:
+            index = self.build(self._filepath)
+            self._stat = index._stat
+            self._checksum = index._checksum
+            self._set_entries(index._entries)
+        self.save()
+
+    def find(
+        self, name: str, quantity: Optional[str] = None
+    ) -> List[ForcingIndexEntry]:
+        """Find the forcing blocks with the name, and optionally the quantity.
+
+        Args:
+            name (str): The name of the forcing blocks.
+            quantity (Optional[str], optional):
+                A quantity the forcing blocks should contain. Defaults to None, i.e. all quantities.
+
+        Returns:
+            List[ForcingIndexEntry]: The matching forcing blocks in the order of the file.
+        """
+        entries = self._entries_by_name.get(name, [])
+        if quantity is None:
+            return list(entries)
+        return [entry for entry in entries if quantity in entry.quantities]
+
+    def read(self, entry: ForcingIndexEntry) -> str:
+        """Read the content of the forcing block from the .bc file.
+
+        Args:
+            entry (ForcingIndexEntry): The forcing block to read.
+
+        Returns:
+            str: The content of the forcing block, starting with its header.
+        """
+        with open(self._filepath, "rb") as file:
+            file.seek(entry.offset)
+            return decode_with_fallback_encoding(file.read(entry.length))
+
+    def _set_entries(self, entries: List[ForcingIndexEntry]) -> None:
+        self._entries = entries
+        self._entries_by_name: Dict[Optional[str], List[ForcingIndexEntry]] = {}
+        for entry in entries:
+            self._entries_by_name.setdefault(entry.name, []).append(entry)
+
+    @classmethod
+    def _read_sidecar(cls, filepath: Path) -> Optional["ForcingIndex"]:
+        sidecar_path = cls.get_sidecar_path(filepath)
+        if not sidecar_path.is_file():
+            return None
+
+        try:
+            content: Dict[str, Any] = json.loads(
+                sidecar_path.read_text(encoding="utf-8")
+            )
+            if content["version"] != cls._format_version:
+                return None
+
+            stat = FileStat(**content["stat"]) if content["stat"] is not None else None
+            entries = [
+                ForcingIndexEntry(name, tuple(quantities), offset, length)
+                for name, quantities, offset, length in content["entries"]
+            ]
+            return cls(filepath, entries, stat, content["checksum"])
+        except Exception:
+            logger.warning(f"Ignoring unreadable forcing index {sidecar_path}")
+            return None
+
+
+def _scan_forcings(filepath: Path) -> List[ForcingIndexEntry]:
+    # Scans the file in the same way as the FastParser configured for .bc files:
+    # properties are only recognized before the first datablock row of a block,
+    # and comments are not recognized within property values.
+    entries: List[ForcingIndexEntry] = []
+
+    offset = 0
+    block: Optional[Dict[str, Any]] = None
+    parsing_properties = False
+
+    def finish_block(end: int) -> None:
+        if block is not None:
+            entries.append(
+                ForcingIndexEntry(
+                    name=block["name"],
+                    quantities=tuple(block["quantities"]),
+                    offset=block["offset"],
+                    length=end - block["offset"],
+                )
+            )
+
+    with open(filepath, "rb") as file:
+        for line in file:
+            stripped = line.strip()
+            if stripped.startswith(b"[") and stripped.endswith(b"]"):
+                finish_block(offset)
+                header = decode_with_fallback_encoding(stripped[1:-1]).strip()
+                if to_key(header) == "forcing":
+                    block = {"name": None, "quantities": [], "offset": offset}
+                else:
+                    block = None
+                parsing_properties = True
+            elif block is not None and parsing_properties and stripped:
+                if b"=" in stripped:
+                    key, value = decode_with_fallback_encoding(stripped).split("=", 1)
+                    key = to_key(key.strip())
+                    value = value.strip()
+                    if key == "name" and value:
+                        block["name"] = value
+                    elif key == "quantity" and value:
+                        block["quantities"].append(value)
+                    elif key == "vector" and value:
+                        # The vector definition is formatted as "name:element1,element2".
+                        block["quantities"].append(value.split(":", 1)[0].strip())
+                elif not stripped.startswith(b"#"):
+                    parsing_properties = False
+
+            offset += len(line)
+
+    finish_block(offset)
+    return entries
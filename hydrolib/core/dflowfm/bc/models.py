@@ -23,6 +23,7 @@ from typing import (
     Literal,
     Optional,
     Set,
+    Type,
     Union,
 )
 
@@ -32,6 +33,7 @@ from pydantic import (
     ConfigDict,
     Field,
     GetCoreSchemaHandler,
+    TypeAdapter,
     ValidationInfo,
     field_validator,
     model_validator,
@@ -40,17 +42,26 @@ from pydantic_core import core_schema
 from strenum import StrEnum
 
 from hydrolib.core.base import DiskOnlyFileModel
-from hydrolib.core.base.file_manager import file_load_context
+from hydrolib.core.base.file_manager import PathOrStr, file_load_context
 from hydrolib.core.base.models import BaseModel, ModelSaveSettings
-from hydrolib.core.base.utils import to_list
+from hydrolib.core.base.parser import (
+    iter_lines_with_fallback_encoding,
+    open_file_with_fallback_encoding,
+)
+from hydrolib.core.base.utils import to_key, to_list
+from hydrolib.core.dflowfm.bc.index import ForcingIndex
 from hydrolib.core.dflowfm.ini.io_models import Property, Section
 from hydrolib.core.dflowfm.ini.models import (
     DataBlockINIBasedModel,
     INIGeneral,
     INIModel,
 )
-from hydrolib.core.base.parser import open_file_with_fallback_encoding
-from hydrolib.core.dflowfm.ini.parser import Parser, ParserConfig
+from hydrolib.core.dflowfm.ini.parser import (
+    FastParser,
+    Parser,
+    ParserConfig,
+    get_parser_type,
+)
 from hydrolib.core.dflowfm.ini.serializer import DataBlockINIBasedSerializerConfig
 from hydrolib.core.dflowfm.ini.util import (
     enum_value_parser,
@@ -361,7 +372,7 @@ class ForcingBase(DataBlockINIBasedModel):
         Returns:
             ForcingBase: The validated model instance.
         """
-        if not self.datablock:
+        if len(self.datablock) == 0:
             return self
 
         expected_columns = sum(
@@ -992,6 +1003,11 @@ FORCINGS = Union[
     Constant,
 ]
 
+_forcing_type_adapter: TypeAdapter = TypeAdapter(
+    Annotated[FORCINGS, Field(discriminator="function")],
+    config=ConfigDict(title="ForcingBase"),
+)
+
 
 class ForcingModel(INIModel):
     """
@@ -1204,17 +1220,140 @@ class ForcingModel(INIModel):
         Returns:
             ForcingModel: The parsed model instance.
         """
-        # It's odd to have to disable parsing something as comments
-        # but also need to pass it to the *flattener*.
-        # This method now only supports per model settings, not per section.
-        parser = Parser(ParserConfig(parse_datablocks=True, parse_comments=False))
+        parser = cls._create_parser(get_parser_type())
 
         content = open_file_with_fallback_encoding(filepath)
-        for line in content.splitlines(keepends=True):
-            parser.feed_line(line)
+        parser.feed_lines(content.splitlines(keepends=True))
 
         return parser.finalize().flatten(True, False)
 
+    @classmethod
+    def iter_forcings(cls, filepath: PathOrStr) -> Iterator[ForcingBase]:
+        """
+        Stream the `[Forcing]` blocks of a .bc file one at a time.
+
+        The file is read line by line, and each forcing block is validated and
+        yielded as soon as it has been parsed. Only the current block is kept in
+        memory, which allows processing large .bc files in constant memory. The
+        `[General]` block is skipped.
+
+        Args:
+            filepath (PathOrStr): The path to the .bc file.
+
+        Yields:
+            ForcingBase:
+                The forcing blocks in the order of the file, as their specific
+                subclass, e.g. `TimeSeries` or `T3D`.
+
+        Raises:
+            ValueError: When the file contains a block other than `[General]` or `[Forcing]`.
+            ValidationError: When a forcing block is invalid.
+
+        Examples:
+            Select the forcing blocks of a single location:
+                ```python
+                >>> from hydrolib.core.dflowfm.bc.models import ForcingModel
+                >>> filepath = "tests/data/reference/bc/test.bc"
+                >>> forcings = [
+                ...     forcing
+                ...     for forcing in ForcingModel.iter_forcings(filepath)
+                ...     if forcing.name == "boundary_timeseries"
+                ... ]
+                >>> type(forcings[0]).__name__
+                'TimeSeries'
+
+                ```
+        """
+        parser = cls._create_parser()
+        lines = iter_lines_with_fallback_encoding(Path(filepath))
+
+        for section in parser.iter_sections(lines):
+            key = to_key(section.header)
+            if key == "general":
+                continue
+            if key != "forcing":
+                raise ValueError(
+                    f"Unknown block [{section.header}] in {filepath}, only [General] and [Forcing] blocks are supported."
+                )
+
+            yield cls._to_forcing(section)
+
+    @classmethod
+    def read_forcings(
+        cls,
+        filepath: PathOrStr,
+        name: str,
+        quantity: Optional[str] = None,
+        index: Optional[ForcingIndex] = None,
+    ) -> List[ForcingBase]:
+        """
+        Read the `[Forcing]` blocks with the given name from a .bc file.
+
+        Instead of parsing the whole file, the blocks are located with the
+        `ForcingIndex` of the file, and only the matching blocks are read and
+        parsed. The index is loaded from its sidecar file next to the .bc file,
+        and is built and stored when it does not exist yet or when the .bc file
+        has changed.
+
+        Args:
+            filepath (PathOrStr): The path to the .bc file.
+            name (str): The name of the forcing blocks.
+            quantity (Optional[str], optional):
+                A quantity the forcing blocks should contain. Defaults to None, i.e. all quantities.
+            index (Optional[ForcingIndex], optional):
+                A previously loaded index of the file, to avoid loading the sidecar
+                file for every lookup. It is refreshed when the file has changed.
+                Defaults to None.
+
+        Returns:
+            List[ForcingBase]: The matching forcing blocks in the order of the file.
+
+        Raises:
+            ValueError: When the index belongs to a different file.
+            ValidationError: When a matching forcing block is invalid.
+
+        Examples:
+            ```python
+            >>> from hydrolib.core.dflowfm.bc.index import ForcingIndex
+            >>> from hydrolib.core.dflowfm.bc.models import ForcingModel
+            >>> filepath = "path/to/boundaryconditions.bc"
+            >>> index = ForcingIndex.load(filepath)  # doctest: +SKIP
+            >>> forcings = ForcingModel.read_forcings(
+            ...     filepath, "boundary_node_1", "waterlevelbnd", index=index
+            ... )  # doctest: +SKIP
+
+            ```
+        """
+        if index is None:
+            index = ForcingIndex.load(filepath)
+        elif index.filepath != Path(filepath).resolve():
+            raise ValueError(
+                f"The index of {index.filepath} does not belong to {filepath}."
+            )
+        else:
+            index.refresh()
+
+        forcings = []
+        for entry in index.find(name, quantity):
+            lines = index.read(entry).splitlines(keepends=True)
+            for section in cls._create_parser().iter_sections(lines):
+                forcings.append(cls._to_forcing(section))
+        return forcings
+
+    @classmethod
+    def _to_forcing(cls, section: Section) -> ForcingBase:
+        forcing = section.flatten(True, False)
+        cls._validate_forcing_case_insensitive([forcing])
+        return _forcing_type_adapter.validate_python(forcing)
+
+    @staticmethod
+    def _create_parser(parser_type: Type[Parser] = FastParser) -> Parser:
+        # It's odd to have to disable parsing something as comments
+        # but also need to pass it to the *flattener*.
+        # This method now only supports per model settings, not per section.
+        # Streaming the sections is only supported by the FastParser.
+        return parser_type(ParserConfig(parse_datablocks=True, parse_comments=False))
+
 
 class RealTime(StrEnum):
     """Enum class containing the valid value for the "realtime" reserved keyword.
@@ -13,7 +13,7 @@ from hydrolib.core.dflowfm.ini.models import (
     INIGeneral,
     INIModel,
 )
-from hydrolib.core.dflowfm.ini.parser import Parser, ParserConfig
+from hydrolib.core.dflowfm.ini.parser import FastParser, Parser, ParserConfig
 from hydrolib.core.dflowfm.ini.serializer import (
     DataBlockINIBasedSerializerConfig,
     INISerializerConfig,
@@ -34,5 +34,6 @@ __all__ = [
     "DataBlockINIBasedSerializerConfig",
     # parser
     "Parser",
+    "FastParser",
     "ParserConfig",
 ]
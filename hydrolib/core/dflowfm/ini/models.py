@@ -10,6 +10,7 @@ from typing import (
     Annotated,
     Any,
     Callable,
+    Iterator,
     List,
     Literal,
     Optional,
@@ -20,12 +21,13 @@ from typing import (
     get_origin,
 )
 
+import numpy as np
 from pandas import DataFrame
 from pydantic import (
-    BeforeValidator,
     ConfigDict,
     Field,
     GetCoreSchemaHandler,
+    GetPydanticSchema,
     field_validator,
     model_validator,
 )
@@ -40,18 +42,22 @@ from hydrolib.core.base.models import (
     ModelSaveSettings,
     ParsableFileModel,
 )
-from hydrolib.core.base.utils import FortranScientificNotationConverter
+from hydrolib.core.base.utils import (
+    DatablockStorage,
+    FortranScientificNotationConverter,
+)
+from hydrolib.core.config import settings
 from hydrolib.core.dflowfm.ini.io_models import (
     CommentBlock,
     Document,
     Property,
     Section,
 )
-from hydrolib.core.dflowfm.ini.parser import Parser
+from hydrolib.core.dflowfm.ini.parser import get_parser_type
 from hydrolib.core.dflowfm.ini.serializer import (
     DataBlockINIBasedSerializerConfig,
     INISerializerConfig,
-    write_ini,
+    write_ini_sections,
 )
 from hydrolib.core.dflowfm.ini.util import UnknownKeywordErrorManager, make_list
 
@@ -452,8 +458,11 @@ class INIBasedModel(BaseModel, ABC):
         """
         props = []
         cls_fields = type(self).model_fields  # cache the class-level dict
+        exclude_fields = self._exclude_fields()
         for key, value in self:
-            if not self._should_be_serialized(key, value, save_settings):
+            if not self._should_be_serialized(
+                key, value, save_settings, exclude_fields
+            ):
                 continue
 
             field_key = key
@@ -469,7 +478,11 @@ class INIBasedModel(BaseModel, ABC):
         return Section(header=self._header, content=props)
 
     def _should_be_serialized(
-        self, key: str, value: Any, save_settings: ModelSaveSettings
+        self,
+        key: str,
+        value: Any,
+        save_settings: ModelSaveSettings,
+        exclude_fields: Optional[Set] = None,
     ) -> bool:
         """
         Determines if a field should be serialized.
@@ -478,11 +491,16 @@ class INIBasedModel(BaseModel, ABC):
             key (str): The field key.
             value (Any): The field value.
             save_settings (ModelSaveSettings): Settings for saving the model.
+            exclude_fields (Optional[Set], optional):
+                The fields to exclude from serialization, to avoid determining them
+                for every field. Defaults to None, i.e. `_exclude_fields()`.
 
         Returns:
             bool: True if the field should be serialized; otherwise, False.
         """
-        if key in self._exclude_fields():
+        if exclude_fields is None:
+            exclude_fields = self._exclude_fields()
+        if key in exclude_fields:
             return False
 
         if save_settings._exclude_unset and key not in self.model_fields_set:
@@ -561,6 +579,11 @@ class INIBasedModel(BaseModel, ABC):
 
 
 Datablock = List[List[Union[float, str]]]
+# INI based models do not allow arbitrary types, hence the explicit instance schema.
+DatablockArray = Annotated[
+    np.ndarray,
+    GetPydanticSchema(lambda _, __: core_schema.is_instance_schema(np.ndarray)),
+]
 
 
 class DataBlockINIBasedModel(INIBasedModel):
@@ -609,11 +632,13 @@ class DataBlockINIBasedModel(INIBasedModel):
     Notes:
         - The class includes a validator to ensure that no NaN values are present in the data block.
         - Data blocks are converted to a serialized format for writing to INI files.
+        - Numeric data blocks are converted to floats in a single bulk conversion. With the
+          `DATABLOCK_STORAGE` setting set to "array", they are stored as a 2-D float64 NumPy
+          array instead of a list of rows. Data blocks with non-numeric values, such as
+          astronomic component names, are always stored as a list of rows.
     """
 
-    datablock: Annotated[Datablock, BeforeValidator(make_list)] = Field(
-        default_factory=list
-    )
+    datablock: Union[DatablockArray, Datablock] = Field(default_factory=list)
 
     @staticmethod
     def _is_float(value: str) -> bool:
@@ -632,21 +657,54 @@ class DataBlockINIBasedModel(INIBasedModel):
         except ValueError:
             return False
 
+    @staticmethod
+    def _as_float_array(datablock: Any) -> Optional[np.ndarray]:
+        """
+        Converts the datablock into a 2-D float64 array in a single bulk conversion.
+
+        Args:
+            datablock (Any): The datablock to convert.
+
+        Returns:
+            Optional[np.ndarray]:
+                The converted datablock, or None if not all values are numeric or the
+                rows do not have the same length.
+        """
+        try:
+            array = np.asarray(datablock, dtype=np.float64)
+        except (TypeError, ValueError):
+            return None
+        return array if array.ndim == 2 else None
+
     @field_validator("datablock", mode="before")
     @classmethod
-    def _convert_to_float(cls, datablock: Datablock) -> Datablock:
+    def _convert_to_float(cls, datablock: Any) -> Union[np.ndarray, Datablock]:
         """
         Validates that all values in the datablock are either floats or strings.
 
+        Numeric datablocks are converted at once, and stored according to the
+        `DATABLOCK_STORAGE` setting. Other datablocks are converted value by value.
+
         Args:
-            datablock (Datablock): The datablock to validate.
+            datablock (Any): The datablock to validate.
 
         Returns:
-            Datablock: The validated datablock.
+            Union[np.ndarray, Datablock]: The validated datablock.
 
         Raises:
             ValueError: If any value in the datablock is not a float or string.
         """
+        array = cls._as_float_array(datablock)
+        # Datablocks with NaN values, which could also originate from None values,
+        # are converted value by value to report the same errors.
+        if array is not None and not np.isnan(array).any():
+            if settings.DATABLOCK_STORAGE == DatablockStorage.ARRAY:
+                return array
+            return array.tolist()
+
+        if isinstance(datablock, np.ndarray):
+            datablock = datablock.tolist()
+        datablock = make_list(datablock)
         for r, row in enumerate(datablock):
             for c, value in enumerate(row):
                 if isinstance(value, str) and cls._is_float(value):
@@ -701,8 +759,15 @@ class DataBlockINIBasedModel(INIBasedModel):
             Section: The INI Section containing serialized data and the data block.
         """
         section = super()._to_section(config, save_settings)
-        section.datablock = self._to_datablock(config)
-        return section
+
+        # The converted datablock only contains strings, as such it is assigned
+        # without validating it again.
+        return Section.model_construct(
+            _fields_set=section.model_fields_set | {"datablock"},
+            header=section.header,
+            content=section.content,
+            datablock=self._to_datablock(config),
+        )
 
     def _to_datablock(self, config: DataBlockINIBasedSerializerConfig) -> List[List]:
         """
@@ -714,15 +779,17 @@ class DataBlockINIBasedModel(INIBasedModel):
         Returns:
             List[List]: A serialized representation of the data block.
         """
-        converted_datablock = []
+        rows = self.datablock
+        if isinstance(rows, np.ndarray):
+            rows = rows.tolist()
 
-        for row in self.datablock:
-            converted_row = (
-                DataBlockINIBasedModel.convert_value(value, config) for value in row
-            )
-            converted_datablock.append(list(converted_row))
+        if not config.float_format_datablock:
+            # Without a float format, convert_value equals str for the floats,
+            # and the other values already are strings.
+            return [list(map(str, row)) for row in rows]
 
-        return converted_datablock
+        convert_value = DataBlockINIBasedModel.convert_value
+        return [[convert_value(value, config) for value in row] for row in rows]
 
     @classmethod
     def convert_value(
@@ -745,23 +812,92 @@ class DataBlockINIBasedModel(INIBasedModel):
 
     @field_validator("datablock", mode="after")
     @classmethod
-    def _validate_no_nans_are_present(cls, datablock: Datablock) -> Datablock:
+    def _validate_no_nans_are_present(
+        cls, datablock: Union[np.ndarray, Datablock]
+    ) -> Union[np.ndarray, Datablock]:
         """Validate that the datablock does not have any NaN values.
 
         Args:
-            datablock (Datablock): The datablock to validate.
+            datablock (Union[np.ndarray, Datablock]): The datablock to validate.
 
         Raises:
             ValueError: When a NaN is present in the datablock.
 
         Returns:
-            Datablock: The validated datablock.
+            Union[np.ndarray, Datablock]: The validated datablock.
         """
-        if any(cls._is_float_and_nan(value) for row in datablock for value in row):
+        array = (
+            datablock
+            if isinstance(datablock, np.ndarray)
+            else cls._as_float_array(datablock)
+        )
+        if array is not None:
+            has_nans = bool(np.isnan(array).any())
+        else:
+            has_nans = any(
+                cls._is_float_and_nan(value) for row in datablock for value in row
+            )
+
+        if has_nans:
             raise ValueError("NaN is not supported in datablocks.")
 
         return datablock
 
+    def as_array(self) -> np.ndarray:
+        """Get the datablock as a 2-D float64 NumPy array.
+
+        Returns:
+            np.ndarray: The datablock as a 2-D float64 NumPy array.
+
+        Raises:
+            ValueError: When the datablock contains non-numeric values.
+
+        Examples:
+            ```python
+            >>> from hydrolib.core.dflowfm.ini.models import DataBlockINIBasedModel
+            >>> model = DataBlockINIBasedModel(datablock=[[0, 10], [1, 20]])
+            >>> model.as_array()
+            array([[ 0., 10.],
+                   [ 1., 20.]])
+
+            ```
+        """
+        if isinstance(self.datablock, np.ndarray):
+            return self.datablock
+        if not self.datablock:
+            return np.empty((0, 0), dtype=np.float64)
+
+        array = self._as_float_array(self.datablock)
+        if array is None:
+            raise ValueError("The datablock contains non-numeric values.")
+        return array
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare this model with another, where datablock arrays are compared by value."""
+        if not isinstance(other, DataBlockINIBasedModel) or not (
+            isinstance(self.datablock, np.ndarray)
+            or isinstance(other.datablock, np.ndarray)
+        ):
+            return super().__eq__(other)
+
+        if not self._datablocks_are_equal(self.datablock, other.datablock):
+            return False
+        return self.model_copy(update={"datablock": []}) == other.model_copy(
+            update={"datablock": []}
+        )
+
+    @classmethod
+    def _datablocks_are_equal(
+        cls,
+        datablock: Union[np.ndarray, Datablock],
+        other_datablock: Union[np.ndarray, Datablock],
+    ) -> bool:
+        array = cls._as_float_array(datablock)
+        other_array = cls._as_float_array(other_datablock)
+        if array is None or other_array is None:
+            return False
+        return np.array_equal(array, other_array)
+
     @staticmethod
     def _is_float_and_nan(value: float) -> bool:
         """
@@ -815,11 +951,19 @@ class INIModel(ParsableFileModel):
 
     @classmethod
     def _get_parser(cls) -> Callable:
-        return Parser.parse_as_dict
+        return get_parser_type().parse_as_dict
 
     def _to_document(self, save_settings: ModelSaveSettings) -> Document:
-        header = CommentBlock(lines=[f"written by HYDROLIB-core {version}"])
-        sections = []
+        return Document(
+            header_comment=self._header_comment(),
+            sections=list(self._iter_sections(save_settings)),
+        )
+
+    @staticmethod
+    def _header_comment() -> List[CommentBlock]:
+        return [CommentBlock(lines=[f"written by HYDROLIB-core {version}"])]
+
+    def _iter_sections(self, save_settings: ModelSaveSettings) -> Iterator[Section]:
         for key, value in self:
             if key in self._exclude_fields() or value is None:
                 continue
@@ -827,19 +971,20 @@ class INIModel(ParsableFileModel):
                 continue
             if isinstance(value, list):
                 for v in value:
-                    sections.append(
-                        v._to_section(self.serializer_config, save_settings)
-                    )
+                    yield v._to_section(self.serializer_config, save_settings)
             else:
-                sections.append(
-                    value._to_section(self.serializer_config, save_settings)
-                )
-        return Document(header_comment=[header], sections=sections)
+                yield value._to_section(self.serializer_config, save_settings)
+
+    def _save(self, save_settings: ModelSaveSettings) -> None:
+        # The sections are created directly from the model, as such the
+        # model_dump of the default _save is not needed.
+        self._serialize({}, save_settings)
 
     def _serialize(self, _: dict, save_settings: ModelSaveSettings) -> None:
-        """Create a `Document` from the model and write it to the file."""
-        write_ini(
+        """Stream the sections of the model to the file, without creating a `Document`."""
+        write_ini_sections(
             self._resolved_filepath,
-            self._to_document(save_settings),
+            self._header_comment(),
+            self._iter_sections(save_settings),
             config=self.serializer_config,
         )
@@ -2,12 +2,25 @@
 
 from enum import IntEnum
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 from pydantic import field_validator
 
 from hydrolib.core.base.models import BaseModel
 from hydrolib.core.base.parser import open_file_with_fallback_encoding
+from hydrolib.core.base.utils import IniParserType
+from hydrolib.core.config import settings
 from hydrolib.core.dflowfm.ini.io_models import (
     CommentBlock,
     Document,
@@ -187,6 +200,15 @@ class Parser:
 
         self._increment_line()
 
+    def feed_lines(self, lines: Iterable[str]) -> None:
+        """Parse the provided lines with this Parser.
+
+        Args:
+            lines (Iterable[str]): The lines to parse.
+        """
+        for line in lines:
+            self.feed_line(line)
+
     def finalize(self) -> Document:
         """Finalize parsing and return the constructed Document.
 
@@ -375,7 +397,236 @@ class Parser:
         parser = cls(config)
 
         content = open_file_with_fallback_encoding(filepath)
-        for line in content.splitlines(keepends=True):
-            parser.feed_line(line)
+        parser.feed_lines(content.splitlines(keepends=True))
 
         return parser.finalize()
+
+
+def _construct(model_type: Type[BaseModel], **values: Any) -> Any:
+    # Equivalent to model_type.model_construct(**values) for the io_models, which
+    # have neither private attributes nor extra fields, but without the overhead
+    # of handling the defaults and aliases.
+    model = model_type.__new__(model_type)
+    object.__setattr__(model, "__dict__", values)
+    object.__setattr__(model, "__pydantic_fields_set__", set(values))
+    object.__setattr__(model, "__pydantic_extra__", None)
+    object.__setattr__(model, "__pydantic_private__", None)
+    return model
+
+
+class _FastSection:
+    # _FastSection collects the content of a section within the FastParser.
+    # Properties are stored as (key, value, comment) tuples and comment blocks
+    # as lists of comment lines.
+    __slots__ = ("header", "content", "datablock", "comment_lines")
+
+    def __init__(self, header: str) -> None:
+        self.header = header
+        self.content: List[
+            Union[Tuple[str, Optional[str], Optional[str]], List[str]]
+        ] = []
+        self.datablock: List[List[str]] = []
+        self.comment_lines: Optional[List[str]] = None
+
+    def finalize(self) -> Section:
+        if self.comment_lines is not None:
+            self.content.append(self.comment_lines)
+
+        content = [
+            (
+                _construct(
+                    Property, key=element[0], value=element[1], comment=element[2]
+                )
+                if isinstance(element, tuple)
+                else _construct(CommentBlock, lines=element)
+            )
+            for element in self.content
+        ]
+        return _construct(
+            Section,
+            header=self.header,
+            content=content,
+            datablock=self.datablock if self.datablock else None,
+        )
+
+
+class FastParser(Parser):
+    """FastParser is a high-throughput alternative to the Parser for Deltares ini files.
+
+    It produces the same Document as the Parser, but handles each line in a single
+    pass: the line is stripped once and dispatched on its first character. The
+    sections are collected in plain lists and tuples, and are only converted to
+    their pydantic models when the parser is finalized.
+
+    The FastParser can be configured with a ParserConfig object, and can be used
+    in place of the Parser. INI based models are parsed with the FastParser when
+    the `INI_PARSER` setting is "fast".
+    """
+
+    def __init__(self, config: ParserConfig) -> None:
+        """Creates a new FastParser configured with the provided config.
+
+        Args:
+            config (ParserConfig): The configuration of this FastParser.
+        """
+        self._config = config
+        self._comment_delimiter = config.comment_delimiter
+        self._comment_start = config.comment_delimiter[:1]
+        self._parse_property_comments = config.parse_comments
+        self._allow_only_keywords = config.allow_only_keywords
+        self._parse_datablocks = config.parse_datablocks
+
+        self._header_comment: List[List[str]] = []
+        self._current_header_lines: Optional[List[str]] = None
+        self._sections: List[_FastSection] = []
+        self._current_section: Optional[_FastSection] = None  # type: ignore[assignment]
+
+        self._state = self._StateType.NO_SECTION_FOUND
+        self._line_index = 0
+
+    def feed_line(self, line: str) -> None:
+        """Parse the next line with this FastParser.
+
+        Args:
+            line (str): The line to parse
+        """
+        self._line_index += 1
+        stripped = line.strip()
+        if not stripped:
+            if self._state == self._StateType.NO_SECTION_FOUND:
+                self._finish_current_header_block()
+            return
+
+        first_character = stripped[0]
+        is_section_header = first_character == "[" and stripped[-1] == "]"
+
+        if self._state == self._StateType.PARSING_DATABLOCK:
+            # Within a datablock, comments are not recognized.
+            if is_section_header:
+                self._start_section(stripped)
+            else:
+                self._current_section.datablock.append(stripped.split())  # type: ignore[union-attr]
+            return
+
+        if first_character == self._comment_start and stripped.startswith(
+            self._comment_delimiter
+        ):
+            self._add_comment(stripped[1:].strip())
+        elif is_section_header:
+            self._start_section(stripped)
+        elif self._state == self._StateType.NO_SECTION_FOUND:
+            return
+        elif self._allow_only_keywords or "=" in stripped:
+            self._add_property(line, stripped)
+        elif self._parse_datablocks:
+            self._current_section.datablock.append(stripped.split())  # type: ignore[union-attr]
+            self._state = self._StateType.PARSING_DATABLOCK
+
+    def feed_lines(self, lines: Iterable[str]) -> None:
+        """Parse the provided lines with this FastParser.
+
+        Args:
+            lines (Iterable[str]): The lines to parse.
+        """
+        feed_line = self.feed_line
+        for line in lines:
+            feed_line(line)
+
+    def iter_sections(self, lines: Iterable[str]) -> Iterator[Section]:
+        """Parse the provided lines with this FastParser and yield each Section once complete.
+
+        A Section is complete when the next section header is encountered, or
+        when all lines have been parsed. Only the Section that is being parsed
+        is kept in memory, such that large files can be processed in constant
+        memory. The yielded sections are not part of the Document returned by
+        `finalize`.
+
+        Args:
+            lines (Iterable[str]): The lines to parse.
+
+        Yields:
+            Section: The parsed sections, in the order of the lines.
+        """
+        feed_line = self.feed_line
+        sections = self._sections
+        for line in lines:
+            feed_line(line)
+            if len(sections) > 1:
+                yield sections.pop(0).finalize()
+
+        while sections:
+            yield sections.pop(0).finalize()
+
+    def finalize(self) -> Document:
+        """Finalize parsing and return the constructed Document.
+
+        Returns:
+            Document:
+                A Document describing the parsed ini file.
+        """
+        self._finish_current_header_block()
+        return Document.model_construct(
+            _fields_set=set(),
+            header_comment=[
+                _construct(CommentBlock, lines=lines) for lines in self._header_comment
+            ],
+            sections=[section.finalize() for section in self._sections],
+        )
+
+    def _start_section(self, stripped: str) -> None:
+        self._current_section = _FastSection(stripped[1:-1].strip())
+        self._sections.append(self._current_section)
+        self._state = self._StateType.PARSING_PROPERTIES
+
+    def _add_comment(self, comment: str) -> None:
+        if self._state == self._StateType.NO_SECTION_FOUND:
+            if self._current_header_lines is None:
+                self._current_header_lines = []
+            self._current_header_lines.append(comment)
+            return
+
+        section = self._current_section
+        if section.comment_lines is None:  # type: ignore[union-attr]
+            section.comment_lines = []  # type: ignore[union-attr]
+        section.comment_lines.append(comment)  # type: ignore[union-attr]
+
+    def _add_property(self, line: str, stripped: str) -> None:
+        value: Optional[str]
+        comment: Optional[str] = None
+        if "=" in stripped:
+            key, value = stripped.split("=", 1)
+            key = key.strip()
+            value = value.strip() or None
+            if (
+                value is not None
+                and self._parse_property_comments
+                and self._comment_delimiter in value
+            ):
+                comment, value = self._retrieve_property_comment(value)
+        else:
+            # The key of a property without value is kept as is.
+            key, value = line, None
+
+        section = self._current_section
+        if section.comment_lines is not None:  # type: ignore[union-attr]
+            section.content.append(section.comment_lines)  # type: ignore[union-attr]
+            section.comment_lines = None  # type: ignore[union-attr]
+        section.content.append((key, value, comment))  # type: ignore[union-attr]
+
+    def _finish_current_header_block(self) -> None:
+        if self._current_header_lines is not None:
+            self._header_comment.append(self._current_header_lines)
+            self._current_header_lines = None
+
+
+def get_parser_type() -> Type[Parser]:
+    """Get the parser type used to read INI based models.
+
+    The parser type is selected with the `INI_PARSER` setting.
+
+    Returns:
+        Type[Parser]: The FastParser if the setting is "fast", otherwise the Parser.
+    """
+    if settings.INI_PARSER == IniParserType.FAST:
+        return FastParser
+    return Parser
@@ -1,6 +1,7 @@
 """Serializer for Deltares INI file formats."""
 
-from itertools import chain, count, repeat
+import os
+from itertools import chain, count, islice, repeat
 from pathlib import Path
 from typing import Any, Iterable, Optional, Sequence
 
@@ -254,7 +255,23 @@ class SectionSerializer:
             return []
 
         indent = " " * self._config.total_datablock_indent
-        return (self._serialize_row(row, indent) for row in datablock)
+
+        # All complete rows are formatted with a single format string, which
+        # left-aligns each element within the maximum length of its column.
+        elem_spacing = " " * self.config.datablock_spacing
+        n_columns = len(self.max_length.datablock)
+        row_format = elem_spacing.join(
+            f"{{:<{max_length}}}" for max_length in self.max_length.datablock
+        ).format
+
+        return (
+            (
+                indent + row_format(*row).rstrip()
+                if len(row) == n_columns
+                else self._serialize_row(row, indent)
+            )
+            for row in datablock
+        )
 
     def _serialize_row(self, row: DatablockRow, indent: str) -> str:
         elem_spacing = " " * self.config.datablock_spacing
@@ -288,10 +305,27 @@ class Serializer:
         Returns:
             Lines: An iterable returning each line of the serialized Document.
         """
-        header_iterable = self._serialize_document_header(document.header_comment)
+        return self.serialize_sections(document.header_comment, document.sections)
+
+    def serialize_sections(
+        self, header_comment: Iterable[CommentBlock], sections: Iterable[Section]
+    ) -> Lines:
+        """Serialize the provided header comment and sections into an iterable of lines.
+
+        The sections are consumed one at a time while the lines are iterated, such
+        that the sections do not need to be materialized in a Document.
+
+        Args:
+            header_comment (Iterable[CommentBlock]): The header comment blocks of the document.
+            sections (Iterable[Section]): The sections of the document.
+
+        Returns:
+            Lines: An iterable returning each line of the serialized document.
+        """
+        header_iterable = self._serialize_document_header(header_comment)
 
         serialize_section = lambda s: SectionSerializer.serialize(s, self._config)
-        sections = (serialize_section(section) for section in document.sections)
+        sections = (serialize_section(section) for section in sections)
         sections_with_spacing = Serializer._interweave(sections, [""])
         sections_iterable = chain.from_iterable(sections_with_spacing)
 
@@ -315,22 +349,64 @@ class Serializer:
         return chain.from_iterable(zip(iterable, repeat(val)))
 
 
+_write_chunk_size = 8192
+"""int: The number of lines that are joined and written at once by write_ini_sections."""
+
+
 def write_ini(path: Path, document: Document, config: INISerializerConfig) -> None:
     """Write the provided document to the specified path.
 
     If the provided path already exists, it will be overwritten. If the parent folder
-    do not exist, they will be created.
+    do not exist, they will be created. The lines are written to a temporary file
+    in the same folder, which replaces the file at the path once all sections are
+    written. An error while generating the sections therefore leaves an existing
+    file untouched.
 
     Args:
         path (Path): The path to which the document should be written.
         document (Document): The document to serialize to the specified path.
         config (INISerializerConfig): The configuration settings for the serializer.
     """
-    serializer = Serializer(config)
+    write_ini_sections(path, document.header_comment, document.sections, config)
 
-    path.parent.mkdir(parents=True, exist_ok=True)
 
-    with path.open("w", encoding="utf8") as f:
+def write_ini_sections(
+    path: Path,
+    header_comment: Iterable[CommentBlock],
+    sections: Iterable[Section],
+    config: INISerializerConfig,
+) -> None:
+    """Write the provided header comment and sections to the specified path.
+
+    The sections are serialized one at a time, and the resulting lines are written
+    in large buffered chunks. As such, the sections can be generated lazily, without
+    materializing a Document. The output is identical to `write_ini` with a Document
+    containing the same header comment and sections.
 
-        for line in serializer.serialize(document):
-            f.write(line + "\n")
+    If the provided path already exists, it will be overwritten. If the parent folder
+    do not exist, they will be created. The lines are written to a temporary file
+    in the same folder, which replaces the file at the path once all sections are
+    written. An error while generating the sections therefore leaves an existing
+    file untouched.
+
+    Args:
+        path (Path): The path to which the sections should be written.
+        header_comment (Iterable[CommentBlock]): The header comment blocks of the document.
+        sections (Iterable[Section]): The sections to serialize to the specified path.
+        config (INISerializerConfig): The configuration settings for the serializer.
+    """
+    serializer = Serializer(config)
+    lines = iter(serializer.serialize_sections(header_comment, sections))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+
+    try:
+        with temporary_path.open("w", encoding="utf8") as f:
+            while chunk := list(islice(lines, _write_chunk_size)):
+                f.write("\n".join(chunk))
+                f.write("\n")
+        os.replace(temporary_path, path)
+    except BaseException:
+        temporary_path.unlink(missing_ok=True)
+        raise
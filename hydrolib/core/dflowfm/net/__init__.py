@@ -1,12 +1,30 @@
 """Package for D-Flow FM network (net) file models."""
 
-from .models import Branch, Link1d2d, Mesh1d, Mesh2d, Network, NetworkModel
+from .discretization import BranchDiscretization, discretize_branches
+from .models import (
+    Branch,
+    BranchGroupLinks,
+    Link1d2d,
+    Link1d2dType,
+    Mesh1d,
+    Mesh2d,
+    Network,
+    NetworkModel,
+)
+from .reader import UgridComponent
+from .writer import StorageConfiguration
 
 __all__ = [
     "Mesh2d",
     "Branch",
+    "BranchDiscretization",
+    "BranchGroupLinks",
+    "discretize_branches",
     "Link1d2d",
+    "Link1d2dType",
     "Mesh1d",
     "Network",
     "NetworkModel",
+    "StorageConfiguration",
+    "UgridComponent",
 ]
@@ -0,0 +1,62 @@
+"""Conversion between strings and the fixed width character arrays of UGRID files.
+
+UGRID files store strings, such as node and branch ids, in character variables
+with a string length dimension. The conversions here operate on whole arrays at
+once, instead of converting every string separately.
+"""
+
+from typing import Iterable, Union
+
+import numpy as np
+
+_ENCODING = "utf-8"
+
+
+def chars_to_strings(chars: np.ndarray) -> np.ndarray:
+    """Convert a character array to an array of strings.
+
+    The characters along the last dimension are joined, and trailing null
+    characters and leading and trailing whitespace are removed.
+
+    Args:
+        chars (np.ndarray): The character array (dtype "S1"), e.g. with shape (n, size).
+
+    Returns:
+        np.ndarray: The strings, with the shape of chars without its last dimension.
+    """
+    chars = np.ascontiguousarray(chars, dtype="S1")
+    size = chars.shape[-1]
+    fixed_width = chars.view(f"S{size}").reshape(chars.shape[:-1])
+    try:
+        # Fast conversion, which only succeeds for ASCII
+        strings = fixed_width.astype(f"U{size}")
+    except UnicodeDecodeError:
+        strings = np.strings.decode(fixed_width, _ENCODING, errors="replace")
+    return np.strings.strip(strings)
+
+
+def strings_to_chars(
+    strings: Union[np.ndarray, Iterable[str]], size: int
+) -> np.ndarray:
+    """Convert strings to a character array with a fixed number of characters per string.
+
+    Strings are padded with spaces, and strings that are too long are truncated.
+
+    Args:
+        strings (Union[np.ndarray, Iterable[str]]): The strings to convert.
+        size (int): The number of characters per string.
+
+    Returns:
+        np.ndarray: The character array (dtype "S1") with shape (len(strings), size).
+    """
+    if not isinstance(strings, np.ndarray):
+        strings = np.array(list(strings), dtype=str)
+    strings = strings.astype(str).ravel()
+    try:
+        # Fast conversion, which only succeeds for ASCII
+        fixed_width = strings.astype(f"S{size}")
+    except UnicodeEncodeError:
+        fixed_width = np.strings.encode(strings, _ENCODING).astype(f"S{size}")
+    chars = fixed_width.view("S1").reshape(len(strings), size).copy()
+    chars[chars == b""] = b" "
+    return chars
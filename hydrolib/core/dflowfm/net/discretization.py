@@ -0,0 +1,443 @@
+"""Discretization of many 1D branches into mesh nodes at once.
+
+The branches are given as ragged arrays: the coordinates of all branches are
+concatenated, together with the number of coordinates per branch. All branches
+are discretized with whole-array operations, which gives the same node offsets
+as `Branch.generate_nodes` for each branch separately.
+"""
+
+import logging
+from typing import Optional, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from hydrolib.core.base.models import BaseModel
+
+logger = logging.getLogger(__name__)
+
+# The margin of the first and last limit around the branch, see `Branch._generate_offsets`
+_LIMIT_MARGIN = 1e-3
+
+
+class BranchDiscretization(BaseModel):
+    """The mesh nodes of many branches, stored in concatenated arrays."""
+
+    geometry_x: np.ndarray
+    "The x-coordinates of the geometry of all branches."
+
+    geometry_y: np.ndarray
+    "The y-coordinates of the geometry of all branches."
+
+    part_node_count: np.ndarray
+    "The number of geometry coordinates of each branch."
+
+    geometry_distance: np.ndarray
+    "The distance of each geometry coordinate along its branch."
+
+    length: np.ndarray
+    "The length of each branch."
+
+    node_count: np.ndarray
+    "The number of mesh nodes of each branch."
+
+    offsets: np.ndarray
+    "The offset (chainage) of the mesh nodes of all branches."
+
+    node_x: np.ndarray
+    "The x-coordinates of the mesh nodes of all branches."
+
+    node_y: np.ndarray
+    "The y-coordinates of the mesh nodes of all branches."
+
+
+def discretize_branches(
+    geometry_x: npt.ArrayLike,
+    geometry_y: npt.ArrayLike,
+    part_node_count: npt.ArrayLike,
+    mesh1d_edge_length: Union[float, npt.ArrayLike],
+    structure_chainage: Optional[npt.ArrayLike] = None,
+    structure_count: Optional[npt.ArrayLike] = None,
+    max_dist_to_struc: Optional[float] = None,
+) -> BranchDiscretization:
+    """Generate the mesh nodes of many branches.
+
+    The mesh nodes are generated as in `Branch.generate_nodes`: every branch is
+    divided into edges of about the mesh1d edge length, and nodes are added such
+    that there is a node between every pair of structures.
+
+    Args:
+        geometry_x (npt.ArrayLike): The x-coordinates of the geometry of all branches.
+        geometry_y (npt.ArrayLike): The y-coordinates of the geometry of all branches.
+        part_node_count (npt.ArrayLike):
+            The number of geometry coordinates of each branch, at least 2.
+        mesh1d_edge_length (Union[float, npt.ArrayLike]):
+            The edge length of the 1d mesh, for all branches or for each branch.
+        structure_chainage (Optional[npt.ArrayLike], optional):
+            The structure chainages of all branches. Defaults to None.
+        structure_count (Optional[npt.ArrayLike], optional):
+            The number of structure chainages of each branch, required with
+            structure_chainage. Defaults to None.
+        max_dist_to_struc (Optional[float], optional): The maximum distance from a
+            node to a structure. If not specified, calculation will not take it into
+            account. Defaults to None.
+
+    Raises:
+        ValueError: Raised when a branch has less than two geometry coordinates.
+        ValueError: Raised when structure_count does not match structure_chainage.
+        ValueError: Raised when any of the structure offsets is smaller than zero or
+            greater than the branch length.
+
+    Returns:
+        BranchDiscretization: The mesh nodes of all branches.
+    """
+    geometry_x = np.asarray(geometry_x, dtype=np.float64)
+    geometry_y = np.asarray(geometry_y, dtype=np.float64)
+    part_node_count = np.asarray(part_node_count, dtype=np.int64)
+    nbranches = part_node_count.size
+    if (part_node_count < 2).any():
+        raise ValueError("Each branch should have at least two geometry coordinates.")
+
+    edge_length = np.broadcast_to(
+        np.asarray(mesh1d_edge_length, dtype=np.float64), (nbranches,)
+    )
+    distance = _cumulative_distance(geometry_x, geometry_y, part_node_count)
+    geometry_end = np.cumsum(part_node_count)
+    length = distance[geometry_end - 1]
+
+    # Every branch starts with the anchor points at its start and end
+    anchors = np.column_stack([np.zeros(nbranches), length]).ravel()
+    anchor_count = np.full(nbranches, 2, dtype=np.int64)
+
+    if structure_chainage is not None:
+        if structure_count is None:
+            raise ValueError(
+                "structure_count is required when structure_chainage is given."
+            )
+        anchors, anchor_count = _add_structure_anchors(
+            anchors,
+            anchor_count,
+            length,
+            edge_length,
+            np.asarray(structure_chainage, dtype=np.float64),
+            np.asarray(structure_count, dtype=np.int64),
+            max_dist_to_struc,
+        )
+
+    offsets, node_count = spacing_from_anchors(anchors, anchor_count, edge_length)
+    node_x, node_y = _interpolate(
+        geometry_x, geometry_y, distance, geometry_end, offsets, node_count
+    )
+    return BranchDiscretization(
+        geometry_x=geometry_x,
+        geometry_y=geometry_y,
+        part_node_count=part_node_count,
+        geometry_distance=distance,
+        length=length,
+        node_count=node_count,
+        offsets=offsets,
+        node_x=node_x,
+        node_y=node_y,
+    )
+
+
+def spacing_from_anchors(
+    anchors: np.ndarray,
+    anchor_count: np.ndarray,
+    mesh1d_edge_length: Union[float, np.ndarray],
+) -> "tuple[np.ndarray, np.ndarray]":
+    """Generate the offsets between the sorted anchor points of many branches.
+
+    Each section between two anchor points is divided into edges of about the
+    mesh1d edge length, and the last anchor point of each branch is added.
+
+    Args:
+        anchors (np.ndarray): The sorted anchor points of all branches.
+        anchor_count (np.ndarray): The number of anchor points of each branch.
+        mesh1d_edge_length (Union[float, np.ndarray]):
+            The edge length of the 1d mesh, for all branches or for each branch.
+
+    Raises:
+        ValueError: Raised when two anchor points of a branch coincide.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The offsets of all branches, and the number
+            of offsets of each branch.
+    """
+    anchor_branch = np.repeat(np.arange(anchor_count.size), anchor_count)
+    edge_length = np.broadcast_to(mesh1d_edge_length, anchor_count.shape)[anchor_branch]
+
+    # Each anchor point is followed by the nodes of its section, except the last
+    # anchor point of a branch, which is only followed by itself
+    is_last = np.zeros(anchors.size, dtype=bool)
+    is_last[np.cumsum(anchor_count) - 1] = True
+    section_length = np.zeros(anchors.size)
+    section_length[:-1] = anchors[1:] - anchors[:-1]
+    if (section_length[~is_last] <= 0.0).any():
+        raise ValueError("Section length must be larger than 0.0")
+
+    nnodes = np.ones(anchors.size, dtype=np.int64)
+    nnodes[~is_last] = (
+        np.maximum(
+            2,
+            (np.round(section_length[~is_last] / edge_length[~is_last]) + 1).astype(
+                np.int64
+            ),
+        )
+        - 1
+    )
+    step = np.where(is_last, 0.0, section_length / nnodes)
+
+    # Same as np.linspace(anchor, next_anchor, nnodes, endpoint=False)
+    section = np.repeat(np.arange(anchors.size), nnodes)
+    index = np.arange(section.size) - np.repeat(np.cumsum(nnodes) - nnodes, nnodes)
+    offsets = index * step[section] + anchors[section]
+    node_count = np.bincount(
+        anchor_branch, weights=nnodes, minlength=anchor_count.size
+    ).astype(np.int64)
+    return offsets, node_count
+
+
+def _cumulative_distance(
+    x: np.ndarray, y: np.ndarray, part_node_count: np.ndarray
+) -> np.ndarray:
+    """Get the distance of each coordinate along its branch.
+
+    The distances are accumulated per branch in the order of the coordinates, which
+    gives the same values as accumulating the distances of each branch separately.
+    """
+    segment_length = np.zeros(x.size)
+    segment_length[1:] = np.hypot(np.diff(x), np.diff(y))
+    start = np.cumsum(part_node_count) - part_node_count
+
+    # Accumulate coordinate by coordinate, for all branches with that many coordinates
+    order = np.argsort(-part_node_count, kind="stable")
+    sorted_count = part_node_count[order]
+    distance = np.zeros(x.size)
+    for i in range(1, int(sorted_count[0]) if sorted_count.size else 0):
+        active = start[order[: np.searchsorted(-sorted_count, -i, side="left")]] + i
+        distance[active] = distance[active - 1] + segment_length[active]
+    return distance
+
+
+def _searchsorted_within_groups(
+    values: np.ndarray,
+    start: np.ndarray,
+    end: np.ndarray,
+    queries: np.ndarray,
+    side: str = "left",
+) -> np.ndarray:
+    """Find the insertion index of each query in a sorted range of values.
+
+    Args:
+        values (np.ndarray): The values, sorted within each range.
+        start (np.ndarray): The start index of the range of each query.
+        end (np.ndarray): The end index (exclusive) of the range of each query.
+        queries (np.ndarray): The values to insert.
+        side (str, optional): "left" or "right", as in np.searchsorted.
+
+    Returns:
+        np.ndarray: The insertion index of each query in values, within its range.
+    """
+    low = start.astype(np.int64, copy=True)
+    high = end.astype(np.int64, copy=True)
+    while (searching := low < high).any():
+        middle = (low + high) // 2
+        value = values[np.minimum(middle, values.size - 1)]
+        go_right = (value <= queries) if side == "right" else (value < queries)
+        go_right &= searching
+        go_left = ~go_right & searching
+        low = np.where(go_right, middle + 1, low)
+        high = np.where(go_left, middle, high)
+    return low
+
+
+def _interpolate(
+    x: np.ndarray,
+    y: np.ndarray,
+    distance: np.ndarray,
+    geometry_end: np.ndarray,
+    offsets: np.ndarray,
+    node_count: np.ndarray,
+) -> "tuple[np.ndarray, np.ndarray]":
+    """Interpolate the coordinates of the offsets along the geometry of their branch.
+
+    The interpolation is the same as np.interp on the geometry of each branch.
+    """
+    node_branch = np.repeat(np.arange(node_count.size), node_count)
+    geometry_start = (geometry_end - np.diff(geometry_end, prepend=0))[node_branch]
+    last = geometry_end[node_branch] - 1
+
+    # The geometry segment [j, j + 1) of each offset
+    j = _searchsorted_within_groups(
+        distance, geometry_start, last + 1, offsets, side="right"
+    )
+    j = np.clip(j - 1, geometry_start, last - 1)
+    # As np.interp, the offsets outside the geometry are clamped to its end points
+    before_start = offsets <= distance[geometry_start]
+    beyond_end = offsets >= distance[last]
+
+    fraction = offsets - distance[j]
+    segment_length = distance[j + 1] - distance[j]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        node_x = (x[j + 1] - x[j]) / segment_length * fraction + x[j]
+        node_y = (y[j + 1] - y[j]) / segment_length * fraction + y[j]
+    node_x[before_start] = x[geometry_start[before_start]]
+    node_y[before_start] = y[geometry_start[before_start]]
+    node_x[beyond_end] = x[last[beyond_end]]
+    node_y[beyond_end] = y[last[beyond_end]]
+    return node_x, node_y
+
+
+def _add_structure_anchors(
+    anchors: np.ndarray,
+    anchor_count: np.ndarray,
+    length: np.ndarray,
+    edge_length: np.ndarray,
+    structure_chainage: np.ndarray,
+    structure_count: np.ndarray,
+    max_dist_to_struc: Optional[float],
+) -> "tuple[np.ndarray, np.ndarray]":
+    """Add anchor points such that there is a mesh node between every pair of structures.
+
+    See `Branch._generate_offsets`: the segments between the structures (the limits)
+    are checked, and an anchor point is added halfway the first segment of a branch
+    without a mesh node, until every segment has a mesh node.
+    """
+    nbranches = length.size
+    if structure_count.size != nbranches or structure_count.sum() != (
+        structure_chainage.size
+    ):
+        raise ValueError(
+            "structure_count should give the number of structure chainages of each branch."
+        )
+
+    structure_branch = np.repeat(np.arange(nbranches), structure_count)
+    outside = (structure_chainage < 0.0) | (
+        structure_chainage > length[structure_branch]
+    )
+    if outside.any():
+        i = np.flatnonzero(outside)[0]
+        raise ValueError(
+            f"Distance {structure_chainage[i]} is outside the branch range (0.0 - {length[structure_branch[i]]})."
+        )
+
+    limits, limit_count = _generate_limits(
+        structure_chainage, structure_count, length, max_dist_to_struc
+    )
+    limit_branch = np.repeat(np.arange(nbranches), limit_count)
+    # The segments between consecutive limits of a branch
+    segment = np.ones(limits.size, dtype=bool)
+    segment[np.cumsum(limit_count) - 1] = False
+    segment_branch = limit_branch[segment]
+    lower = limits[segment]
+    upper = limits[np.flatnonzero(segment) + 1]
+    # Branches without structures are not checked, as in Branch.generate_nodes
+    checked = structure_count[segment_branch] > 0
+
+    added = np.zeros(nbranches, dtype=np.int64)
+    while True:
+        offsets, node_count = spacing_from_anchors(anchors, anchor_count, edge_length)
+        node_end = np.cumsum(node_count)
+        node_start = (node_end - node_count)[segment_branch]
+        node_end = node_end[segment_branch]
+        above_lower = _searchsorted_within_groups(
+            offsets, node_start, node_end, lower, side="right"
+        )
+        below_upper = _searchsorted_within_groups(
+            offsets, node_start, node_end, upper, side="left"
+        )
+        missing = checked & (below_upper <= above_lower)
+        if not missing.any():
+            break
+
+        # Add an anchor halfway the first segment without a node of each branch
+        missing_index = np.flatnonzero(missing)
+        first = missing_index[
+            np.unique(segment_branch[missing_index], return_index=True)[1]
+        ]
+        new_branch = segment_branch[first]
+        new_anchor = (lower[first] + upper[first]) / 2.0
+        added[new_branch] += 1
+        anchors, anchor_count = _merge_sorted(
+            anchors, anchor_count, new_anchor, new_branch
+        )
+
+    if added.any():
+        logger.info(
+            f"Added 1d mesh nodes on {np.count_nonzero(added)} branches, due to the structures."
+        )
+    return anchors, anchor_count
+
+
+def _generate_limits(
+    structure_chainage: np.ndarray,
+    structure_count: np.ndarray,
+    length: np.ndarray,
+    max_dist_to_struc: Optional[float],
+) -> "tuple[np.ndarray, np.ndarray]":
+    """Generate the sorted limits of each branch: the structures and the branch ends.
+
+    With max_dist_to_struc, limits are added around the structures, as in
+    `Branch._generate_extended_limits`.
+    """
+    nbranches = length.size
+    structure_branch = np.repeat(np.arange(nbranches), structure_count)
+    order = np.lexsort((structure_chainage, structure_branch))
+    structures = structure_chainage[order]
+
+    limit_count = structure_count + 2
+    limit_branch = np.repeat(np.arange(nbranches), limit_count)
+    limit_end = np.cumsum(limit_count)
+    limit_start = limit_end - limit_count
+    is_structure = np.ones(limit_branch.size, dtype=bool)
+    is_structure[limit_start] = False
+    is_structure[limit_end - 1] = False
+
+    limits = np.empty(limit_branch.size)
+    limits[limit_start] = -_LIMIT_MARGIN
+    limits[limit_end - 1] = length + _LIMIT_MARGIN
+    limits[is_structure] = structures
+
+    if max_dist_to_struc is None or structure_chainage.size == 0:
+        return limits, limit_count
+
+    # For each structure, the distance to the next limit
+    index = np.flatnonzero(is_structure)
+    dist_to_next = limits[index + 1] - limits[index]
+    has_next = dist_to_next > 2 * max_dist_to_struc
+    next_shift = np.where(
+        has_next, np.minimum(2 * max_dist_to_struc, dist_to_next / 2), 0.0
+    )
+
+    # The distance to the previous limit, or to the limit that was added after it
+    previous_shift = np.zeros(limits.size)
+    previous_shift[index] = next_shift
+    dist_to_prev = limits[index] - (limits[index - 1] + previous_shift[index - 1])
+    has_prev = dist_to_prev > 2 * max_dist_to_struc
+    prev_shift = np.minimum(2 * max_dist_to_struc, dist_to_prev / 2)
+
+    additional = np.concatenate(
+        [
+            limits[index[has_prev]] - prev_shift[has_prev],
+            limits[index[has_next]] + next_shift[has_next],
+        ]
+    )
+    additional_branch = np.concatenate(
+        [limit_branch[index[has_prev]], limit_branch[index[has_next]]]
+    )
+    return _merge_sorted(limits, limit_count, additional, additional_branch)
+
+
+def _merge_sorted(
+    values: np.ndarray,
+    count: np.ndarray,
+    new_values: np.ndarray,
+    new_branch: np.ndarray,
+) -> "tuple[np.ndarray, np.ndarray]":
+    """Merge new values into the values of their branch, keeping each branch sorted."""
+    branch = np.concatenate([np.repeat(np.arange(count.size), count), new_branch])
+    merged = np.concatenate([values, new_values])
+    order = np.lexsort((merged, branch))
+    new_count = count + np.bincount(new_branch, minlength=count.size)
+    return merged[order], new_count
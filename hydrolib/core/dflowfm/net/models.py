@@ -3,20 +3,43 @@
 from __future__ import annotations
 
 import logging
+import math
+import time
+from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 import meshkernel as mk
-import netCDF4 as nc
 import numpy as np
 import numpy.typing as npt
 from meshkernel.py_structures import GeometryList
-from pydantic import Field
+from pydantic import Field, PrivateAttr
+from strenum import StrEnum
 
 from hydrolib.core.base.file_manager import file_load_context
 from hydrolib.core.base.models import BaseModel, ModelSaveSettings, ParsableFileModel
-from hydrolib.core.dflowfm.net.reader import UgridReader
-from hydrolib.core.dflowfm.net.writer import UgridWriter
+from hydrolib.core.dflowfm.net.discretization import (
+    BranchDiscretization,
+    spacing_from_anchors,
+)
+from hydrolib.core.dflowfm.net.reader import (
+    LazyUgridVariables,
+    UgridComponent,
+    UgridReader,
+)
+from hydrolib.core.dflowfm.net.writer import StorageConfiguration, UgridWriter
 
 logger = logging.getLogger(__name__)
 
@@ -45,9 +68,258 @@ def split_by(gl: mk.GeometryList, by: float) -> list:
     return lists
 
 
-class Mesh2d(BaseModel):
+def _check_closed(parts: List[mk.GeometryList]) -> None:
+    """Check that the first and last coordinate of each polygon part match.
+
+    Raises:
+        ValueError: When a part is not closed.
+    """
+    for part in parts:
+        if (part.x_coordinates[0], part.y_coordinates[0]) != (
+            part.x_coordinates[-1],
+            part.y_coordinates[-1],
+        ):
+            raise ValueError(
+                "First and last coordinate of each GeometryList part should match."
+            )
+
+
+def _join_polygons(polygons: List[mk.GeometryList]) -> mk.GeometryList:
+    """Join polygons into a single GeometryList, separated by the geometry separator.
+
+    Args:
+        polygons (List[mk.GeometryList]): The polygons to join, at least one.
+
+    Returns:
+        mk.GeometryList: The joined polygons.
+    """
+    separator = polygons[0].geometry_separator
+    x_parts, y_parts = [], []
+    for i, polygon in enumerate(polygons):
+        if i > 0:
+            x_parts.append([separator])
+            y_parts.append([separator])
+        x_parts.append(polygon.x_coordinates)
+        y_parts.append(polygon.y_coordinates)
+    return mk.GeometryList(
+        x_coordinates=np.concatenate(x_parts).astype(np.float64),
+        y_coordinates=np.concatenate(y_parts).astype(np.float64),
+        geometry_separator=separator,
+        inner_outer_separator=polygons[0].inner_outer_separator,
+    )
+
+
+def _polygon_bounds(polygon: mk.GeometryList) -> Tuple[float, float, float, float]:
+    """Get the bounding box (xmin, ymin, xmax, ymax) of a polygon, ignoring separators."""
+    x, y = polygon.x_coordinates, polygon.y_coordinates
+    valid = (x != polygon.geometry_separator) & (x != polygon.inner_outer_separator)
+    return (
+        float(x[valid].min()),
+        float(y[valid].min()),
+        float(x[valid].max()),
+        float(y[valid].max()),
+    )
+
+
+def _overlap_layers(bounds: np.ndarray) -> np.ndarray:
+    """Divide bounding boxes over layers in which none of the boxes overlap.
+
+    Each box is placed in the layer after the last layer with a preceding box that
+    it overlaps. Processing the layers in order, therefore, processes every pair of
+    overlapping boxes in their original order.
+
+    Args:
+        bounds (np.ndarray): The boxes (xmin, ymin, xmax, ymax), with shape (n, 4).
+
+    Returns:
+        np.ndarray: The layer of each box.
+    """
+    layers = np.zeros(len(bounds), dtype=np.int64)
+    for i in range(1, len(bounds)):
+        previous = bounds[:i]
+        overlaps = (
+            (previous[:, 0] <= bounds[i, 2])
+            & (previous[:, 2] >= bounds[i, 0])
+            & (previous[:, 1] <= bounds[i, 3])
+            & (previous[:, 3] >= bounds[i, 1])
+        )
+        if overlaps.any():
+            layers[i] = layers[:i][overlaps].max() + 1
+    return layers
+
+
+# The Mesh2d fields that are read from the file on first access for a lazily read Mesh2d
+_LAZY_MESH2D_FIELDS = ("mesh2d_node_z", "mesh2d_face_z")
+# The Mesh2d arrays that can be sliced with Mesh2d.get_values
+_MESH2D_ARRAYS = (
+    "mesh2d_node_x",
+    "mesh2d_node_y",
+    "mesh2d_node_z",
+    "mesh2d_edge_x",
+    "mesh2d_edge_y",
+    "mesh2d_edge_nodes",
+    "mesh2d_face_x",
+    "mesh2d_face_y",
+    "mesh2d_face_z",
+    "mesh2d_face_nodes",
+)
+# The number of values that is read at once from the file when iterating over an array
+_READ_CHUNK_SIZE = 1_000_000
+
+Region = Union[Tuple[float, float, float, float], mk.GeometryList]
+"""A bounding box (xmin, ymin, xmax, ymax), or a polygon that may have holes."""
+
+
+def _points_in_region(
+    meshkernel: mk.MeshKernel, region: Region, x: np.ndarray, y: np.ndarray
+) -> np.ndarray:
+    """Determine which of the points are inside the region, including its boundary.
+
+    Args:
+        meshkernel (mk.MeshKernel): The meshkernel used to select the points in a polygon.
+        region (Region): The bounding box or polygon.
+        x (np.ndarray): The x-coordinates of the points.
+        y (np.ndarray): The y-coordinates of the points.
+
+    Returns:
+        np.ndarray: A boolean array, True for each point inside the region.
+    """
+    if not isinstance(region, mk.GeometryList):
+        xmin, ymin, xmax, ymax = region
+        return (x >= xmin) & (x <= xmax) & (y >= ymin) & (y <= ymax)
+
+    if x.size == 0:
+        return np.zeros(0, dtype=bool)
+    points = mk.GeometryList(
+        x_coordinates=np.asarray(x, dtype=np.float64),
+        y_coordinates=np.asarray(y, dtype=np.float64),
+    )
+    return meshkernel.polygon_get_included_points(region, points).values == 1.0
+
+
+def _renumber(mask: np.ndarray) -> np.ndarray:
+    """Get the new index of each element after selecting the elements in the mask (-1 if left out)."""
+    return np.where(mask, np.cumsum(mask) - 1, -1)
+
+
+def _match_faces(face_nodes: np.ndarray, other_face_nodes: np.ndarray) -> np.ndarray:
+    """Find the faces with the same nodes in other_face_nodes.
+
+    Args:
+        face_nodes (np.ndarray): The node indices of each face, negative for no node.
+        other_face_nodes (np.ndarray): The node indices of the other faces, negative for no node.
+
+    Returns:
+        np.ndarray: The index of each face in the other faces, -1 if not found.
+    """
+    if face_nodes.shape[0] == 0 or other_face_nodes.shape[0] == 0:
+        return np.full(face_nodes.shape[0], -1, dtype=np.int64)
+
+    width = max(face_nodes.shape[1], other_face_nodes.shape[1])
+
+    def sorted_nodes(nodes: np.ndarray) -> np.ndarray:
+        padded = np.full((nodes.shape[0], width), -1, dtype=np.int64)
+        padded[:, : nodes.shape[1]] = np.where(nodes >= 0, nodes, -1)
+        return np.sort(padded, axis=1)
+
+    all_faces = np.concatenate(
+        [sorted_nodes(other_face_nodes), sorted_nodes(face_nodes)]
+    )
+    _, inverse = np.unique(all_faces, axis=0, return_inverse=True)
+    inverse = inverse.ravel()
+    n_other = other_face_nodes.shape[0]
+
+    index_of_unique = np.full(all_faces.shape[0], -1, dtype=np.int64)
+    index_of_unique[inverse[:n_other]] = np.arange(n_other)
+    return index_of_unique[inverse[n_other:]]
+
+
+class PolygonBatchStatistics(BaseModel):
+    """Statistics of a mesh operation on a batch of polygons."""
+
+    number_of_polygons: int = 0
+    "The number of polygons that was given."
+
+    number_of_selected_polygons: int = 0
+    "The number of polygons with a bounding box that intersects the mesh."
+
+    number_of_meshkernel_calls: int = 0
+    "The number of times the meshkernel operation was invoked."
+
+    timings: Dict[str, float] = Field(default_factory=dict)
+    "The duration of each stage of the operation, in seconds."
+
+    def _log(self, operation: str) -> None:
+        logger.debug(
+            "%s of %d polygons (%d selected) in %d meshkernel call(s): %s",
+            operation,
+            self.number_of_polygons,
+            self.number_of_selected_polygons,
+            self.number_of_meshkernel_calls,
+            ", ".join(
+                f"{stage} {duration:.3f} s" for stage, duration in self.timings.items()
+            ),
+        )
+
+
+class _ModificationTracker(BaseModel, ABC):
+    """Base class of the network components that track which of their arrays are modified.
+
+    An array is marked as modified when it is assigned, or when it is changed by
+    one of the mesh operations of the component. The marks are cleared when the
+    network is read from or written to a file. Arrays that are changed in place,
+    or through the meshkernel directly, should be marked with `mark_modified`.
+    """
+
+    _modified: Set[str] = PrivateAttr(default_factory=set)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in self._tracked_arrays():
+            self._modified.add(name)
+
+    @property
+    def modified(self) -> Set[str]:
+        """The names of the arrays that are modified since the last read or write.
+
+        Returns:
+            Set[str]: The names of the modified arrays.
+        """
+        return set(self._modified)
+
+    def mark_modified(self, *names: str) -> None:
+        """Mark arrays as modified, e.g. after changing their values in place.
+
+        Args:
+            *names (str): The names of the arrays. Defaults to all arrays when no names are given.
+
+        Raises:
+            ValueError: When a name is not one of the arrays of this component.
+        """
+        tracked = self._tracked_arrays()
+        for name in names:
+            if name not in tracked:
+                raise ValueError(
+                    f'"{name}" is not one of the arrays of {type(self).__name__}.'
+                )
+        self._modified.update(names or tracked)
+
+    def _mark_saved(self) -> None:
+        self._modified.clear()
+
+    @abstractmethod
+    def _tracked_arrays(self) -> Tuple[str, ...]:
+        """The names of the arrays of which the modifications are tracked."""
+
+
+class Mesh2d(_ModificationTracker):
     """Mesh2d defines a single two dimensional grid.
 
+    A Mesh2d that is read lazily (see `UgridReader.read_mesh2d`) reads its arrays
+    from the file on demand, as they are stored in the file. The meshkernel is only
+    set when a mesh operation is invoked, after which the arrays are obtained from
+    the meshkernel.
+
     Attributes:
         meshkernel (mk.MeshKernel):
             The meshkernel used to manimpulate this Mesh2d.
@@ -67,6 +339,27 @@ class Mesh2d(BaseModel):
         default_factory=lambda: np.empty(0, dtype=np.double)
     )
 
+    _lazy_variables: Optional[LazyUgridVariables] = PrivateAttr(default=None)
+
+    def __getattr__(self, item: str) -> Any:
+        """Read a bathymetry field of a lazily read Mesh2d when it is accessed for the first time."""
+        if item in _LAZY_MESH2D_FIELDS and self._is_read_lazily(item):
+            value = self._lazy_variables.read(item)  # type: ignore[union-attr]
+            self.__dict__[item] = value
+            return value
+        return super().__getattr__(item)  # type: ignore[misc]
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether or not the mesh2d of this Mesh2d is set on the meshkernel.
+
+        This is only False for a lazily read Mesh2d on which no mesh operation has been invoked yet.
+
+        Returns:
+            bool: Whether or not the mesh2d is set on the meshkernel.
+        """
+        return self._lazy_variables is None
+
     @property
     def mesh2d_node_x(self) -> np.ndarray[float]:
         """The x-coordinates of the nodes in the mesh.
@@ -74,7 +367,9 @@ class Mesh2d(BaseModel):
         Returns:
             ndarray[float]: A 1D double array describing the x-coordinates of the nodes.
         """
-        return self.meshkernel.mesh2d_get().node_x
+        if self._is_read_lazily("mesh2d_node_x"):
+            return self._lazy_variables.read("mesh2d_node_x")  # type: ignore[union-attr]
+        return self.get_mesh2d().node_x
 
     @property
     def mesh2d_node_y(self) -> np.ndarray[float]:
@@ -83,7 +378,9 @@ class Mesh2d(BaseModel):
         Returns:
             ndarray[float]: A 1D double array describing the y-coordinates of the nodes.
         """
-        return self.meshkernel.mesh2d_get().node_y
+        if self._is_read_lazily("mesh2d_node_y"):
+            return self._lazy_variables.read("mesh2d_node_y")  # type: ignore[union-attr]
+        return self.get_mesh2d().node_y
 
     @property
     def mesh2d_edge_x(self) -> np.ndarray[float]:
@@ -92,7 +389,9 @@ class Mesh2d(BaseModel):
         Returns:
             ndarray[float]: A 1D double array describing x-coordinates of the mesh edges' middle points.
         """
-        return self.meshkernel.mesh2d_get().edge_x
+        if self._is_read_lazily("mesh2d_edge_x"):
+            return self._lazy_variables.read("mesh2d_edge_x")  # type: ignore[union-attr]
+        return self.get_mesh2d().edge_x
 
     @property
     def mesh2d_edge_y(self) -> np.ndarray[float]:
@@ -101,7 +400,9 @@ class Mesh2d(BaseModel):
         Returns:
             ndarray[float]: A 1D double array describing y-coordinates of the mesh edges' middle points.
         """
-        return self.meshkernel.mesh2d_get().edge_y
+        if self._is_read_lazily("mesh2d_edge_y"):
+            return self._lazy_variables.read("mesh2d_edge_y")  # type: ignore[union-attr]
+        return self.get_mesh2d().edge_y
 
     @property
     def mesh2d_edge_nodes(self) -> np.ndarray[int, int]:
@@ -110,7 +411,9 @@ class Mesh2d(BaseModel):
         Returns:
             np.ndarray[int, int]: A 2D integer array (nEdges, 2) containg the two node indices for each edge.
         """
-        mesh2d_output = self.meshkernel.mesh2d_get()
+        if self._is_read_lazily("mesh2d_edge_nodes"):
+            return self._lazy_variables.read("mesh2d_edge_nodes")  # type: ignore[union-attr]
+        mesh2d_output = self.get_mesh2d()
         edge_nodes = mesh2d_output.edge_nodes.reshape((-1, 2))
         return edge_nodes
 
@@ -121,7 +424,9 @@ class Mesh2d(BaseModel):
         Returns:
             ndarray[float]: A 1D double array describing x-coordinates of the mesh faces' mass centers.
         """
-        return self.meshkernel.mesh2d_get().face_x
+        if self._is_read_lazily("mesh2d_face_x"):
+            return self._lazy_variables.read("mesh2d_face_x")  # type: ignore[union-attr]
+        return self.get_mesh2d().face_x
 
     @property
     def mesh2d_face_y(self) -> np.ndarray[float]:
@@ -130,7 +435,9 @@ class Mesh2d(BaseModel):
         Returns:
             ndarray[float]: A 1D double array describing y-coordinates of the mesh faces' mass centers.
         """
-        return self.meshkernel.mesh2d_get().face_y
+        if self._is_read_lazily("mesh2d_face_y"):
+            return self._lazy_variables.read("mesh2d_face_y")  # type: ignore[union-attr]
+        return self.get_mesh2d().face_y
 
     @property
     def mesh2d_face_nodes(self) -> np.ndarray[int, int]:
@@ -139,7 +446,9 @@ class Mesh2d(BaseModel):
         Returns:
             np.ndarray[int, int]: A 2D integer array describing the nodes composing each mesh 2d face. A 2D integer array (nFaces, maxNodesPerFace) containg the node indices for each face.
         """
-        mesh2d_output = self.meshkernel.mesh2d_get()
+        if self._is_read_lazily("mesh2d_face_nodes"):
+            return self._lazy_variables.read("mesh2d_face_nodes")  # type: ignore[union-attr]
+        mesh2d_output = self.get_mesh2d()
         npf = mesh2d_output.nodes_per_face
         if self.is_empty():
             return np.empty((0, 0), dtype=np.int32)
@@ -158,18 +467,194 @@ class Mesh2d(BaseModel):
         Returns:
             (bool): Whether this Mesh2d is empty.
         """
+        if self._is_read_lazily("mesh2d_node_x"):
+            return self._lazy_variables.size("mesh2d_node_x") == 0  # type: ignore[union-attr]
         return self.mesh2d_node_x.size == 0
 
+    @property
+    def bounds(self) -> Tuple[float, float, float, float]:
+        """The bounding box of the mesh nodes.
+
+        For a lazily read Mesh2d, the node coordinates are read from the file in chunks.
+
+        Raises:
+            ValueError: When the mesh has no nodes.
+
+        Returns:
+            Tuple[float, float, float, float]: The bounds (xmin, ymin, xmax, ymax).
+        """
+        xmin, xmax = self._get_value_range("mesh2d_node_x")
+        ymin, ymax = self._get_value_range("mesh2d_node_y")
+        return xmin, ymin, xmax, ymax
+
+    def get_values(
+        self, name: str, start: Optional[int] = None, stop: Optional[int] = None
+    ) -> np.ndarray:
+        """Get the values of one of the mesh arrays within an index range.
+
+        For a lazily read Mesh2d, only the values within the range are read from the file.
+
+        Args:
+            name (str): The name of the array, e.g. "mesh2d_face_nodes".
+            start (Optional[int], optional): The first index. Defaults to None, i.e. 0.
+            stop (Optional[int], optional):
+                The index after the last index. Defaults to None, i.e. the size.
+
+        Raises:
+            ValueError: When name is not one of the mesh arrays.
+
+        Returns:
+            np.ndarray: The values, or rows for two dimensional arrays, within the range.
+        """
+        if name not in _MESH2D_ARRAYS:
+            raise ValueError(f'"{name}" is not one of the mesh2d arrays.')
+        if self._is_read_lazily(name) and name not in self.__dict__:
+            return self._lazy_variables.read(name, start, stop)  # type: ignore[union-attr]
+        return getattr(self, name)[start:stop]
+
+    def _get_value_range(self, name: str) -> Tuple[float, float]:
+        minima, maxima = [], []
+        for values in self._iter_value_chunks(name):
+            minima.append(values.min())
+            maxima.append(values.max())
+        return float(min(minima)), float(max(maxima))
+
+    def _iter_value_chunks(self, name: str) -> Iterator[np.ndarray]:
+        """Iterate over the values of one of the mesh arrays in consecutive chunks.
+
+        Only arrays that are still to be read from the file are read in multiple
+        chunks; other arrays are yielded at once.
+        """
+        if not self._is_read_lazily(name) or name in self.__dict__:
+            yield getattr(self, name)
+            return
+
+        size = self._lazy_variables.size(name)  # type: ignore[union-attr]
+        for start in range(0, size, _READ_CHUNK_SIZE):
+            yield self.get_values(name, start, start + _READ_CHUNK_SIZE)
+
+    def _subset_to(
+        self, target: Mesh2d, in_region: Callable[[np.ndarray, np.ndarray], np.ndarray]
+    ) -> np.ndarray:
+        """Set the part of this mesh that intersects a region on the target mesh.
+
+        The faces and edges with at least one node in the region are selected,
+        together with all of their nodes, and the edges between the selected nodes.
+
+        Args:
+            target (Mesh2d): The empty mesh on which the selected part is set.
+            in_region (Callable[[np.ndarray, np.ndarray], np.ndarray]):
+                Function that determines which of the x, y points are in the region.
+
+        Returns:
+            np.ndarray: The index of each face of this mesh in the target mesh,
+                -1 for faces that are not selected.
+        """
+        if self.is_empty():
+            return np.empty(0, dtype=np.int64)
+
+        node_x = self.mesh2d_node_x
+        node_y = self.mesh2d_node_y
+        node_inside = in_region(node_x, node_y)
+        node_selected = np.zeros(node_x.size, dtype=bool)
+
+        face_selected_chunks = []
+        selected_face_nodes_chunks = []
+        for face_nodes in self._iter_value_chunks("mesh2d_face_nodes"):
+            valid = face_nodes >= 0
+            face_selected = (node_inside[np.where(valid, face_nodes, 0)] & valid).any(
+                axis=1
+            )
+            selected_face_nodes = face_nodes[face_selected]
+            node_selected[selected_face_nodes[selected_face_nodes >= 0]] = True
+            face_selected_chunks.append(face_selected)
+            selected_face_nodes_chunks.append(selected_face_nodes)
+
+        for edge_nodes in self._iter_value_chunks("mesh2d_edge_nodes"):
+            node_selected[edge_nodes[node_inside[edge_nodes].any(axis=1)]] = True
+        node_index = _renumber(node_selected)
+        selected_edge_nodes = np.concatenate(
+            [np.empty((0, 2), dtype=np.int32)]
+            + [
+                node_index[edge_nodes[node_selected[edge_nodes].all(axis=1)]]
+                for edge_nodes in self._iter_value_chunks("mesh2d_edge_nodes")
+            ]
+        )
+
+        target._set_mesh2d(
+            node_x=node_x[node_selected],
+            node_y=node_y[node_selected],
+            edge_nodes=selected_edge_nodes,
+        )
+        if self.mesh2d_node_z.size == node_x.size:
+            target.mesh2d_node_z = self.mesh2d_node_z[node_selected]
+
+        # The meshkernel determines the faces of the target mesh itself, so the
+        # selected faces are matched to them by their (renumbered) nodes.
+        if not face_selected_chunks:
+            return np.empty(0, dtype=np.int64)
+        face_selected = np.concatenate(face_selected_chunks)
+        selected_face_nodes = np.concatenate(selected_face_nodes_chunks)
+        selected_face_nodes = np.where(
+            selected_face_nodes >= 0,
+            node_index[np.maximum(selected_face_nodes, 0)],
+            -1,
+        )
+        target_face_index = _match_faces(selected_face_nodes, target.mesh2d_face_nodes)
+        face_index = np.full(face_selected.size, -1, dtype=np.int64)
+        face_index[face_selected] = target_face_index
+
+        face_z = self.mesh2d_face_z
+        if face_z.size == face_selected.size:
+            target_face_z = np.full(target.mesh2d_face_x.size, np.nan)
+            matched = face_index >= 0
+            target_face_z[face_index[matched]] = face_z[matched]
+            target.mesh2d_face_z = target_face_z
+
+        return face_index
+
+    def _tracked_arrays(self) -> Tuple[str, ...]:
+        return _MESH2D_ARRAYS
+
+    def _is_read_lazily(self, name: str) -> bool:
+        return self._lazy_variables is not None and name in self._lazy_variables
+
+    def _set_lazy_variables(self, variables: LazyUgridVariables) -> None:
+        """Read the arrays of this Mesh2d from the variables on demand."""
+        self._lazy_variables = variables
+        for field in _LAZY_MESH2D_FIELDS:
+            if field in variables:
+                self.__dict__.pop(field, None)
+
+    def _ensure_loaded(self) -> None:
+        """Set the mesh2d on the meshkernel if this Mesh2d has been read lazily and has not been loaded yet."""
+        if self._lazy_variables is None:
+            return
+
+        for field in _LAZY_MESH2D_FIELDS:
+            getattr(self, field)
+        self._set_mesh2d(
+            node_x=self.mesh2d_node_x,
+            node_y=self.mesh2d_node_y,
+            edge_nodes=self.mesh2d_edge_nodes,
+        )
+
     def read_file(self, file_path: Path) -> None:
         """Read the Mesh2d from the file at file_path.
 
         Args:
             file_path (Path): Path to the file to be read.
         """
-        reader = UgridReader(file_path)
-        reader.read_mesh2d(self)
+        with UgridReader(file_path) as reader:
+            reader.read_mesh2d(self)
 
     def _set_mesh2d(self, node_x, node_y, edge_nodes) -> None:
+        if self._lazy_variables is not None:
+            # The lazily read mesh is replaced, including the bathymetry that has not been read.
+            self._lazy_variables = None
+            for field in _LAZY_MESH2D_FIELDS:
+                self.__dict__.setdefault(field, np.empty(0, dtype=np.double))
+
         mesh2d = mk.Mesh2d(
             node_x=node_x.astype(np.float64),
             node_y=node_y.astype(np.float64),
@@ -184,6 +669,7 @@ class Mesh2d(BaseModel):
         Returns:
             (mk.Mesh2d): The mesh2d as represented in the MeshKernel
         """
+        self._ensure_loaded()
         return self.meshkernel.mesh2d_get()
 
     def create_rectilinear(self, extent: tuple, dx: float, dy: float) -> None:
@@ -211,9 +697,11 @@ class Mesh2d(BaseModel):
             block_size_y=dy,
         )
 
+        self._ensure_loaded()
         mesh2d_input = self.meshkernel  # mk.MeshKernel()
         mesh2d_input.curvilinear_compute_rectangular_grid(params)
         mesh2d_input.curvilinear_convert_to_mesh2d()  # convert to ugrid/mesh2d
+        self.mark_modified()
 
     def create_triangular(self, geometry_list: mk.GeometryList) -> None:
         """Create triangular grid within GeometryList object.
@@ -222,7 +710,9 @@ class Mesh2d(BaseModel):
             geometry_list (mk.GeometryList): GeometryList represeting a polygon within which the mesh is generated.
         """
         # Call meshkernel
+        self._ensure_loaded()
         self.meshkernel.mesh2d_make_triangular_mesh_from_polygon(geometry_list)
+        self.mark_modified()
 
     def clip(
         self,
@@ -251,14 +741,7 @@ class Mesh2d(BaseModel):
             interiors = parts[1:]
 
             # Check if parts are closed
-            for part in exteriors + interiors:
-                if (part.x_coordinates[0], part.y_coordinates[0]) != (
-                    part.x_coordinates[-1],
-                    part.y_coordinates[-1],
-                ):
-                    raise ValueError(
-                        "First and last coordinate of each GeometryList part should match."
-                    )
+            _check_closed(exteriors + interiors)
 
         # Inside
         else:
@@ -267,6 +750,7 @@ class Mesh2d(BaseModel):
             exteriors = parts[:]
             interiors = []
 
+        self._ensure_loaded()
         # Delete everything outside the (Multi)Polygon
         for exterior in exteriors:
             self.meshkernel.mesh2d_delete(
@@ -282,6 +766,7 @@ class Mesh2d(BaseModel):
                 delete_option=deletemeshoption,
                 invert_deletion=inside,
             )
+        self.mark_modified()
 
     def refine(
         self,
@@ -310,7 +795,175 @@ class Mesh2d(BaseModel):
                 directional_refinement=False,
             )
         parameters.max_refinement_iterations = level
+        self._ensure_loaded()
         self.meshkernel.mesh2d_refine_based_on_polygon(polygon, parameters)
+        self.mark_modified()
+
+    def clip_by_polygons(
+        self,
+        polygons: Iterable[mk.GeometryList],
+        deletemeshoption: mk.DeleteMeshOption = mk.DeleteMeshOption.INSIDE_NOT_INTERSECTED,
+        inside: bool = False,
+    ) -> PolygonBatchStatistics:
+        """Clip the 2D mesh by many polygons with as few meshkernel calls as possible.
+
+        Polygons with a bounding box that does not intersect the mesh are skipped.
+        The other polygons are combined into layers of polygons that do not overlap,
+        and each layer is deleted in a single meshkernel call.
+
+        When clipping inside, the mesh inside any of the polygons is deleted. The
+        result is the same as clipping inside each of the polygons in turn with `clip`.
+
+        When clipping outside, the mesh outside the union of all exteriors is deleted
+        in a single call, after which the interiors (holes) of all polygons are
+        deleted. The mesh inside any of the exteriors is thus kept, unless it is in
+        one of the holes. Note that this differs from clipping outside each of the
+        polygons in turn, which would only keep the mesh inside all of them. As with
+        `clip`, each exterior and interior should be closed.
+
+        Args:
+            polygons (Iterable[mk.GeometryList]):
+                The polygons, each of which may consist of multiple polygons with holes.
+            deletemeshoption (mk.DeleteMeshOption, optional):
+                The option to determine which part of the mesh is deleted.
+                Defaults to INSIDE_NOT_INTERSECTED.
+            inside (bool, optional):
+                Whether to delete the mesh inside (True) or outside (False) the
+                polygons. Defaults to False, as for `clip`.
+
+        Raises:
+            ValueError: When clipping outside, and an exterior or interior is not closed.
+
+        Returns:
+            PolygonBatchStatistics: The number of polygons and calls, and the timings.
+        """
+        statistics = PolygonBatchStatistics()
+        start = time.perf_counter()
+        exteriors: List[mk.GeometryList] = []
+        interiors: List[mk.GeometryList] = []
+        for geometrylist in polygons:
+            for polygon in split_by(geometrylist, geometrylist.geometry_separator):
+                if inside:
+                    exteriors.append(polygon)
+                else:
+                    parts = split_by(polygon, polygon.inner_outer_separator)
+                    _check_closed(parts)
+                    exteriors.append(parts[0])
+                    interiors.extend(parts[1:])
+        statistics.number_of_polygons = len(exteriors)
+        statistics.timings["split"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        selected_exteriors = self._select_polygons_in_bounds(exteriors)
+        selected_interiors = self._select_polygons_in_bounds(interiors)
+        statistics.number_of_selected_polygons = len(selected_exteriors)
+        statistics.timings["prefilter"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        if inside:
+            deletions = [
+                (polygon, False) for polygon in self._join_layers(selected_exteriors)
+            ]
+        else:
+            deletions = [
+                (polygon, False) for polygon in self._join_layers(selected_interiors)
+            ]
+            if exteriors:
+                # The mesh outside all exteriors is deleted, also if none intersect it
+                outside = _join_polygons(selected_exteriors or exteriors)
+                deletions.insert(0, (outside, True))
+        statistics.timings["group"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        self._ensure_loaded()
+        for polygon, invert_deletion in deletions:
+            self.meshkernel.mesh2d_delete(
+                geometry_list=polygon,
+                delete_option=deletemeshoption,
+                invert_deletion=invert_deletion,
+            )
+        statistics.number_of_meshkernel_calls = len(deletions)
+        if deletions:
+            self.mark_modified()
+        statistics.timings["meshkernel"] = time.perf_counter() - start
+
+        statistics._log("Clip")
+        return statistics
+
+    def refine_by_polygons(
+        self,
+        polygons: Iterable[mk.GeometryList],
+        level: int,
+        parameters: mk.MeshRefinementParameters = None,
+    ) -> PolygonBatchStatistics:
+        """Refine the mesh within many polygons in a single meshkernel call.
+
+        Polygons with a bounding box that does not intersect the mesh are skipped.
+        Unlike refining by each of the polygons with `refine`, the mesh where polygons
+        overlap is refined by the given level only once.
+
+        Args:
+            polygons (Iterable[mk.GeometryList]): The polygons in which to refine.
+            level (int): Number of refinement steps.
+            parameters (MeshRefinementParameters, optional):
+                The meshkernel refinement parameters, see `refine`.
+
+        Returns:
+            PolygonBatchStatistics: The number of polygons and calls, and the timings.
+        """
+        statistics = PolygonBatchStatistics()
+        start = time.perf_counter()
+        polygons = [
+            polygon
+            for geometrylist in polygons
+            for polygon in split_by(geometrylist, geometrylist.geometry_separator)
+        ]
+        statistics.number_of_polygons = len(polygons)
+        statistics.timings["split"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        polygons = self._select_polygons_in_bounds(polygons)
+        statistics.number_of_selected_polygons = len(polygons)
+        statistics.timings["prefilter"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        if polygons:
+            self.refine(_join_polygons(polygons), level, parameters)
+            statistics.number_of_meshkernel_calls = 1
+        statistics.timings["meshkernel"] = time.perf_counter() - start
+
+        statistics._log("Refinement")
+        return statistics
+
+    def _select_polygons_in_bounds(
+        self, polygons: List[mk.GeometryList]
+    ) -> List[mk.GeometryList]:
+        """Select the polygons with a bounding box that intersects the mesh bounds."""
+        if not polygons or self.is_empty():
+            return []
+
+        xmin, ymin, xmax, ymax = self.bounds
+        bounds = np.array([_polygon_bounds(polygon) for polygon in polygons])
+        intersects = (
+            (bounds[:, 0] <= xmax)
+            & (bounds[:, 2] >= xmin)
+            & (bounds[:, 1] <= ymax)
+            & (bounds[:, 3] >= ymin)
+        )
+        return [polygons[i] for i in np.flatnonzero(intersects)]
+
+    @staticmethod
+    def _join_layers(polygons: List[mk.GeometryList]) -> List[mk.GeometryList]:
+        """Join the polygons into one GeometryList per layer of non-overlapping polygons."""
+        if not polygons:
+            return []
+
+        bounds = np.array([_polygon_bounds(polygon) for polygon in polygons])
+        layers = _overlap_layers(bounds)
+        return [
+            _join_polygons([polygons[i] for i in np.flatnonzero(layers == layer)])
+            for layer in range(layers.max() + 1)
+        ]
 
 
 class Branch:
@@ -321,6 +974,9 @@ class Branch:
         geometry: np.ndarray,
         branch_offsets: np.ndarray = None,
         mask: np.ndarray = None,
+        *,
+        distance: Optional[np.ndarray] = None,
+        node_xy: Optional[np.ndarray] = None,
     ) -> None:
         """Initialize a Branch with geometry and optional node offsets and mask.
 
@@ -328,6 +984,10 @@ class Branch:
             geometry (np.ndarray): Array of (x, y) coordinates defining the branch shape.
             branch_offsets (np.ndarray): Chainage offsets along the branch for mesh nodes.
             mask (np.ndarray): Boolean mask indicating which nodes to exclude.
+            distance (Optional[np.ndarray]): The precomputed distance of each
+                geometry point along the branch. Computed from the geometry if None.
+            node_xy (Optional[np.ndarray]): The precomputed (x, y) coordinates of the
+                mesh nodes at the branch offsets. Interpolated if None.
         """
         # Check that the array has two collumns (x and y)
         assert geometry.shape[1] == 2
@@ -338,11 +998,13 @@ class Branch:
         self._y_coordinates = geometry[:, 1]
 
         # Calculate distance of coordinates along line
-        segment_distances = np.hypot(
-            np.diff(self._x_coordinates), np.diff(self._y_coordinates)
-        )
-        self._distance = np.concatenate([[0], np.cumsum(segment_distances)])
-        self.length = segment_distances.sum()
+        if distance is None:
+            segment_distances = np.hypot(
+                np.diff(self._x_coordinates), np.diff(self._y_coordinates)
+            )
+            distance = np.concatenate([[0], np.cumsum(segment_distances)])
+        self._distance = distance
+        self.length = self._distance[-1]
 
         # Check if mask and branch offsets (if both given) have same shape
         if (
@@ -356,7 +1018,9 @@ class Branch:
         self.branch_offsets = branch_offsets
         # Calculate node positions
         if branch_offsets is not None:
-            self.node_xy = self.interpolate(branch_offsets)
+            self.node_xy = (
+                self.interpolate(branch_offsets) if node_xy is None else node_xy
+            )
 
         # Set which of the nodes are present
         if (mask is None) and (branch_offsets is not None):
@@ -364,6 +1028,42 @@ class Branch:
         else:
             self.mask = mask
 
+    @classmethod
+    def from_discretization(cls, discretization: BranchDiscretization) -> List[Branch]:
+        """Create the branches of a discretization of many branches.
+
+        Args:
+            discretization (BranchDiscretization):
+                The discretization, see `discretize_branches`.
+
+        Returns:
+            List[Branch]: A branch with the geometry and mesh nodes of each branch.
+        """
+        geometry = np.column_stack(
+            [discretization.geometry_x, discretization.geometry_y]
+        )
+        node_xy = np.column_stack([discretization.node_x, discretization.node_y])
+        geometry_end = np.cumsum(discretization.part_node_count)
+        node_end = np.cumsum(discretization.node_count)
+
+        branches = []
+        for i in range(len(discretization.length)):
+            geometry_slice = slice(
+                geometry_end[i] - discretization.part_node_count[i], geometry_end[i]
+            )
+            node_slice = slice(node_end[i] - discretization.node_count[i], node_end[i])
+
+            # The distances and node positions are already known, so they are
+            # passed instead of being computed again.
+            branch = cls(
+                geometry[geometry_slice],
+                discretization.offsets[node_slice],
+                distance=discretization.geometry_distance[geometry_slice],
+                node_xy=node_xy[node_slice],
+            )
+            branches.append(branch)
+        return branches
+
     def generate_nodes(
         self,
         mesh1d_edge_length: float,
@@ -532,25 +1232,12 @@ class Branch:
         anchor_pts: List[float], mesh1d_edge_length: float
     ) -> np.ndarray:
         """Generates 1d distances, called by function generate offsets."""
-        offsets = []
-        # Loop through anchor point pairs
-        for i in range(len(anchor_pts) - 1):
-            # Determine section length between anchor point
-            section_length = anchor_pts[i + 1] - anchor_pts[i]
-            if section_length <= 0.0:
-                raise ValueError("Section length must be larger than 0.0")
-            # Determine number of nodes
-            nnodes = max(2, int(round(section_length / mesh1d_edge_length) + 1)) - 1
-            # Add nodes
-            offsets.extend(
-                np.linspace(
-                    anchor_pts[i], anchor_pts[i + 1], nnodes, endpoint=False
-                ).tolist()
-            )
-        # Add last node
-        offsets.append(anchor_pts[-1])
-
-        return np.asarray(offsets)
+        offsets, _ = spacing_from_anchors(
+            np.asarray(anchor_pts, dtype=np.float64),
+            np.array([len(anchor_pts)]),
+            mesh1d_edge_length,
+        )
+        return offsets
 
     def interpolate(self, distance: npt.ArrayLike) -> np.ndarray:
         """Interpolate coordinates along branch by length.
@@ -569,9 +1256,39 @@ class Branch:
         return intpcoords
 
 
-class Link1d2d(BaseModel):
+class Link1d2dType(StrEnum):
+    """The ways in which 1D2D links can be generated."""
+
+    FROM_1D_TO_2D = "1d_to_2d"
+    "Each mesh1d node is linked to the mesh2d face it is in, or the face it is projected on."
+
+    EMBEDDED = "2d_to_1d_embedded"
+    "The mesh1d nodes are linked to the mesh2d faces that contain them."
+
+    LATERAL = "2d_to_1d_lateral"
+    "The mesh1d nodes are linked to the closest mesh2d faces at the mesh boundary."
+
+
+class BranchGroupLinks(BaseModel):
+    """The 1D2D links to generate for a group of branches, see `Network.link1d2d_from_branch_groups`."""
+
+    branchids: Optional[List[str]] = None
+    "The ids of the branches of which the mesh1d nodes are linked. Defaults to None, i.e. all branches."
+
+    link_type: Link1d2dType = Link1d2dType.FROM_1D_TO_2D
+    "The way in which the links are generated. Defaults to FROM_1D_TO_2D."
+
+    polygon: Optional[mk.GeometryList] = None
+    "The area within which the mesh2d side of the links is. Defaults to None, i.e. the whole mesh2d."
+
+
+class Link1d2d(_ModificationTracker):
     """Link1d2d defines the 1D2D Links of a model network.
 
+    The links are read from the meshkernel once and cached until they are modified.
+    When the contacts of the meshkernel are changed directly, call `mark_modified`
+    to clear the cached links.
+
     Attributes:
         meshkernel (Optional[mk.MeshKernel]):
             The MeshKernel used to interact with this Link1d2d
@@ -587,29 +1304,68 @@ class Link1d2d(BaseModel):
 
     meshkernel: mk.MeshKernel = Field(default_factory=mk.MeshKernel)
 
+    _contacts: Optional[mk.Contacts] = PrivateAttr(default=None)
+    _arrays: Dict[str, np.ndarray] = PrivateAttr(default_factory=dict)
+
     @property
     def link1d2d(self) -> np.ndarray[np.int32]:
-        contacts = self.meshkernel.contacts_get()
-        link1d2d_arr = np.stack(
-            [contacts.mesh1d_indices, contacts.mesh2d_indices], axis=1
-        )
-        return link1d2d_arr
+        if "link1d2d" not in self._arrays:
+            contacts = self._get_contacts()
+            self._arrays["link1d2d"] = np.stack(
+                [contacts.mesh1d_indices, contacts.mesh2d_indices], axis=1
+            )
+        return self._arrays["link1d2d"]
 
     @property
     def link1d2d_contact_type(self) -> np.ndarray[np.int32]:
-        contacts = self.meshkernel.contacts_get()
+        contacts = self._get_contacts()
         link1d2d_contact_type_arr = np.full(contacts.mesh1d_indices.size, 3)
         return link1d2d_contact_type_arr
 
     @property
-    def link1d2d_id(self) -> np.ndarray[object]:
-        link1d2d_id_arr = np.array([f"{n1d:d}_{f2d:d}" for n1d, f2d in self.link1d2d])
-        return link1d2d_id_arr
+    def link1d2d_id(self) -> np.ndarray[str]:
+        if "link1d2d_id" not in self._arrays:
+            contacts = self._get_contacts()
+            self._arrays["link1d2d_id"] = np.strings.add(
+                np.strings.add(contacts.mesh1d_indices.astype(str), "_"),
+                contacts.mesh2d_indices.astype(str),
+            )
+        return self._arrays["link1d2d_id"]
 
     @property
-    def link1d2d_long_name(self) -> np.ndarray[object]:
-        link1d2d_id_arr = np.array([f"{n1d:d}_{f2d:d}" for n1d, f2d in self.link1d2d])
-        return link1d2d_id_arr
+    def link1d2d_long_name(self) -> np.ndarray[str]:
+        return self.link1d2d_id
+
+    def mark_modified(self, *names: str) -> None:
+        self._clear_contacts()
+        super().mark_modified(*names)
+
+    def _get_contacts(self) -> mk.Contacts:
+        """Get the contacts of the meshkernel, which are cached until the links are modified.
+
+        Returns:
+            mk.Contacts: The contacts of the meshkernel.
+        """
+        if self._contacts is None:
+            self._contacts = self.meshkernel.contacts_get()
+        return self._contacts
+
+    def _set_contacts(self, contacts: mk.Contacts) -> None:
+        """Set the contacts on the meshkernel and cache them.
+
+        Args:
+            contacts (mk.Contacts): The contacts to set.
+        """
+        self.meshkernel.contacts_set(contacts)
+        self._clear_contacts()
+        self._contacts = contacts
+
+    def _clear_contacts(self) -> None:
+        self._contacts = None
+        self._arrays.clear()
+
+    def _tracked_arrays(self) -> Tuple[str, ...]:
+        return _LINK1D2D_ARRAYS
 
     def is_empty(self) -> bool:
         """Whether this Link1d2d is currently empty.
@@ -625,8 +1381,8 @@ class Link1d2d(BaseModel):
         Args:
             file_path (Path): Path to the netCDF file.
         """
-        reader = UgridReader(file_path)
-        reader.read_link1d2d(self)
+        with UgridReader(file_path) as reader:
+            reader.read_link1d2d(self)
 
     def clear(self) -> None:
         """Remove all saved links from the links administration."""
@@ -637,8 +1393,81 @@ class Link1d2d(BaseModel):
         # The meshkernel object needs to be resetted
         self.meshkernel._deallocate_state()
         self.meshkernel._allocate_state(self.meshkernel.get_projection())
+        self._clear_contacts()
         self.meshkernel.contacts_get()
 
+    def _subset_to(
+        self,
+        target: Link1d2d,
+        mesh1d_node_index: np.ndarray,
+        mesh2d_face_index: np.ndarray,
+    ) -> None:
+        """Set the links between the selected mesh1d nodes and mesh2d faces on the target.
+
+        Args:
+            target (Link1d2d): The empty links on which the selected links are set.
+            mesh1d_node_index (np.ndarray):
+                The new index of each mesh1d node, -1 for nodes that are not selected.
+            mesh2d_face_index (np.ndarray):
+                The new index of each mesh2d face, -1 for faces that are not selected.
+        """
+        links = self.link1d2d
+        if (
+            links.size == 0
+            or mesh1d_node_index.size == 0
+            or mesh2d_face_index.size == 0
+        ):
+            return
+
+        mesh1d_indices = mesh1d_node_index[links[:, 0]]
+        mesh2d_indices = mesh2d_face_index[links[:, 1]]
+        selected = (mesh1d_indices >= 0) & (mesh2d_indices >= 0)
+        contacts = mk.Contacts(
+            mesh1d_indices=mesh1d_indices[selected].astype(np.int32),
+            mesh2d_indices=mesh2d_indices[selected].astype(np.int32),
+        )
+        target._set_contacts(contacts)
+
+    def _link_by_type(
+        self,
+        links: List[Tuple[Link1d2dType, np.ndarray, mk.GeometryList]],
+        search_radius: float,
+    ) -> None:
+        """Replace the links by the links of each link type, node mask and polygon.
+
+        Args:
+            links (List[Tuple[Link1d2dType, np.ndarray, mk.GeometryList]]):
+                The link type, the mesh1d nodes to link and the area within which
+                the mesh2d side of the links is, for each meshkernel call.
+            search_radius (float): The search radius of the lateral links.
+        """
+        mesh1d_indices = [np.empty(0, dtype=np.int32)]
+        mesh2d_indices = [np.empty(0, dtype=np.int32)]
+        for link_type, node_mask, polygon in links:
+            if link_type == Link1d2dType.FROM_1D_TO_2D:
+                self._link_from_1d_to_2d(node_mask, polygon=polygon)
+            elif link_type == Link1d2dType.EMBEDDED:
+                self._link_from_2d_to_1d_embedded(node_mask, polygon)
+            else:
+                self._link_from_2d_to_1d_lateral(
+                    node_mask, polygon=polygon, search_radius=search_radius
+                )
+            # Each meshkernel call replaces the contacts of the previous call
+            contacts = self.meshkernel.contacts_get()
+            mesh1d_indices.append(contacts.mesh1d_indices)
+            mesh2d_indices.append(contacts.mesh2d_indices)
+
+        self.mark_modified()
+        if len(links) == 1:
+            self._contacts = contacts
+        else:
+            self._set_contacts(
+                mk.Contacts(
+                    mesh1d_indices=np.concatenate(mesh1d_indices).astype(np.int32),
+                    mesh2d_indices=np.concatenate(mesh2d_indices).astype(np.int32),
+                )
+            )
+
     def _link_from_1d_to_2d(
         self, node_mask: np.ndarray, polygon: mk.GeometryList = None
     ):
@@ -659,6 +1488,7 @@ class Link1d2d(BaseModel):
         self.meshkernel.contacts_compute_single(
             node_mask=node_mask, polygons=polygon, projection_factor=1.0
         )
+        self.mark_modified()
 
         # Note that the function "contacts_compute_multiple" also computes the connections, but does not take into account
         # a bounding polygon or the end points of the 1d mesh.
@@ -670,6 +1500,7 @@ class Link1d2d(BaseModel):
         self.meshkernel.contacts_compute_with_points(
             node_mask=node_mask, polygons=polygons
         )
+        self.mark_modified()
 
     def _link_from_2d_to_1d_lateral(
         self,
@@ -684,15 +1515,185 @@ class Link1d2d(BaseModel):
         self.meshkernel.contacts_compute_boundary(
             node_mask=node_mask, polygons=polygon, search_radius=search_radius
         )
+        self.mark_modified()
+
+
+# The value by which the meshkernel determines an argument itself
+_MISSING_VALUE = -999.0
+
+_LINK1D2D_ARRAYS = (
+    "link1d2d",
+    "link1d2d_id",
+    "link1d2d_long_name",
+    "link1d2d_contact_type",
+)
+
+_MESH1D_APPENDED_FIELDS = (
+    "network1d_node_id",
+    "network1d_node_long_name",
+    "network1d_branch_id",
+    "network1d_branch_long_name",
+    "network1d_branch_length",
+    "network1d_branch_order",
+    "network1d_edge_nodes",
+    "network1d_geom_x",
+    "network1d_geom_y",
+    "network1d_part_node_count",
+    "mesh1d_node_id",
+    "mesh1d_node_long_name",
+    "mesh1d_node_branch_id",
+    "mesh1d_node_branch_offset",
+    "mesh1d_edge_nodes",
+    "mesh1d_edge_x",
+    "mesh1d_edge_y",
+    "mesh1d_edge_branch_id",
+    "mesh1d_edge_branch_offset",
+)
+
+
+class _GrowableArray:
+    """A one-dimensional float array with amortized constant-time appends."""
+
+    def __init__(self, array: np.ndarray) -> None:
+        self._size = len(array)
+        self._data = np.array(array, dtype=np.result_type(array.dtype, np.float64))
+
+    @property
+    def array(self) -> np.ndarray:
+        """The values of this array, as a view on the underlying buffer."""
+        return self._data[: self._size]
+
+    def append(self, value: float) -> None:
+        self.extend([value])
+
+    def extend(self, values: npt.ArrayLike) -> None:
+        values = np.asarray(values)
+        size = self._size + len(values)
+        if size > len(self._data):
+            data = np.empty(max(size, 2 * len(self._data), 16), dtype=self._data.dtype)
+            data[: self._size] = self._data[: self._size]
+            self._data = data
+        self._data[self._size : size] = values
+        self._size = size
+
+
+def _group_by_branch(
+    branch_ids: np.ndarray, nbranches: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Group the positions of nodes or edges by the index of their branch.
+
+    Args:
+        branch_ids (np.ndarray): The branch index of each node or edge.
+        nbranches (int): The number of branches.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The positions sorted by branch index, with
+            the original order kept within a branch, and the nbranches + 1 bounds
+            such that the positions of branch i are order[bounds[i]:bounds[i + 1]].
+    """
+    order = np.argsort(branch_ids, kind="stable")
+    bounds = np.searchsorted(branch_ids[order], np.arange(nbranches + 1))
+    return order, bounds
+
+
+class _NodeIndex:
+    """Spatial hash of node coordinates, to find the node at a position in constant average time.
+
+    The plane is divided in square cells with the size of the snapping tolerance,
+    such that all nodes within the tolerance of a position are in the cell of that
+    position or in one of its eight neighbouring cells.
+    """
+
+    def __init__(self, tolerance: float) -> None:
+        self._tolerance = tolerance
+        self._x: List[float] = []
+        self._y: List[float] = []
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        self._source: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    def is_index_of(self, x: np.ndarray, y: np.ndarray, tolerance: float) -> bool:
+        """Whether this index contains exactly the nodes of the coordinate arrays."""
+        return (
+            self._source is not None
+            and self._source[0] is x
+            and self._source[1] is y
+            and len(self._x) == len(x) == len(y)
+            and self._tolerance == tolerance
+        )
+
+    def bind(self, x: np.ndarray, y: np.ndarray) -> None:
+        """Register the coordinate arrays that contain the nodes of this index."""
+        self._source = (x, y)
+
+    def add(self, x: float, y: float) -> None:
+        self._cells.setdefault(self._cell(x, y), []).append(len(self._x))
+        self._x.append(x)
+        self._y.append(y)
+
+    def extend(self, x: npt.ArrayLike, y: npt.ArrayLike) -> None:
+        for node_x, node_y in zip(np.asarray(x).tolist(), np.asarray(y).tolist()):
+            self.add(node_x, node_y)
+
+    def find(self, x: float, y: float) -> Union[np.int32, None]:
+        """Determine the position (index) of the node at the x, y coordinate.
 
+        A node is at the coordinate if both its x and y coordinate differ at most
+        the tolerance. If multiple nodes are found, the nearest one is returned.
 
-class Mesh1d(BaseModel):
+        Args:
+            x (float): x-coordinate to be sought
+            y (float): y-coordinate to be sought
+
+        Raises:
+            ValueError: If multiple nodes are found at the same distance of the coordinate
+
+        Returns:
+            Union[np.int32, None]: The index of the node. None if not found
+        """
+        tolerance = self._tolerance
+        cell_x, cell_y = self._cell(x, y)
+        positions = []
+        for i in (cell_x - 1, cell_x, cell_x + 1):
+            for j in (cell_y - 1, cell_y, cell_y + 1):
+                for position in self._cells.get((i, j), ()):
+                    if (
+                        abs(self._x[position] - x) <= tolerance
+                        and abs(self._y[position] - y) <= tolerance
+                    ):
+                        positions.append(position)
+
+        if not positions:
+            return None
+        elif len(positions) == 1:
+            return np.int32(positions[0])
+        else:
+            # Find the nearest
+            pos = np.array(sorted(positions))
+            distance = np.hypot(
+                np.array([self._x[p] for p in pos]) - x,
+                np.array([self._y[p] for p in pos]) - y,
+            )
+            if np.unique(distance).size == 1:
+                raise ValueError("Multiple nodes were found at the same position.")
+            else:
+                return np.int32(pos[np.argmin(distance)])
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return math.floor(x / self._tolerance), math.floor(y / self._tolerance)
+
+
+class Mesh1d(_ModificationTracker):
     """Represents a 1D mesh network with branches, nodes, and edge connectivity."""
 
     meshkernel: mk.MeshKernel = Field(default_factory=mk.MeshKernel)
 
     branches: Dict[str, Branch] = {}
 
+    node_snapping_tolerance: float = Field(default=1e-8, gt=0.0)
+    """float: The maximum distance in x and y direction at which the end point of an added branch is connected to an existing node."""
+
+    _node_indices: Dict[str, _NodeIndex] = PrivateAttr(default_factory=dict)
+
     network1d_node_id: np.ndarray = Field(default_factory=lambda: np.empty(0, object))
     network1d_node_long_name: np.ndarray = Field(
         default_factory=lambda: np.empty(0, object)
@@ -747,6 +1748,9 @@ class Mesh1d(BaseModel):
     def is_empty(self) -> bool:
         return self.mesh1d_node_x.size == 0
 
+    def _tracked_arrays(self) -> Tuple[str, ...]:
+        return _MESH1D_ARRAYS
+
     def _get_mesh1d(self) -> mk.Mesh1d:
         """Return mesh1d from meshkernel.
 
@@ -766,21 +1770,26 @@ class Mesh1d(BaseModel):
 
     def _process_network1d(self) -> None:
         """Determine x, y locations of mesh1d nodes based on the network1d."""
-        # Create a list of coordinates to create the branches from
-        ngeom = list(zip(self.network1d_geom_x, self.network1d_geom_y))
+        nbranches = len(self.network1d_branch_id)
+        # Start and end position of the geometry of each branch in the network geometry
+        geom_bounds = np.concatenate(
+            [[0], np.cumsum(self.network1d_part_node_count, dtype=np.int64)]
+        )
+        geometry_xy = np.stack([self.network1d_geom_x, self.network1d_geom_y], axis=1)
+        node_order, node_bounds = _group_by_branch(
+            self.mesh1d_node_branch_id, nbranches
+        )
+        branch_offsets_sorted = self.mesh1d_node_branch_offset[node_order]
 
         self.branches.clear()
 
-        for i, (name, nnodes) in enumerate(
-            zip(self.network1d_branch_id, self.network1d_part_node_count)
-        ):
+        for i, name in enumerate(self.network1d_branch_id):
 
             # Create network branch
             # Get geometry of branch from network geometry
-            geometry = np.array([ngeom.pop(0) for _ in range(nnodes)])
+            geometry = geometry_xy[geom_bounds[i] : geom_bounds[i + 1]]
             # Get branch offsets
-            idx = self.mesh1d_node_branch_id == i
-            branch_offsets = self.mesh1d_node_branch_offset[idx]
+            branch_offsets = branch_offsets_sorted[node_bounds[i] : node_bounds[i + 1]]
             mask = np.full(branch_offsets.shape, False)
 
             # Determine if a start or end coordinate needs to be added for constructing a complete branch
@@ -808,10 +1817,14 @@ class Mesh1d(BaseModel):
         self.mesh1d_node_y = node_y
 
         # Calculate edge coordinates
+        edge_order, edge_bounds = _group_by_branch(
+            self.mesh1d_edge_branch_id, nbranches
+        )
+        edge_offsets_sorted = self.mesh1d_edge_branch_offset[edge_order]
         edge_x, edge_y = np.vstack(
             [
                 branch.interpolate(
-                    self.mesh1d_edge_branch_offset[self.mesh1d_edge_branch_id == i]
+                    edge_offsets_sorted[edge_bounds[i] : edge_bounds[i + 1]]
                 )
                 for i, branch in enumerate(self.branches.values())
             ]
@@ -831,7 +1844,9 @@ class Mesh1d(BaseModel):
         Returns:
             Union[np.int32, None]: The index of the coordinate. None if not found
         """
-        return self._node_position(self.network1d_node_x, self.network1d_node_y, x, y)
+        return self._get_node_index(
+            "network1d", self.network1d_node_x, self.network1d_node_y
+        ).find(x, y)
 
     def _mesh1d_node_position(self, x: float, y: float) -> Union[np.int32, None]:
         """Determine the position (index) of a x, y coordinate in the mesh nodes.
@@ -843,37 +1858,58 @@ class Mesh1d(BaseModel):
         Returns:
             Union[np.int32, None]: The index of the coordinate. None if not found
         """
-        return self._node_position(self.mesh1d_node_x, self.mesh1d_node_y, x, y)
+        return self._get_node_index(
+            "mesh1d", self.mesh1d_node_x, self.mesh1d_node_y
+        ).find(x, y)
 
-    def _node_position(
-        self, arrx: np.ndarray, arry: np.ndarray, x: float, y: float
-    ) -> Union[np.int32, None]:
-        """Determine the position (index) of a x, y coordinate in a given x and y array.
+    def _get_node_index(self, name: str, x: np.ndarray, y: np.ndarray) -> _NodeIndex:
+        """Get the spatial index of the nodes with the x and y coordinates.
 
-        Args:
-            arrx (np.ndarray): x-coordinates in which the position is sought
-            arry (np.ndarray): y-coordiantes in which the position is sought
-            x (float): x-coordinate to be sought
-            y (float): y-coordinate to be sought
+        The index is cached and only rebuilt when the coordinate arrays have been
+        replaced, since the arrays are never modified in place.
+        """
+        index = self._node_indices.get(name)
+        if index is None or not index.is_index_of(x, y, self.node_snapping_tolerance):
+            index = _NodeIndex(self.node_snapping_tolerance)
+            index.extend(x, y)
+            index.bind(x, y)
+            self._node_indices[name] = index
+        return index
+
+    def add_branches(
+        self,
+        branches: List[Branch],
+        names: Optional[List[Optional[str]]] = None,
+        branch_orders: Optional[List[int]] = None,
+        long_names: Optional[List[Optional[str]]] = None,
+        force_midpoint: bool = True,
+    ) -> List[str]:
+        """Add multiple branches to mesh1d at once.
 
-        Raises:
-            ValueError: If multiple positions are found for the coordinate
+        The result is the same as adding the branches one by one, but the mesh
+        administration is only extended once and the meshkernel is only updated
+        once, after all branches are added. If one of the branches cannot be
+        added, none of the branches are added.
+
+        Args:
+            branches (List[Branch]): branches to add to the mesh1d
+            names (Optional[List[Optional[str]]]): ids of the branches, None to generate the id
+            branch_orders (Optional[List[int]]): interpolation orders of the branches, defaults to -1
+            long_names (Optional[List[Optional[str]]]): long names of the branches, None to use the id
+            force_midpoint (bool): argument to control if a midpoint will be forced on the branches, use False for pipes
 
         Returns:
-            Union[np.int32, None]: The index of the coordinate. None if not found
+            List[str]: names of the branches.
         """
-        pos = np.where(np.isclose(arrx, x, rtol=0.0) & np.isclose(arry, y, rtol=0.0))[0]
-        if pos.size == 0:
-            return None
-        elif pos.size == 1:
-            return np.int32(pos[0])
-        else:
-            # Find the nearest
-            distance = np.hypot(arrx[pos] - x, arry[pos] - y)
-            if np.unique(distance).size == 1:
-                raise ValueError("Multiple nodes were found at the same position.")
-            else:
-                return np.int32(pos[np.argmin(distance)])
+        names = self._add_branches(
+            branches,
+            names=names,
+            branch_orders=branch_orders,
+            long_names=long_names,
+            force_midpoint=force_midpoint,
+        )
+        self._set_mesh1d()
+        return names
 
     def _add_branch(
         self,
@@ -895,182 +1931,384 @@ class Mesh1d(BaseModel):
         Returns:
             Str: name of the branch.
         """
-        # Check if branch had coordinate discretization
-        if branch.branch_offsets.size == 0:
+        return self._add_branches(
+            [branch],
+            names=[name],
+            branch_orders=[branch_order],
+            long_names=[long_name],
+            force_midpoint=force_midpoint,
+        )[0]
+
+    def _add_branches(
+        self,
+        branches: List[Branch],
+        names: Optional[List[Optional[str]]] = None,
+        branch_orders: Optional[List[int]] = None,
+        long_names: Optional[List[Optional[str]]] = None,
+        force_midpoint: bool = True,
+    ) -> List[str]:
+        """Add the branches to mesh1d, without updating the meshkernel.
+
+        The new values of the administration arrays are collected per branch and
+        appended to the arrays once, after all branches are processed. The changes
+        to the branches themselves are also only applied then, such that neither
+        the mesh1d nor the branches are changed if one of the branches cannot be
+        added.
+        """
+        nbranches = len(branches)
+        names = [None] * nbranches if names is None else list(names)
+        branch_orders = (
+            [-1] * nbranches if branch_orders is None else list(branch_orders)
+        )
+        long_names = [None] * nbranches if long_names is None else list(long_names)
+        if not len(names) == len(branch_orders) == len(long_names) == nbranches:
             raise ValueError(
-                'Branch has no mesh discretization. Use the function "generate_nodes" solve generate a 1d mesh on the branch.'
+                "The number of names, branch orders and long names should be equal to the number of branches."
             )
 
-        if name in self.network1d_branch_id:
-            raise KeyError(f'The branch name "{name}" is already used.')
-        if long_name in self.network1d_branch_long_name:
-            raise KeyError(f'The branch long name "{long_name}" is already used.')
-
-        branch_nr = len(self.network1d_branch_id)
-        if name is None:
-            name = f"br{branch_nr:05d}"
-        if long_name is None:
-            long_name = name
+        used_names = set(self.network1d_branch_id.tolist())
+        used_long_names = set(self.network1d_branch_long_name.tolist())
 
-        self.branches[name] = branch
-
-        # Add branch administration
-        self.network1d_branch_order = np.append(
-            self.network1d_branch_order, branch_order
-        )
-        self.network1d_branch_length = np.append(
-            self.network1d_branch_length, branch.length
+        network1d_node_x = _GrowableArray(self.network1d_node_x)
+        network1d_node_y = _GrowableArray(self.network1d_node_y)
+        mesh1d_node_x = _GrowableArray(self.mesh1d_node_x)
+        mesh1d_node_y = _GrowableArray(self.mesh1d_node_y)
+        network1d_node_index = self._get_node_index(
+            "network1d", self.network1d_node_x, self.network1d_node_y
         )
-        self.network1d_branch_id = np.append(self.network1d_branch_id, name)
-        self.network1d_branch_long_name = np.append(
-            self.network1d_branch_long_name, long_name
+        mesh1d_node_index = self._get_node_index(
+            "mesh1d", self.mesh1d_node_x, self.mesh1d_node_y
         )
+        # The values to append to the other administration arrays, per array
+        new_values: Dict[str, list] = {name: [] for name in _MESH1D_APPENDED_FIELDS}
 
-        # Add branch geometry coordinates
-        self.network1d_part_node_count = np.append(
-            self.network1d_part_node_count, len(branch.geometry)
-        )
-        self.network1d_geom_x = np.append(self.network1d_geom_x, branch._x_coordinates)
-        self.network1d_geom_y = np.append(self.network1d_geom_y, branch._y_coordinates)
-
-        # Network edge node administration
-        # -------------------------------
-
-        first_point = branch.geometry[0]
-        last_point = branch.geometry[-1]
-
-        # Get offsets from dictionary
-        offsets = branch.branch_offsets[:]
-        # The number of links on the branch
-        nlinks = len(offsets) - 1
-
-        # Check if the first and last point of the branch are already in the set
-        first_present = self._network1d_node_position(*first_point) is not None
-        if first_present:
-            # If present, remove from branch offsets
-            offsets = offsets[1:]
-            branch.mask[0] = True
-        else:
-            # If not present, add to network nodes
-            self.network1d_node_x = np.append(self.network1d_node_x, first_point[0])
-            self.network1d_node_y = np.append(self.network1d_node_y, first_point[1])
+        n_mesh1d_nodes = len(self.mesh1d_node_branch_id)
+        added_branches: Dict[str, Branch] = {}
+        added_names = []
+        # The new mask, offsets and node coordinates of each added branch
+        branch_updates: List[Tuple[Branch, np.ndarray, np.ndarray, np.ndarray]] = []
 
-            self.network1d_node_id = np.append(
-                self.network1d_node_id, "{:.6f}_{:.6f}".format(*first_point)
-            )
-            self.network1d_node_long_name = np.append(
-                self.network1d_node_long_name, "x={:.6f}_y={:.6f}".format(*first_point)
-            )
+        for i, (branch, name, branch_order, long_name) in enumerate(
+            zip(branches, names, branch_orders, long_names)
+        ):
+            # Check if branch had coordinate discretization
+            if branch.branch_offsets.size == 0:
+                raise ValueError(
+                    'Branch has no mesh discretization. Use the function "generate_nodes" solve generate a 1d mesh on the branch.'
+                )
 
-        last_present = self._network1d_node_position(*last_point) is not None
-        if last_present:
-            # If present, remove from branch offsets
-            offsets = offsets[:-1]
-            branch.mask[-1] = True
-        else:
-            # If not present, add to network nodes
-            self.network1d_node_x = np.append(self.network1d_node_x, last_point[0])
-            self.network1d_node_y = np.append(self.network1d_node_y, last_point[1])
+            if name in used_names:
+                raise KeyError(f'The branch name "{name}" is already used.')
+            if long_name in used_long_names:
+                raise KeyError(f'The branch long name "{long_name}" is already used.')
+
+            branch_nr = len(self.network1d_branch_id) + i
+            if name is None:
+                name = f"br{branch_nr:05d}"
+            if long_name is None:
+                long_name = name
+
+            used_names.add(name)
+            used_long_names.add(long_name)
+            added_branches[name] = branch
+            added_names.append(name)
+
+            # Add branch administration
+            new_values["network1d_branch_order"].append(branch_order)
+            new_values["network1d_branch_length"].append(branch.length)
+            new_values["network1d_branch_id"].append(name)
+            new_values["network1d_branch_long_name"].append(long_name)
+
+            # Add branch geometry coordinates
+            new_values["network1d_part_node_count"].append(len(branch.geometry))
+            new_values["network1d_geom_x"].append(branch._x_coordinates)
+            new_values["network1d_geom_y"].append(branch._y_coordinates)
+
+            # Network edge node administration
+            # -------------------------------
+
+            first_point = branch.geometry[0]
+            last_point = branch.geometry[-1]
+
+            # Work on copies of the branch discretization
+            mask = branch.mask.copy()
+            branch_offsets = branch.branch_offsets
+            node_xy = branch.node_xy
+
+            # Get offsets from dictionary
+            offsets = branch_offsets[:]
+            # The number of links on the branch
+            nlinks = len(offsets) - 1
+
+            # Check if the first and last point of the branch are already in the set
+            first_present = network1d_node_index.find(*first_point) is not None
+            if first_present:
+                # If present, remove from branch offsets
+                offsets = offsets[1:]
+                mask[0] = True
+            else:
+                # If not present, add to network nodes
+                network1d_node_x.append(first_point[0])
+                network1d_node_y.append(first_point[1])
+                network1d_node_index.add(*first_point)
+
+                new_values["network1d_node_id"].append(
+                    "{:.6f}_{:.6f}".format(*first_point)
+                )
+                new_values["network1d_node_long_name"].append(
+                    "x={:.6f}_y={:.6f}".format(*first_point)
+                )
+
+            last_present = network1d_node_index.find(*last_point) is not None
+            if last_present:
+                # If present, remove from branch offsets
+                offsets = offsets[:-1]
+                mask[-1] = True
+            else:
+                # If not present, add to network nodes
+                network1d_node_x.append(last_point[0])
+                network1d_node_y.append(last_point[1])
+                network1d_node_index.add(*last_point)
 
-            self.network1d_node_id = np.append(
-                self.network1d_node_id, "{:.6f}_{:.6f}".format(*last_point)
+                new_values["network1d_node_id"].append(
+                    "{:.6f}_{:.6f}".format(*last_point)
+                )
+                new_values["network1d_node_long_name"].append(
+                    "x={:.6f}_y={:.6f}".format(*last_point)
+                )
+
+            # If no points remain, add an extra halfway: each branch should have at least 1 node
+            # Adjust the branch object as well, by adding the extra point
+            if len(offsets) == 0 and force_midpoint:
+                # Add extra offset
+                extra_offset = branch.length / 2.0
+                offsets = np.array([extra_offset])
+                nlinks += 1
+                # Adjust branch object
+                branch_offsets = np.insert(branch_offsets, 1, extra_offset)
+                node_xy = np.insert(node_xy, 1, branch.interpolate(offsets), axis=0)
+                mask = np.insert(mask, 1, False)
+
+            # Get the index of the first and last node, add as edge_nodes
+            i_from = network1d_node_index.find(*first_point)
+            i_to = network1d_node_index.find(*last_point)
+            if i_from == i_to:
+                raise ValueError(
+                    "Start and end node are the same. Ring geometries are not accepted."
+                )
+
+            new_values["network1d_edge_nodes"].append(
+                np.array([[i_from, i_to]], dtype=np.int32)
             )
-            self.network1d_node_long_name = np.append(
-                self.network1d_node_long_name, "x={:.6f}_y={:.6f}".format(*last_point)
+            branch_updates.append((branch, mask, branch_offsets, node_xy))
+
+            # Mesh1d edge node administration
+
+            # -------------------------------
+            # First determine the start index. This is equal to the number of already present points
+            start_index = n_mesh1d_nodes
+            # For each link, create a new edge node connection
+            # If the first node is already present, subtract 1, since the first number will be substitud with the present node
+            if first_present:
+                start_index -= 1
+            new_edge_nodes = (
+                np.stack([np.arange(nlinks), np.arange(nlinks) + 1], axis=1)
+                + start_index
+            ).astype(np.int32)
+
+            # If the first node is present, change the first point of the first edge to the existing point
+            if first_present:
+                new_edge_nodes[0, 0] = mesh1d_node_index.find(*first_point)
+            # If the last node is present, change the last point of the last edge too
+            if last_present:
+                new_edge_nodes[-1, 1] = mesh1d_node_index.find(*last_point)
+
+            # Add to variables
+            mesh1d_node_x.extend(node_xy[~mask, 0])
+            mesh1d_node_y.extend(node_xy[~mask, 1])
+            mesh1d_node_index.extend(node_xy[~mask, 0], node_xy[~mask, 1])
+
+            # Add to edge_nodes
+            new_values["mesh1d_edge_nodes"].append(new_edge_nodes)
+            edge_coords = np.stack(
+                [
+                    mesh1d_node_x.array[new_edge_nodes].mean(1),
+                    mesh1d_node_y.array[new_edge_nodes].mean(1),
+                ],
+                axis=1,
             )
+            edge_offsets = (branch_offsets[:-1] + branch_offsets[1:]) / 2
 
-        # If no points remain, add an extra halfway: each branch should have at least 1 node
-        # Adjust the branch object as well, by adding the extra point
-        if len(offsets) == 0 and force_midpoint:
-            # Add extra offset
-            extra_offset = branch.length / 2.0
-            offsets = np.array([extra_offset])
-            nlinks += 1
-            # Adjust branch object
-            branch.branch_offsets = np.insert(branch.branch_offsets, 1, extra_offset)
-            branch.node_xy = np.insert(
-                branch.node_xy, 1, branch.interpolate(offsets), axis=0
+            new_values["mesh1d_edge_branch_id"].append(
+                np.full(len(edge_coords), branch_nr)
             )
-            branch.mask = np.insert(branch.mask, 1, False)
+            new_values["mesh1d_edge_branch_offset"].append(edge_offsets)
 
-        # Get the index of the first and last node, add as edge_nodes
-        i_from = self._network1d_node_position(first_point[0], first_point[1])
-        i_to = self._network1d_node_position(last_point[0], last_point[1])
-        if i_from == i_to:
-            raise ValueError(
-                "Start and end node are the same. Ring geometries are not accepted."
+            new_values["mesh1d_edge_x"].append(edge_coords[:, 0])
+            new_values["mesh1d_edge_y"].append(edge_coords[:, 1])
+
+            # Update names of nodes
+            mesh_point_names = np.array(
+                [f"{name}_{offset:.2f}" for offset in offsets], dtype=object
             )
+            new_values["mesh1d_node_id"].append(mesh_point_names)
+            new_values["mesh1d_node_long_name"].append(mesh_point_names)
+
+            # Add mesh1d nodes
+            new_values["mesh1d_node_branch_id"].append(np.full(len(offsets), branch_nr))
+            new_values["mesh1d_node_branch_offset"].append(offsets)
+            n_mesh1d_nodes += len(offsets)
+
+        if nbranches == 0:
+            return added_names
+
+        for branch, mask, branch_offsets, node_xy in branch_updates:
+            branch.mask = mask
+            branch.branch_offsets = branch_offsets
+            branch.node_xy = node_xy
+
+        self.branches.update(added_branches)
+        self.network1d_node_x = network1d_node_x.array
+        self.network1d_node_y = network1d_node_y.array
+        self.mesh1d_node_x = mesh1d_node_x.array
+        self.mesh1d_node_y = mesh1d_node_y.array
+        network1d_node_index.bind(self.network1d_node_x, self.network1d_node_y)
+        mesh1d_node_index.bind(self.mesh1d_node_x, self.mesh1d_node_y)
+        for field, values in new_values.items():
+            current = getattr(self, field)
+            if not values:
+                continue
+            if current.ndim == 2:
+                setattr(self, field, np.concatenate([current] + values, axis=0))
+            else:
+                setattr(
+                    self,
+                    field,
+                    np.concatenate([current] + [np.ravel(v) for v in values]),
+                )
 
-        self.network1d_edge_nodes = np.append(
-            self.network1d_edge_nodes,
-            np.array([[i_from, i_to]], dtype=np.int32),
-            axis=0,
-        )
+        return added_names
 
-        # Mesh1d edge node administration
-
-        # -------------------------------
-        # First determine the start index. This is equal to the number of already present points
-        start_index = len(self.mesh1d_node_branch_id)
-        # For each link, create a new edge node connection
-        # If the first node is already present, subtract 1, since the first number will be substitud with the present node
-        if first_present:
-            start_index -= 1
-        new_edge_nodes = (
-            np.stack([np.arange(nlinks), np.arange(nlinks) + 1], axis=1) + start_index
-        ).astype(np.int32)
-
-        # If the first node is present, change the first point of the first edge to the existing point
-        if first_present:
-            new_edge_nodes[0, 0] = self._mesh1d_node_position(*first_point)
-        # If the last node is present, change the last point of the last edge too
-        if last_present:
-            new_edge_nodes[-1, 1] = self._mesh1d_node_position(*last_point)
+    def _subset_to(
+        self, target: Mesh1d, in_region: Callable[[np.ndarray, np.ndarray], np.ndarray]
+    ) -> np.ndarray:
+        """Set the branches of this mesh that intersect a region on the target mesh.
 
-        # Add to variables
-        self.mesh1d_node_x = np.append(
-            self.mesh1d_node_x, branch.node_xy[~branch.mask, 0]
-        )
-        self.mesh1d_node_y = np.append(
-            self.mesh1d_node_y, branch.node_xy[~branch.mask, 1]
-        )
+        The branches with a geometry point or mesh node in the region are selected
+        as a whole. Mesh edges to a node on a branch that is not selected are left out.
 
-        # Add to edge_nodes
-        self.mesh1d_edge_nodes = np.append(
-            self.mesh1d_edge_nodes, new_edge_nodes, axis=0
-        )
-        edge_coords = np.stack([self.mesh1d_node_x, self.mesh1d_node_y], axis=1)[
-            new_edge_nodes
-        ].mean(1)
-        edge_offsets = (branch.branch_offsets[:-1] + branch.branch_offsets[1:]) / 2
+        Args:
+            target (Mesh1d): The empty mesh on which the selected branches are set.
+            in_region (Callable[[np.ndarray, np.ndarray], np.ndarray]):
+                Function that determines which of the x, y points are in the region.
 
-        self.mesh1d_edge_branch_id = np.append(
-            self.mesh1d_edge_branch_id, np.full(len(edge_coords), branch_nr)
-        )
-        self.mesh1d_edge_branch_offset = np.append(
-            self.mesh1d_edge_branch_offset, edge_offsets
-        )
+        Returns:
+            np.ndarray: The index of each mesh node of this mesh in the target mesh,
+                -1 for nodes that are not selected.
+        """
+        nbranches = len(self.network1d_branch_id)
+        geom_branch = np.repeat(np.arange(nbranches), self.network1d_part_node_count)
+        branch_selected = np.zeros(nbranches, dtype=bool)
+        branch_selected[
+            geom_branch[in_region(self.network1d_geom_x, self.network1d_geom_y)]
+        ] = True
+        branch_selected[
+            self.mesh1d_node_branch_id[
+                in_region(self.mesh1d_node_x, self.mesh1d_node_y)
+            ]
+        ] = True
+        if not branch_selected.any():
+            return np.full(self.mesh1d_node_id.size, -1, dtype=np.int64)
+
+        node_selected = self.get_node_mask(self.network1d_branch_id[branch_selected])
+        edge_selected = node_selected[self.mesh1d_edge_nodes].all(axis=1)
+        network_node_selected = np.zeros(self.network1d_node_x.size, dtype=bool)
+        network_node_selected[self.network1d_edge_nodes[branch_selected]] = True
+
+        branch_index = _renumber(branch_selected)
+        node_index = _renumber(node_selected)
+        network_node_index = _renumber(network_node_selected)
+
+        selections = {
+            "network1d_node": network_node_selected,
+            "network1d_branch": branch_selected,
+            "network1d_geom": branch_selected[geom_branch],
+            "mesh1d_node": node_selected,
+            "mesh1d_edge": edge_selected,
+        }
+        for field in type(self).model_fields:
+            prefix = next((p for p in selections if field.startswith(p)), None)
+            values = getattr(self, field)
+            if prefix is not None and len(values) == selections[prefix].size:
+                setattr(target, field, values[selections[prefix]])
+
+        target.network1d_edge_nodes = network_node_index[
+            self.network1d_edge_nodes[branch_selected]
+        ]
+        target.network1d_part_node_count = self.network1d_part_node_count[
+            branch_selected
+        ]
+        target.mesh1d_node_branch_id = branch_index[
+            self.mesh1d_node_branch_id[node_selected]
+        ].astype(self.mesh1d_node_branch_id.dtype)
+        target.mesh1d_edge_branch_id = branch_index[
+            self.mesh1d_edge_branch_id[edge_selected]
+        ].astype(self.mesh1d_edge_branch_id.dtype)
+        target.mesh1d_edge_nodes = node_index[
+            self.mesh1d_edge_nodes[edge_selected]
+        ].astype(self.mesh1d_edge_nodes.dtype)
+
+        target.node_snapping_tolerance = self.node_snapping_tolerance
+        target._process_network1d()
+        target._set_mesh1d()
+        return node_index
+
+    def get_node_masks(
+        self, branch_groups: Sequence[Optional[Iterable[str]]]
+    ) -> np.ndarray:
+        """Get the node mask of each group of branches, as `get_node_mask` gives for one group.
+
+        Args:
+            branch_groups (Sequence[Optional[Iterable[str]]]):
+                The branch ids of each group, or None for a group of all branches.
 
-        self.mesh1d_edge_x = np.append(self.mesh1d_edge_x, edge_coords[:, 0])
-        self.mesh1d_edge_y = np.append(self.mesh1d_edge_y, edge_coords[:, 1])
+        Raises:
+            KeyError: When none of the branch ids of a group are found.
 
-        # Update names of nodes
-        mesh_point_names = np.array(
-            [f"{name}_{offset:.2f}" for offset in offsets], dtype=object
-        )
-        self.mesh1d_node_id = np.append(self.mesh1d_node_id, mesh_point_names)
-        self.mesh1d_node_long_name = np.append(
-            self.mesh1d_node_long_name, mesh_point_names
-        )
+        Returns:
+            np.ndarray: A boolean array (nGroups, nNodes), with True for each node
+                that is on one of the branches of the group.
+        """
+        return self._get_branch_masks(branch_groups)[:, self.mesh1d_node_branch_id]
 
-        # Add mesh1d nodes
-        self.mesh1d_node_branch_id = np.append(
-            self.mesh1d_node_branch_id, np.full(len(offsets), branch_nr)
+    def _get_branch_masks(
+        self, branch_groups: Sequence[Optional[Iterable[str]]]
+    ) -> np.ndarray:
+        """Get a boolean array (nGroups, nBranches) with True for the branches of each group."""
+        masks = np.zeros(
+            (len(branch_groups), len(self.network1d_branch_id)), dtype=bool
         )
-        self.mesh1d_node_branch_offset = np.append(
-            self.mesh1d_node_branch_offset, offsets
+        is_all = np.array([group is None for group in branch_groups], dtype=bool)
+        masks[is_all] = True
+
+        groups = [list(group) for group in branch_groups if group is not None]
+        group_numbers = np.repeat(
+            np.flatnonzero(~is_all), [len(group) for group in groups]
         )
-        return name
+        branchids = np.array([b for group in groups for b in group], dtype=str)
+        if branchids.size > 0 and masks.shape[1] > 0:
+            # Look up the branch ids of all groups at once
+            order = np.argsort(self.network1d_branch_id.astype(str))
+            sorted_ids = self.network1d_branch_id.astype(str)[order]
+            positions = np.minimum(
+                np.searchsorted(sorted_ids, branchids), sorted_ids.size - 1
+            )
+            found = sorted_ids[positions] == branchids
+            masks[group_numbers[found], order[positions[found]]] = True
+
+        if not masks.any(axis=1)[~is_all].all():
+            raise KeyError("No branches corresponding to the given keys were found.")
+        return masks
 
     def get_node_mask(self, branchids: List[str] = None):
         """Get node mask, give a mask with True for each node that is in the given branchid list."""
@@ -1089,6 +2327,12 @@ class Mesh1d(BaseModel):
         return mask
 
 
+# The Mesh1d arrays of the 1D network and mesh, as written to the network file
+_MESH1D_ARRAYS = tuple(
+    name for name in Mesh1d.model_fields if name.startswith(("network1d_", "mesh1d_"))
+)
+
+
 class Network:
     """Represents a D-Flow FM network combining 1D, 2D mesh and 1D2D links."""
 
@@ -1108,43 +2352,136 @@ class Network:
         self._mesh2d = Mesh2d(meshkernel=self.meshkernel)
         self._link1d2d = Link1d2d(meshkernel=self.meshkernel)
 
+        # The resolved path, modification time and size of the file that was last
+        # read or written, to determine whether it can be updated incrementally.
+        self._synced_file: Optional[Tuple[Path, int, int]] = None
+
         # Spatial index (rtree)
         # self._idx = index.Index()
 
     @classmethod
-    def from_file(cls, file_path: Path) -> Network:
+    def from_file(
+        cls,
+        file_path: Path,
+        components: Optional[Iterable[UgridComponent]] = None,
+        lazy: bool = False,
+        region: Optional[Region] = None,
+    ) -> Network:
         """Read network from file.
 
         This classmethod checks what mesh components (mesh1d & network1d, mesh2d, link1d2d) are
-        present, and loads them one by one.
+        present, and loads them one by one. The file is opened only once for all components.
 
         Args:
             file_path (Path): path to netcdf file with network data
+            components (Optional[Iterable[UgridComponent]], optional):
+                The components to read, e.g. `[UgridComponent.MESH2D]` to only read the
+                2D mesh. Defaults to None, i.e. all components present in the file.
+            lazy (bool, optional):
+                Whether or not the mesh2d arrays are only read from the file on demand,
+                see `UgridReader.read_mesh2d`. Defaults to False.
+            region (Optional[Region], optional):
+                The bounding box (xmin, ymin, xmax, ymax) or polygon to read, see
+                `subset`. The mesh2d is then read in chunks, and only the part that
+                intersects the region is kept. Defaults to None, i.e. everything.
 
         Returns:
             Network: The instance of the class itself that is returned
         """
+        if region is not None:
+            return cls.from_file(file_path, components, lazy=True).subset(region)
+
         network = cls()
-        ds = nc.Dataset(file_path)  # type: ignore[import]
 
-        reader = UgridReader(file_path)
+        with UgridReader(file_path) as reader:
+            reader.read(
+                mesh1d=network._mesh1d,
+                mesh2d=network._mesh2d,
+                link1d2d=network._link1d2d,
+                components=components,
+                lazy=lazy,
+            )
+
+        network._set_synced_file(Path(file_path))
+        return network
+
+    def subset(self, region: Region) -> Network:
+        """Create a new network with the part of this network that intersects the region.
 
-        reader.read_mesh1d_network1d(network._mesh1d)
-        reader.read_mesh2d(network._mesh2d)
-        reader.read_link1d2d(network._link1d2d)
+        The new network contains:
 
-        ds.close()
+        - The mesh2d faces and edges with a node in the region, with all of their nodes.
+        - The 1D branches with a geometry point or mesh node in the region, as a whole.
+        - The 1D2D links between the selected mesh1d nodes and mesh2d faces.
+
+        The nodes, edges, faces and branches are numbered compactly in the new network.
+
+        Args:
+            region (Region):
+                The bounding box (xmin, ymin, xmax, ymax), or a polygon as GeometryList,
+                which may consist of multiple polygons with holes.
+
+        Returns:
+            Network: The new network.
+        """
+        network = Network(is_geographic=self.is_geographic)
 
+        def in_region(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+            return _points_in_region(network.meshkernel, region, x, y)
+
+        mesh1d_node_index = np.empty(0, dtype=np.int64)
+        if not self._mesh1d.is_empty():
+            mesh1d_node_index = self._mesh1d._subset_to(network._mesh1d, in_region)
+        mesh2d_face_index = self._mesh2d._subset_to(network._mesh2d, in_region)
+        self._link1d2d._subset_to(
+            network._link1d2d, mesh1d_node_index, mesh2d_face_index
+        )
         return network
 
-    def to_file(self, file: Path) -> None:
+    def to_file(
+        self,
+        file: Path,
+        incremental: bool = False,
+        storage: Optional[StorageConfiguration] = None,
+    ) -> None:
         """Write network to file.
 
+        With incremental set to True, only the modified arrays (see the `modified`
+        property of the components) are rewritten when the file is the file this network was last read from or
+        written to, and the file has not been changed since. The 1D2D links are also
+        rewritten when the mesh1d or the mesh2d topology is modified. The whole file
+        is written when a modified array is not present in the file or its
+        dimensions changed. An incrementally updated file keeps its format,
+        compression and chunking.
+
         Args:
             file (Path): File where _net.nc is written to.
+            incremental (bool, optional):
+                Whether or not to only rewrite the modified arrays. Defaults to False.
+            storage (Optional[StorageConfiguration], optional):
+                The file format, compression and chunking of the written file.
+                Defaults to None, which uses the StorageConfiguration defaults.
         """
-        writer = UgridWriter()
-        writer.write(self, file)
+        file = Path(file)
+        writer = UgridWriter(storage_config=storage)
+        if not (
+            incremental and self._is_synced_with(file) and writer.update(self, file)
+        ):
+            writer.write(self, file)
+        self._set_synced_file(file)
+
+    def _set_synced_file(self, file: Path) -> None:
+        """Register that the file contains this network, and clear the modifications."""
+        stat = file.stat()
+        self._synced_file = (file.resolve(), stat.st_mtime_ns, stat.st_size)
+        for component in (self._mesh1d, self._mesh2d, self._link1d2d):
+            component._mark_saved()
+
+    def _is_synced_with(self, file: Path) -> bool:
+        if self._synced_file is None or not file.is_file():
+            return False
+        stat = file.stat()
+        return self._synced_file == (file.resolve(), stat.st_mtime_ns, stat.st_size)
 
     @property
     def is_geographic(self) -> bool:
@@ -1165,11 +2502,72 @@ class Network:
         self._mesh1d._set_mesh1d()
 
         node_mask = self._mesh1d.get_node_mask(branchids)
+        self._mesh2d._ensure_loaded()
         if polygon is None:
             polygon = self.meshkernel.mesh2d_get_mesh_boundaries_as_polygons()
 
         self._link1d2d._link_from_1d_to_2d(node_mask, polygon=polygon)
 
+    def link1d2d_from_branch_groups(
+        self,
+        groups: Iterable[BranchGroupLinks],
+        search_radius: Optional[float] = None,
+    ) -> None:
+        """Replace the 1D2D links by the links of many groups of branches.
+
+        The node masks of all groups are determined at once, and the groups with
+        the same link type and the same polygon are linked in a single meshkernel
+        call. Groups with different polygons are linked in separate calls, so the
+        nodes of a group are only linked to faces within the polygon of that group.
+        For the lateral links, the nodes of the groups that are linked together are
+        linked to the boundary faces together.
+
+        Args:
+            groups (Iterable[BranchGroupLinks]): The links to generate per group of branches.
+            search_radius (Optional[float], optional):
+                The radius used for searching the mesh2d faces of the lateral links.
+                Defaults to None, i.e. determined by the meshkernel.
+
+        Raises:
+            KeyError: When none of the branch ids of a group are found.
+        """
+        groups = list(groups)
+        self._mesh1d._set_mesh1d()
+        self._mesh2d._ensure_loaded()
+        branch_masks = self._mesh1d._get_branch_masks(
+            [group.branchids for group in groups]
+        )
+
+        # Groups often share a polygon, these are linked in the same meshkernel call
+        calls: Dict[Tuple[Link1d2dType, Optional[Tuple[bytes, bytes]]], List[int]] = {}
+        for i, group in enumerate(groups):
+            polygon_key = None
+            if group.polygon is not None:
+                polygon_key = (
+                    group.polygon.x_coordinates.tobytes(),
+                    group.polygon.y_coordinates.tobytes(),
+                )
+            calls.setdefault((Link1d2dType(group.link_type), polygon_key), []).append(i)
+
+        links = []
+        mesh_boundary = None
+        for (link_type, _), indices in calls.items():
+            polygon = groups[indices[0]].polygon
+            if polygon is None:
+                if mesh_boundary is None:
+                    mesh_boundary = (
+                        self.meshkernel.mesh2d_get_mesh_boundaries_as_polygons()
+                    )
+                polygon = mesh_boundary
+            branch_mask = branch_masks[indices].any(axis=0)
+            node_mask = branch_mask[self._mesh1d.mesh1d_node_branch_id]
+            links.append((link_type, node_mask, polygon))
+
+        self._link1d2d._link_by_type(
+            links,
+            search_radius=_MISSING_VALUE if search_radius is None else search_radius,
+        )
+
     def mesh2d_create_rectilinear_within_extent(
         self, extent: tuple, dx: float, dy: float
     ) -> None:
@@ -1205,6 +2603,30 @@ class Network:
     ):
         self._mesh2d.refine(polygon=polygon, level=level, parameters=parameters)
 
+    def mesh2d_clip_mesh_by_polygons(
+        self,
+        polygons: Iterable[mk.GeometryList],
+        deletemeshoption: mk.DeleteMeshOption = mk.DeleteMeshOption.INSIDE_NOT_INTERSECTED,
+        inside: bool = True,
+    ) -> PolygonBatchStatistics:
+        """Clip the 2D mesh by many polygons, see `Mesh2d.clip_by_polygons`.
+
+        As for `mesh2d_clip_mesh`, the mesh inside the polygons is deleted by default.
+        """
+        return self._mesh2d.clip_by_polygons(
+            polygons=polygons, deletemeshoption=deletemeshoption, inside=inside
+        )
+
+    def mesh2d_refine_mesh_by_polygons(
+        self,
+        polygons: Iterable[mk.GeometryList],
+        level: int,
+        parameters: mk.MeshRefinementParameters = None,
+    ) -> PolygonBatchStatistics:
+        return self._mesh2d.refine_by_polygons(
+            polygons=polygons, level=level, parameters=parameters
+        )
+
     def mesh1d_add_branch(
         self,
         branch: Branch,
@@ -1223,6 +2645,37 @@ class Network:
         self._mesh1d._set_mesh1d()
         return name
 
+    def mesh1d_add_branches(
+        self,
+        branches: List[Branch],
+        names: Optional[List[Optional[str]]] = None,
+        branch_orders: Optional[List[int]] = None,
+        long_names: Optional[List[Optional[str]]] = None,
+        force_midpoint: bool = True,
+    ) -> List[str]:
+        """Add multiple branches to the mesh1d at once.
+
+        Use this instead of repeatedly calling `mesh1d_add_branch` when building
+        large networks.
+
+        Args:
+            branches (List[Branch]): branches to add to the mesh1d
+            names (Optional[List[Optional[str]]]): ids of the branches, None to generate the id
+            branch_orders (Optional[List[int]]): interpolation orders of the branches, defaults to -1
+            long_names (Optional[List[Optional[str]]]): long names of the branches, None to use the id
+            force_midpoint (bool): argument to control if a midpoint will be forced on the branches, use False for pipes
+
+        Returns:
+            List[str]: names of the branches.
+        """
+        return self._mesh1d.add_branches(
+            branches,
+            names=names,
+            branch_orders=branch_orders,
+            long_names=long_names,
+            force_midpoint=force_midpoint,
+        )
+
     def plot(self, ax=None):
         """Create a plot of the 1d2d links and edges within this network.
 
@@ -1244,12 +2697,23 @@ class Network:
 
 
 class NetworkModel(ParsableFileModel):
-    """Network model representation."""
+    """Network model representation.
+
+    Attributes:
+        network (Network): The network.
+        storage (Optional[StorageConfiguration]):
+            The file format, compression and chunking used when saving the network
+            file. Defaults to None, which uses the StorageConfiguration defaults.
+    """
 
     network: Network = Field(default_factory=Network)
+    storage: Optional[StorageConfiguration] = None
 
     def _post_init_load(self) -> None:
-        """Load the network file if the filepath exists relative to the current FileLoadContext."""
+        """Load the network file if the filepath exists relative to the current FileLoadContext.
+
+        When the model is loaded lazily, the mesh2d arrays are only read from the network file on demand.
+        """
         super()._post_init_load()
 
         if self.filepath is None:
@@ -1259,7 +2723,9 @@ class NetworkModel(ParsableFileModel):
             network_path = context.resolve(self.filepath)
 
             if network_path.is_file():
-                self.network = Network.from_file(network_path)
+                self.network = Network.from_file(
+                    network_path, lazy=context.load_settings.lazy
+                )
 
     @property
     def _mesh1d(self):
@@ -1286,13 +2752,17 @@ class NetworkModel(ParsableFileModel):
             write_path = context.resolve(self.filepath)  # type: ignore[arg-type]
 
             write_path.parent.mkdir(parents=True, exist_ok=True)
-            self.network.to_file(write_path)
+            self.network.to_file(
+                write_path,
+                incremental=save_settings.incremental,
+                storage=self.storage,
+            )
 
     def _export(self, folder: Path) -> None:
         filename = Path(self.filepath.name) if self.filepath else self._generate_name()
         self.filepath = folder / filename
         folder.mkdir(parents=True, exist_ok=True)
-        self.network.to_file(self.filepath)
+        self.network.to_file(self.filepath, storage=self.storage)
 
     def _parse(self, _):
         return {}
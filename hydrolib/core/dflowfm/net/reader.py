@@ -6,20 +6,57 @@ import json
 import logging
 from collections import namedtuple
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, ClassVar, Dict, Optional, Tuple, Type
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Optional,
+    Tuple,
+    Type,
+)
 
 import netCDF4 as nc
 import numpy as np
 from meshkernel import Contacts
+from strenum import StrEnum
 
 from hydrolib.core.base.models import BaseModel
+from hydrolib.core.dflowfm.net.chararray import chars_to_strings
 
 if TYPE_CHECKING:
     from hydrolib.core.dflowfm.net.models import Link1d2d, Mesh1d, Mesh2d
 
 
+class UgridComponent(StrEnum):
+    """The components of a UGRID file that can be read by the UgridReader."""
+
+    MESH1D = "mesh1d"
+    """The 1D mesh together with its 1D network."""
+    MESH2D = "mesh2d"
+    """The 2D mesh."""
+    LINK1D2D = "link1d2d"
+    """The links between the 1D and 2D mesh."""
+
+
 class UgridReader:
-    """UgridReader provides the logic to read a specified UGRID file."""
+    """UgridReader provides the logic to read a specified UGRID file.
+
+    The netCDF file is opened once and the same dataset is used to explore the
+    file and to read each of its components. The dataset is closed with `close`,
+    or when the reader is used as a context manager.
+
+    Examples:
+        ```python
+        >>> from hydrolib.core.dflowfm.net.models import Mesh2d
+        >>> from hydrolib.core.dflowfm.net.reader import UgridReader
+        >>> mesh2d = Mesh2d()  # doctest: +SKIP
+        >>> with UgridReader(Path("path/to/FlowFM_net.nc")) as reader:  # doctest: +SKIP
+        ...     reader.read_mesh2d(mesh2d)
+
+        ```
+    """
 
     def __init__(self, file_path: Path) -> None:
         """Creates a new UgridReader, reading the specified path.
@@ -35,7 +72,70 @@ class UgridReader:
         if not self._ncfile_path.exists():
             raise OSError(f'File "{self._ncfile_path}" not found.')
 
-        self._explorer = NCExplorer.from_file_path(self._ncfile_path)
+        self._dataset = nc.Dataset(self._ncfile_path)  # type: ignore[import]
+        try:
+            self._explorer = NCExplorer.from_dataset(self._dataset)
+        except Exception:
+            self._dataset.close()
+            raise
+
+    def __enter__(self) -> UgridReader:
+        """Enter the context of this UgridReader.
+
+        Returns:
+            UgridReader: This reader.
+        """
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Exit the context of this UgridReader and close its dataset."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the netCDF dataset of this UgridReader.
+
+        Closing an already closed reader has no effect.
+        """
+        if self._dataset.isopen():
+            self._dataset.close()
+
+    def read(
+        self,
+        mesh1d: Optional[Mesh1d] = None,
+        mesh2d: Optional[Mesh2d] = None,
+        link1d2d: Optional[Link1d2d] = None,
+        components: Optional[Iterable[UgridComponent]] = None,
+        lazy: bool = False,
+    ) -> None:
+        """Read the selected components into the specified objects.
+
+        A component is only read if it is selected and its object is specified.
+
+        Args:
+            mesh1d (Optional[Mesh1d], optional):
+                The object to which the mesh1d and network1d are added. Defaults to None.
+            mesh2d (Optional[Mesh2d], optional):
+                The object to which the mesh2d is added. Defaults to None.
+            link1d2d (Optional[Link1d2d], optional):
+                The object to which the link1d2d is added. Defaults to None.
+            components (Optional[Iterable[UgridComponent]], optional):
+                The components to read. Defaults to None, i.e. all components.
+            lazy (bool, optional):
+                Whether or not the mesh2d arrays are only read from the file on demand.
+                See `read_mesh2d`. Defaults to False.
+        """
+        selected = (
+            set(UgridComponent)
+            if components is None
+            else {UgridComponent(component) for component in components}
+        )
+
+        if mesh1d is not None and UgridComponent.MESH1D in selected:
+            self.read_mesh1d_network1d(mesh1d)
+        if mesh2d is not None and UgridComponent.MESH2D in selected:
+            self.read_mesh2d(mesh2d, lazy=lazy)
+        if link1d2d is not None and UgridComponent.LINK1D2D in selected:
+            self.read_link1d2d(link1d2d)
 
     def read_mesh1d_network1d(self, mesh1d: Mesh1d) -> None:
         """Read the Ugrid from the netcdf and add the dflowfm cstructure with grid to the specified mesh1d.
@@ -52,8 +152,7 @@ class UgridReader:
             )
             return
 
-        # If the mesh is not given (default), use the networks one
-        ds = nc.Dataset(self._ncfile_path)  # type: ignore[import]
+        ds = self._dataset
 
         # Read mesh1d
         for meshkey, nckey in self._explorer.mesh1d_var_name_mapping.items():
@@ -69,19 +168,24 @@ class UgridReader:
         # TODO: we still require this here to sync new attrs with meshkernel instance
         # https://github.com/Deltares/HYDROLIB-core/issues/576
 
-        ds.close()
-
-    def read_mesh2d(self, mesh2d: Mesh2d) -> None:
+    def read_mesh2d(self, mesh2d: Mesh2d, lazy: bool = False) -> None:
         """Read the Ugrid from the netcdf and add the dflowfm cstructure with grid to the specified mesh2d.
 
+        With lazy=True no arrays are read yet. The node, edge and face arrays and the
+        bathymetry of the mesh2d are then read from the file when they are accessed,
+        and the meshkernel is only set when a mesh operation is invoked.
+
         Args:
             mesh2d (Mesh2d): The object to which the read network1d is added.
+            lazy (bool, optional):
+                Whether or not the arrays are only read from the file on demand.
+                Defaults to False.
         """
         if self._explorer.mesh2d_var_name_mapping is None:
             logging.debug("Mesh2d is not found in the dataset, reading is skipped.")
             return
 
-        ds = nc.Dataset(self._ncfile_path)  # type: ignore[import]
+        ds = self._dataset
 
         mapping = self._explorer.mesh2d_var_name_mapping
 
@@ -89,6 +193,10 @@ class UgridReader:
         if not set(mesh2d_required).issubset(mapping.keys()):
             raise KeyError("not all required mesh2d attributes present in network")
 
+        if lazy:
+            mesh2d._set_lazy_variables(LazyUgridVariables(self._ncfile_path, mapping))
+            return
+
         # set mesh2d on meshkernel instance
         node_x = self._read_nc_attribute(ds[mapping["mesh2d_node_x"]])
         node_y = self._read_nc_attribute(ds[mapping["mesh2d_node_y"]])
@@ -103,8 +211,6 @@ class UgridReader:
             face_z = self._read_nc_attribute(ds[mapping["mesh2d_face_z"]])
             mesh2d.mesh2d_face_z = face_z
 
-        ds.close()
-
     def read_link1d2d(self, link1d2d: Link1d2d) -> None:
         """Read the Link1d2d from the wrapped netCDF file of this UgridReader.
 
@@ -115,7 +221,7 @@ class UgridReader:
             logging.debug("Link1d2d is not found in the dataset, reading is skipped.")
             return
 
-        ds = nc.Dataset(self._ncfile_path)  # type: ignore[import]
+        ds = self._dataset
         mapping = self._explorer.link1d2d_var_name_mapping
 
         # Read mesh1d
@@ -131,11 +237,12 @@ class UgridReader:
         contacts = Contacts(
             mesh1d_indices=mesh1d_indices, mesh2d_indices=mesh2d_indices
         )
-        link1d2d.meshkernel.contacts_set(contacts)
-
-        ds.close()
+        link1d2d._set_contacts(contacts)
 
-    def _read_nc_attribute(self, attr: nc._netCDF4.Variable) -> np.ndarray:
+    @staticmethod
+    def _read_nc_attribute(
+        attr: nc._netCDF4.Variable, index: slice = slice(None)
+    ) -> np.ndarray:
         """Read values from netcdf attribute.
 
         - Character arrays are converted to strings
@@ -144,14 +251,15 @@ class UgridReader:
 
         Args:
             attr (netCDF4._netCDF4.Variable): Attribute in the file
+            index (slice, optional): The range of the first dimension to read. Defaults to all values.
 
         Returns:
             np.ndarray: returned array
         """
-        values = attr[:]
+        values = attr[index]
         if values.dtype == "S1":
             # Convert to strings
-            arr = np.array(list(map(str.strip, nc.chartostring(values.data))))  # type: ignore[import]
+            arr = chars_to_strings(values.data)
 
         else:
             # Get data from masked array
@@ -166,6 +274,76 @@ class UgridReader:
         return arr
 
 
+class LazyUgridVariables:
+    """The variables of a UGRID component, which are read from the netCDF file on demand.
+
+    No dataset is kept open. The sizes of all variables are read together, the
+    first time a size is requested. The values of a variable that is read as a
+    whole are kept, such that they are only read once. The values within an
+    index range are read from the file, unless the whole variable has been read.
+    """
+
+    def __init__(self, file_path: Path, var_name_mapping: Dict[str, str]) -> None:
+        """Create a new LazyUgridVariables for the variables in the specified file.
+
+        Args:
+            file_path (Path): The path to the netCDF file.
+            var_name_mapping (Dict[str, str]):
+                The mapping of the UGRID variable names to the netCDF variable names.
+        """
+        self._file_path = file_path
+        self._var_name_mapping = dict(var_name_mapping)
+        self._sizes: Optional[Dict[str, int]] = None
+        self._values: Dict[str, np.ndarray] = {}
+
+    def __contains__(self, name: str) -> bool:
+        """Whether or not the UGRID variable with the name is in the file."""
+        return name in self._var_name_mapping
+
+    def size(self, name: str) -> int:
+        """Get the length of the first dimension of the UGRID variable with the name.
+
+        Args:
+            name (str): The UGRID variable name, e.g. "mesh2d_node_x".
+
+        Returns:
+            int: The number of values, or rows for two dimensional variables.
+        """
+        if self._sizes is None:
+            with nc.Dataset(self._file_path) as dataset:  # type: ignore[import]
+                self._sizes = {
+                    ugrid_name: len(dataset[nc_name])
+                    for ugrid_name, nc_name in self._var_name_mapping.items()
+                }
+        return self._sizes[name]
+
+    def read(
+        self, name: str, start: Optional[int] = None, stop: Optional[int] = None
+    ) -> np.ndarray:
+        """Read the values of the UGRID variable with the name within an index range.
+
+        Args:
+            name (str): The UGRID variable name, e.g. "mesh2d_node_x".
+            start (Optional[int], optional): The first index. Defaults to None, i.e. 0.
+            stop (Optional[int], optional):
+                The index after the last index. Defaults to None, i.e. the size.
+
+        Returns:
+            np.ndarray: The values, converted as by `UgridReader`.
+        """
+        values = self._values.get(name)
+        if values is not None:
+            return values[start:stop]
+
+        with nc.Dataset(self._file_path) as dataset:  # type: ignore[import]
+            values = UgridReader._read_nc_attribute(
+                dataset[self._var_name_mapping[name]], slice(start, stop)
+            )
+        if start is None and stop is None:
+            self._values[name] = values
+        return values
+
+
 class NCExplorer(BaseModel):
     """NCExplorer provides the mapping of the UGRID variable names to netCDF file values.
 
@@ -203,11 +381,25 @@ class NCExplorer(BaseModel):
         Args:
             file_path (Path): The path to the net.nc file.
 
+        Returns:
+            NCExplorer: A newly initialized NCExplorer.
+        """
+        with nc.Dataset(file_path) as dataset:  # type: ignore[import]
+            return cls.from_dataset(dataset)
+
+    @classmethod
+    def from_dataset(cls, dataset: nc.Dataset) -> "NCExplorer":  # type: ignore[import]
+        """Create a new NCExplorer from the specified opened dataset.
+
+        The dataset is not closed.
+
+        Args:
+            dataset (nc.Dataset): The opened net.nc dataset.
+
         Returns:
             NCExplorer: A newly initialized NCExplorer.
         """
         conventions = NCExplorer._read_ugrid_conventions()
-        dataset = nc.Dataset(file_path)  # type: ignore[import]
 
         keys = NCExplorer._determine_keys(dataset)
         network1d_mapping = NCExplorer._retrieve_variable_names_mapping(
@@ -223,8 +415,6 @@ class NCExplorer(BaseModel):
             keys.link1d2d, dataset, conventions["link1d2d"]
         )
 
-        dataset.close()
-
         return cls(
             network1d_var_name_mapping=network1d_mapping,
             mesh1d_var_name_mapping=mesh1d_mapping,
@@ -4,16 +4,28 @@ from __future__ import annotations
 
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple, Union
 
 import netCDF4 as nc
 import numpy as np
+from pydantic import Field, model_validator
 
 from hydrolib.core import __version__
 from hydrolib.core.base.models import BaseModel
+from hydrolib.core.dflowfm.net.chararray import strings_to_chars
+from hydrolib.core.dflowfm.net.reader import NCExplorer
 
 if TYPE_CHECKING:
-    from hydrolib.core.dflowfm.net.models import Link1d2d, Mesh1d, Mesh2d, NetworkModel
+    from hydrolib.core.dflowfm.net.models import (
+        Link1d2d,
+        Mesh1d,
+        Mesh2d,
+        Network,
+        NetworkModel,
+    )
+
+# The Mesh2d arrays that can be modified without changing the mesh topology
+_MESH2D_BATHYMETRY_ARRAYS = {"mesh2d_node_z", "mesh2d_face_z"}
 
 
 class FillValueConfiguration(BaseModel):
@@ -32,15 +44,56 @@ class FillValueConfiguration(BaseModel):
     "Fill value to use for 64-bit integers. Defaults to 9.97E36."
 
 
+class StorageConfiguration(BaseModel):
+    """Class that holds the configuration for the storage of the written variables."""
+
+    file_format: Literal[
+        "NETCDF3_CLASSIC", "NETCDF3_64BIT", "NETCDF4_CLASSIC", "NETCDF4"
+    ] = "NETCDF3_CLASSIC"
+    "The netCDF file format. Defaults to NETCDF3_CLASSIC."
+
+    compression: Optional[Literal["zlib", "szip"]] = None
+    "Compression of the variables, only supported by the NETCDF4 formats. Defaults to None (no compression)."
+
+    complevel: int = Field(default=4, ge=1, le=9)
+    "Compression level of zlib, from 1 (fastest) to 9 (smallest). Defaults to 4."
+
+    shuffle: bool = True
+    "Whether to apply the HDF5 shuffle filter before compression. Defaults to True."
+
+    chunk_size: Optional[int] = Field(default=None, gt=0)
+    "Chunk length along the first dimension of the variables, only supported by the NETCDF4 formats. Defaults to None (chosen by the netCDF library)."
+
+    write_chunk_size: int = Field(default=1_000_000, gt=0)
+    "Maximum number of rows of a variable that is written at once. Defaults to 1000000."
+
+    @model_validator(mode="after")
+    def _check_netcdf4_options(self) -> "StorageConfiguration":
+        if not self.file_format.startswith("NETCDF4") and (
+            self.compression is not None or self.chunk_size is not None
+        ):
+            raise ValueError(
+                f"Compression and chunking are not supported by the {self.file_format} format."
+            )
+        return self
+
+
 class UgridWriter:
     """Writer for netCDF files with UGrid convention."""
 
-    def __init__(self, fill_value_config: Optional[FillValueConfiguration] = None):
-        """Initialize UgridWriter with optional fill value configuration.
+    def __init__(
+        self,
+        fill_value_config: Optional[FillValueConfiguration] = None,
+        storage_config: Optional[StorageConfiguration] = None,
+    ):
+        """Initialize UgridWriter with optional fill value and storage configuration.
 
         Args:
             fill_value_config (Optional[FillValueConfiguration]): Configuration for fill values.
                 Defaults to None, which uses FillValueConfiguration defaults.
+            storage_config (Optional[StorageConfiguration]): Configuration for the file
+                format, compression and chunking. Defaults to None, which uses
+                StorageConfiguration defaults.
         """
         self.idstrlength = 40
         self.longstrlength = 80
@@ -50,6 +103,9 @@ class UgridWriter:
             if fill_value_config is not None
             else FillValueConfiguration()
         )
+        self._storage_config = (
+            storage_config if storage_config is not None else StorageConfiguration()
+        )
 
     def write(
         self,
@@ -60,12 +116,87 @@ class UgridWriter:
         suite_version: str = "",
     ) -> None:
         """Write ugrid file from GWSW model."""
+        # A lazily read mesh2d is loaded first, since it may be read from the file at path.
+        network._mesh2d._ensure_loaded()
         ncfile = self._create_netcdf(path, dfm_version, dimr_version, suite_version)
         self._write_mesh1d_to(network._mesh1d, ncfile)
         self._write_mesh2d_to(network._mesh2d, ncfile)
         self._write_1d2dlinks_to(network._link1d2d, ncfile)
         ncfile.close()
 
+    def update(self, network: Network, path: Path) -> bool:
+        """Rewrite only the modified arrays of the network in an existing ugrid file.
+
+        The file is only updated when every modified array is stored in the file
+        with the same dimensions. The other variables, the dimensions and the
+        attributes in the file are kept as they are.
+
+        Args:
+            network (Network): The network of which the modified arrays are written.
+            path (Path): The existing file that contains the network.
+
+        Returns:
+            bool: Whether or not the file is updated. When False, the file is not
+                changed, and should be written as a whole with `write`.
+        """
+        with nc.Dataset(path) as ncfile:  # type: ignore[import]
+            explorer = NCExplorer.from_dataset(ncfile)
+            updates = self._get_updates(network, explorer)
+            if updates is None:
+                return False
+            for varname, values in updates.items():
+                if ncfile[varname].shape[0] != len(values) or (
+                    values.ndim == 2 and ncfile[varname].shape[1] != values.shape[1]
+                ):
+                    return False
+
+        if not updates:
+            return True
+
+        with nc.Dataset(path, "a") as ncfile:  # type: ignore[import]
+            for varname, values in updates.items():
+                variable = ncfile[varname]
+                if variable.dtype == "S1":
+                    variable[:] = strings_to_chars(values, variable.shape[1])
+                else:
+                    self._write_values(
+                        variable, values, getattr(variable, "start_index", 0)
+                    )
+        return True
+
+    @staticmethod
+    def _get_updates(
+        network: Network, explorer: NCExplorer
+    ) -> Optional[Dict[str, np.ndarray]]:
+        """Get the values of the modified arrays of the network per variable name.
+
+        Returns None when a modified array with values is not stored in the file.
+        """
+        mesh1d_modified = network._mesh1d.modified
+        mesh2d_modified = network._mesh2d.modified
+        link1d2d_modified = network._link1d2d.modified
+        if mesh1d_modified or mesh2d_modified - _MESH2D_BATHYMETRY_ARRAYS:
+            # The links refer to the mesh1d nodes and mesh2d faces by index
+            link1d2d_modified = set(network._link1d2d._tracked_arrays())
+
+        mesh1d_mapping = {
+            **(explorer.network1d_var_name_mapping or {}),
+            **(explorer.mesh1d_var_name_mapping or {}),
+        }
+        updates: Dict[str, np.ndarray] = {}
+        for component, modified, mapping in [
+            (network._mesh1d, mesh1d_modified, mesh1d_mapping),
+            (network._mesh2d, mesh2d_modified, explorer.mesh2d_var_name_mapping),
+            (network._link1d2d, link1d2d_modified, explorer.link1d2d_var_name_mapping),
+        ]:
+            for name in sorted(modified):
+                values = np.asarray(getattr(component, name))
+                if mapping and name in mapping:
+                    updates[mapping[name]] = values
+                elif values.size > 0:
+                    return None
+        return updates
+
     def _write_mesh1d_to(self, mesh1d: Mesh1d, ncfile: nc.Dataset) -> None:  # type: ignore[import]
         if mesh1d.is_empty():
             return
@@ -97,7 +228,7 @@ class UgridWriter:
         self, path: Path, dfm_version: str, dimr_version: str, suite_version: str
     ) -> nc.Dataset:  # type: ignore[import]
 
-        file_format = "NETCDF3_CLASSIC"  # "NETCDF4"
+        file_format = self._storage_config.file_format
         ncfile = nc.Dataset(path, "w", format=file_format)  # type: ignore[import]
 
         UgridWriter._set_global_attributes(ncfile, path)
@@ -105,6 +236,56 @@ class UgridWriter:
 
         return ncfile
 
+    def _create_variable(
+        self,
+        ncfile: nc.Dataset,  # type: ignore[import]
+        varname: str,
+        datatype: Any,
+        dimensions: Union[str, Tuple[str, ...]],
+        **kwargs: Any,
+    ) -> nc.Variable:  # type: ignore[import]
+        """Create a variable with the compression and chunking of the storage configuration."""
+        if isinstance(dimensions, str):
+            dimensions = (dimensions,)
+        return ncfile.createVariable(
+            varname,
+            datatype,
+            dimensions,
+            **self._get_storage_options(ncfile, dimensions),
+            **kwargs,
+        )
+
+    def _get_storage_options(
+        self, ncfile: nc.Dataset, dimensions: Tuple[str, ...]  # type: ignore[import]
+    ) -> Dict[str, Any]:
+        config = self._storage_config
+        if not dimensions:
+            return {}
+
+        options: Dict[str, Any] = {}
+        if config.compression == "zlib":
+            options.update(zlib=True, complevel=config.complevel)
+        elif config.compression == "szip":
+            options.update(compression="szip")
+        if config.compression is not None:
+            options.update(shuffle=config.shuffle)
+        if config.chunk_size is not None:
+            sizes = [max(len(ncfile.dimensions[dim]), 1) for dim in dimensions]
+            options.update(chunksizes=(min(config.chunk_size, sizes[0]), *sizes[1:]))
+        return options
+
+    def _write_values(
+        self, variable: nc.Variable, values: np.ndarray, offset: int = 0  # type: ignore[import]
+    ) -> None:
+        """Write the values to the variable in chunks of rows, adding an offset to each value.
+
+        Writing in chunks bounds the memory used by the netCDF library and by the offset.
+        """
+        nrows = self._storage_config.write_chunk_size
+        for start in range(0, len(values), nrows):
+            chunk = values[start : start + nrows]
+            variable[start : start + len(chunk)] = chunk + offset if offset else chunk
+
     @staticmethod
     def _set_global_attributes(ncfile: nc.Dataset, path: Path) -> None:  # type: ignore[import]
         ncfile.Conventions = "CF-1.8 UGRID-1.0"
@@ -142,14 +323,14 @@ class UgridWriter:
     def _init_1d2dlinks(self, ncfile: nc.Dataset, link1d2d: Link1d2d) -> None:  # type: ignore[import]
         ncfile.createDimension("nLink1D2D_edge", link1d2d.link1d2d.shape[0])
 
-        cm = ncfile.createVariable("composite_mesh", "i4", ())
+        cm = self._create_variable(ncfile, "composite_mesh", "i4", ())
         cm.cf_role = "parent_mesh_topology"
         cm.meshes = "mesh1d mesh2d"
         cm.mesh_contact = "link1d2d"
 
     def _set_1dnetwork(self, ncfile: nc.Dataset, mesh1d: Mesh1d) -> None:  # type: ignore[import]
         #  network topology
-        ntw = ncfile.createVariable("network1d", "i4", ())
+        ntw = self._create_variable(ncfile, "network1d", "i4", ())
         ntw.cf_role = "mesh_topology"
         ntw.edge_dimension = "network1d_nEdges"
         ntw.edge_geometry = "network1d_geometry"
@@ -165,169 +346,188 @@ class UgridWriter:
         ntw.edge_length = "network1d_edge_length"
         ntw.branch_order = "network1d_branch_order"
 
-        ntw_node_id = ncfile.createVariable(
-            "network1d_node_id", "c", ("network1d_nNodes", "idstrlength")
+        ntw_node_id = self._create_variable(
+            ncfile, "network1d_node_id", "c", ("network1d_nNodes", "idstrlength")
         )
         ntw_node_id.long_name = "ID of network nodes"
-        ntw_node_id[:] = self.to_char_list(mesh1d.network1d_node_id, self.idstrlength)
+        ntw_node_id[:] = strings_to_chars(mesh1d.network1d_node_id, self.idstrlength)
 
-        ntw_node_longname = ncfile.createVariable(
-            "network1d_node_long_name", "c", ("network1d_nNodes", "longstrlength")
+        ntw_node_longname = self._create_variable(
+            ncfile,
+            "network1d_node_long_name",
+            "c",
+            ("network1d_nNodes", "longstrlength"),
         )
         ntw_node_longname.long_name = "Long name of network nodes"
-        ntw_node_longname[:] = self.to_char_list(
+        ntw_node_longname[:] = strings_to_chars(
             mesh1d.network1d_node_long_name, self.longstrlength
         )
 
         # network nodes
-        ntw_node_x = ncfile.createVariable(
-            "network1d_node_x", np.float64, "network1d_nNodes"
+        ntw_node_x = self._create_variable(
+            ncfile, "network1d_node_x", np.float64, "network1d_nNodes"
         )
         ntw_node_x.standard_name = "projection_x_coordinate"
         ntw_node_x.long_name = "x coordinates of network nodes"
         ntw_node_x.units = "m"
-        ntw_node_x[:] = mesh1d.network1d_node_x
+        self._write_values(ntw_node_x, mesh1d.network1d_node_x)
 
-        ntw_node_y = ncfile.createVariable(
-            "network1d_node_y", np.float64, "network1d_nNodes"
+        ntw_node_y = self._create_variable(
+            ncfile, "network1d_node_y", np.float64, "network1d_nNodes"
         )
         ntw_node_y.standard_name = "projection_y_coordinate"
         ntw_node_y.long_name = "y coordinates of network nodes"
         ntw_node_y.units = "m"
-        ntw_node_y[:] = mesh1d.network1d_node_y
+        self._write_values(ntw_node_y, mesh1d.network1d_node_y)
 
-        ntw_branch_id_name = ncfile.createVariable(
-            "network1d_branch_id", "c", ("network1d_nEdges", "idstrlength")
+        ntw_branch_id_name = self._create_variable(
+            ncfile, "network1d_branch_id", "c", ("network1d_nEdges", "idstrlength")
         )
         ntw_branch_id_name.long_name = "ID of branch geometries"
-        ntw_branch_id_name[:] = self.to_char_list(
+        ntw_branch_id_name[:] = strings_to_chars(
             mesh1d.network1d_branch_id, self.idstrlength
         )
 
-        ntw_branch_id_longname = ncfile.createVariable(
-            "network1d_branch_long_name", "c", ("network1d_nEdges", "longstrlength")
+        ntw_branch_id_longname = self._create_variable(
+            ncfile,
+            "network1d_branch_long_name",
+            "c",
+            ("network1d_nEdges", "longstrlength"),
         )
         ntw_branch_id_longname.long_name = "Long name of branch geometries"
-        ntw_branch_id_longname[:] = self.to_char_list(
+        ntw_branch_id_longname[:] = strings_to_chars(
             mesh1d.network1d_branch_long_name, self.longstrlength
         )
 
-        ntw_edge_length = ncfile.createVariable(
-            "network1d_edge_length", np.float64, "network1d_nEdges"
+        ntw_edge_length = self._create_variable(
+            ncfile, "network1d_edge_length", np.float64, "network1d_nEdges"
         )
         ntw_edge_length.long_name = "Real length of branch geometries"
         ntw_edge_length.units = "m"
-        ntw_edge_length[:] = mesh1d.network1d_branch_length
+        self._write_values(ntw_edge_length, mesh1d.network1d_branch_length)
 
-        ntw_branch_order = ncfile.createVariable(
-            "network1d_branch_order", "i4", "network1d_nEdges"
+        ntw_branch_order = self._create_variable(
+            ncfile, "network1d_branch_order", "i4", "network1d_nEdges"
         )
         ntw_branch_order.long_name = "Order of branches for interpolation"
         ntw_branch_order.mesh = "network1d"
         ntw_branch_order.location = "edge"
-        ntw_branch_order[:] = mesh1d.network1d_branch_order
+        self._write_values(ntw_branch_order, mesh1d.network1d_branch_order)
 
         # network edges
-        ntw_edge_node = ncfile.createVariable(
-            "network1d_edge_nodes", "i4", ("network1d_nEdges", "Two")
+        ntw_edge_node = self._create_variable(
+            ncfile, "network1d_edge_nodes", "i4", ("network1d_nEdges", "Two")
         )
         ntw_edge_node.cf_role = "edge_node_connectivity"
         ntw_edge_node.long_name = "start and end nodes of network edges"
         ntw_edge_node.start_index = 1
-        ntw_edge_node[:] = mesh1d.network1d_edge_nodes + ntw_edge_node.start_index
+        self._write_values(
+            ntw_edge_node, mesh1d.network1d_edge_nodes, ntw_edge_node.start_index
+        )
 
         # network geometry
-        ntw_geom = ncfile.createVariable("network1d_geometry", "i4", ())
+        ntw_geom = self._create_variable(ncfile, "network1d_geometry", "i4", ())
         ntw_geom.geometry_type = "line"
         ntw_geom.long_name = "1D Geometry"
         ntw_geom.node_count = "network1d_geom_node_count"
         ntw_geom.node_coordinates = "network1d_geom_x network1d_geom_y"
 
-        ntw_geom_node_count = ncfile.createVariable(
-            "network1d_geom_node_count", "i4", "network1d_nEdges"
+        ntw_geom_node_count = self._create_variable(
+            ncfile, "network1d_geom_node_count", "i4", "network1d_nEdges"
         )
         ntw_geom_node_count.long_name = "Number of geometry nodes per branch"
-        ntw_geom_node_count[:] = mesh1d.network1d_part_node_count
+        self._write_values(ntw_geom_node_count, mesh1d.network1d_part_node_count)
 
-        ntw_geom_x = ncfile.createVariable(
-            "network1d_geom_x", np.float64, ("network1d_nGeometryNodes")
+        ntw_geom_x = self._create_variable(
+            ncfile, "network1d_geom_x", np.float64, ("network1d_nGeometryNodes")
         )
         ntw_geom_x.standard_name = "projection_x_coordinate"
         ntw_geom_x.long_name = "x-coordinate of branch geometry nodes"
         ntw_geom_x.units = "m"
-        ntw_geom_x[:] = mesh1d.network1d_geom_x
+        self._write_values(ntw_geom_x, mesh1d.network1d_geom_x)
 
-        ntw_geom_y = ncfile.createVariable(
-            "network1d_geom_y", np.float64, ("network1d_nGeometryNodes")
+        ntw_geom_y = self._create_variable(
+            ncfile, "network1d_geom_y", np.float64, ("network1d_nGeometryNodes")
         )
         ntw_geom_y.standard_name = "projection_y_coordinate"
         ntw_geom_y.long_name = "y-coordinate of branch geometry nodes"
         ntw_geom_y.units = "m"
-        ntw_geom_y[:] = mesh1d.network1d_geom_y
+        self._write_values(ntw_geom_y, mesh1d.network1d_geom_y)
 
     def _set_1dmesh(self, ncfile: nc.Dataset, mesh1d: Mesh1d) -> None:  # type: ignore[import]
 
-        nc_mesh1d = ncfile.createVariable("mesh1d", "i4", ())
+        nc_mesh1d = self._create_variable(ncfile, "mesh1d", "i4", ())
         nc_mesh1d.cf_role = "mesh_topology"
         nc_mesh1d.long_name = "Topology data of 1D Mesh"
         nc_mesh1d.coordinate_space = "network1d"
         nc_mesh1d.edge_dimension = "mesh1d_nEdges"
         nc_mesh1d.edge_node_connectivity = "mesh1d_edge_nodes"
-        nc_mesh1d.edge_coordinates = "mesh1d_edge_branch mesh1d_edge_offset mesh1d_edge_x mesh1d_edge_y"
-        nc_mesh1d.node_coordinates = "mesh1d_node_branch mesh1d_node_offset mesh1d_node_x mesh1d_node_y"
+        nc_mesh1d.edge_coordinates = (
+            "mesh1d_edge_branch mesh1d_edge_offset mesh1d_edge_x mesh1d_edge_y"
+        )
+        nc_mesh1d.node_coordinates = (
+            "mesh1d_node_branch mesh1d_node_offset mesh1d_node_x mesh1d_node_y"
+        )
         nc_mesh1d.node_dimension = "mesh1d_nNodes"
         nc_mesh1d.node_id = "mesh1d_node_id"
         nc_mesh1d.node_long_name = "mesh1d_node_long_name"
         nc_mesh1d.topology_dimension = 1
 
-        mesh1d_node_id = ncfile.createVariable(
-            "mesh1d_node_id", "c", ("mesh1d_nNodes", "idstrlength")
+        mesh1d_node_id = self._create_variable(
+            ncfile, "mesh1d_node_id", "c", ("mesh1d_nNodes", "idstrlength")
         )
         mesh1d_node_id.long_name = "ID of mesh nodes"
-        mesh1d_node_id[:] = self.to_char_list(mesh1d.mesh1d_node_id, self.idstrlength)
+        mesh1d_node_id[:] = strings_to_chars(mesh1d.mesh1d_node_id, self.idstrlength)
 
-        mesh1d_node_longname = ncfile.createVariable(
-            "mesh1d_node_long_name", "c", ("mesh1d_nNodes", "longstrlength")
+        mesh1d_node_longname = self._create_variable(
+            ncfile, "mesh1d_node_long_name", "c", ("mesh1d_nNodes", "longstrlength")
         )
         mesh1d_node_longname.long_name = "Long name of mesh nodes"
-        mesh1d_node_longname[:] = self.to_char_list(
+        mesh1d_node_longname[:] = strings_to_chars(
             mesh1d.mesh1d_node_long_name, self.longstrlength
         )
 
-        mesh1d_edge_node = ncfile.createVariable(
-            "mesh1d_edge_nodes", "i4", ("mesh1d_nEdges", "Two")
+        mesh1d_edge_node = self._create_variable(
+            ncfile, "mesh1d_edge_nodes", "i4", ("mesh1d_nEdges", "Two")
         )
         mesh1d_edge_node.cf_role = "edge_node_connectivity"
         mesh1d_edge_node.long_name = "Start and end nodes of mesh edges"
         mesh1d_edge_node.start_index = 1
-        mesh1d_edge_node[:] = mesh1d.mesh1d_edge_nodes + mesh1d_edge_node.start_index
+        self._write_values(
+            mesh1d_edge_node, mesh1d.mesh1d_edge_nodes, mesh1d_edge_node.start_index
+        )
 
-        mesh1d_edge_branch = ncfile.createVariable(
-            "mesh1d_edge_branch", "i4", "mesh1d_nEdges"
+        mesh1d_edge_branch = self._create_variable(
+            ncfile, "mesh1d_edge_branch", "i4", "mesh1d_nEdges"
         )
         mesh1d_edge_branch.long_name = "Index of branch on which mesh edges are located"
         mesh1d_edge_branch.start_index = 1
-        mesh1d_edge_branch[:] = (
-            mesh1d.mesh1d_edge_branch_id + mesh1d_edge_branch.start_index
+        self._write_values(
+            mesh1d_edge_branch,
+            mesh1d.mesh1d_edge_branch_id,
+            mesh1d_edge_branch.start_index,
         )
 
-        mesh1d_edge_offset = ncfile.createVariable(
-            "mesh1d_edge_offset", np.float64, "mesh1d_nEdges"
+        mesh1d_edge_offset = self._create_variable(
+            ncfile, "mesh1d_edge_offset", np.float64, "mesh1d_nEdges"
         )
         mesh1d_edge_offset.long_name = "Offset along branch of mesh edges"
         mesh1d_edge_offset.units = "m"
-        mesh1d_edge_offset[:] = mesh1d.mesh1d_edge_branch_offset
+        self._write_values(mesh1d_edge_offset, mesh1d.mesh1d_edge_branch_offset)
 
-        mesh1d_node_branch = ncfile.createVariable(
-            "mesh1d_node_branch", "i4", "mesh1d_nNodes"
+        mesh1d_node_branch = self._create_variable(
+            ncfile, "mesh1d_node_branch", "i4", "mesh1d_nNodes"
         )
         mesh1d_node_branch.long_name = "Index of branch on which mesh nodes are located"
         mesh1d_node_branch.start_index = 1
-        mesh1d_node_branch[:] = (
-            mesh1d.mesh1d_node_branch_id + mesh1d_node_branch.start_index
+        self._write_values(
+            mesh1d_node_branch,
+            mesh1d.mesh1d_node_branch_id,
+            mesh1d_node_branch.start_index,
         )
 
-        mesh1d_node_offset = ncfile.createVariable(
+        mesh1d_node_offset = self._create_variable(
+            ncfile,
             "mesh1d_node_offset",
             np.float64,
             "mesh1d_nNodes",
@@ -335,47 +535,47 @@ class UgridWriter:
         )
         mesh1d_node_offset.long_name = "Offset along branch of mesh nodes"
         mesh1d_node_offset.units = "m"
-        mesh1d_node_offset[:] = mesh1d.mesh1d_node_branch_offset
+        self._write_values(mesh1d_node_offset, mesh1d.mesh1d_node_branch_offset)
 
-        mesh_edge_x = ncfile.createVariable(
-            "mesh1d_edge_x", np.float64, "mesh1d_nEdges"
+        mesh_edge_x = self._create_variable(
+            ncfile, "mesh1d_edge_x", np.float64, "mesh1d_nEdges"
         )
         mesh_edge_x.standard_name = "projection_x_coordinate"
         mesh_edge_x.long_name = (
             "Characteristic x-coordinate of the mesh edge (e.g. midpoint)"
         )
         mesh_edge_x.units = "m"
-        mesh_edge_x[:] = mesh1d.mesh1d_edge_x
+        self._write_values(mesh_edge_x, mesh1d.mesh1d_edge_x)
 
-        mesh_edge_y = ncfile.createVariable(
-            "mesh1d_edge_y", np.float64, "mesh1d_nEdges"
+        mesh_edge_y = self._create_variable(
+            ncfile, "mesh1d_edge_y", np.float64, "mesh1d_nEdges"
         )
         mesh_edge_y.standard_name = "projection_y_coordinate"
         mesh_edge_y.long_name = (
             "Characteristic y-coordinate of the mesh edge (e.g. midpoint)"
         )
         mesh_edge_y.units = "m"
-        mesh_edge_y[:] = mesh1d.mesh1d_edge_y
+        self._write_values(mesh_edge_y, mesh1d.mesh1d_edge_y)
 
-        mesh_node_x = ncfile.createVariable(
-            "mesh1d_node_x", np.float64, "mesh1d_nNodes"
+        mesh_node_x = self._create_variable(
+            ncfile, "mesh1d_node_x", np.float64, "mesh1d_nNodes"
         )
         mesh_node_x.standard_name = "projection_x_coordinate"
         mesh_node_x.long_name = "x coordinates of mesh nodes"
         mesh_node_x.units = "m"
-        mesh_node_x[:] = mesh1d.mesh1d_node_x
+        self._write_values(mesh_node_x, mesh1d.mesh1d_node_x)
 
-        mesh_node_y = ncfile.createVariable(
-            "mesh1d_node_y", np.float64, "mesh1d_nNodes"
+        mesh_node_y = self._create_variable(
+            ncfile, "mesh1d_node_y", np.float64, "mesh1d_nNodes"
         )
         mesh_node_y.standard_name = "projection_y_coordinate"
         mesh_node_y.long_name = "y coordinates of mesh nodes"
         mesh_node_y.units = "m"
-        mesh_node_y[:] = mesh1d.mesh1d_node_y
+        self._write_values(mesh_node_y, mesh1d.mesh1d_node_y)
 
     def _set_2dmesh(self, ncfile: nc.Dataset, mesh2d: Mesh2d) -> None:  # type: ignore[import]
 
-        nc_mesh2d = ncfile.createVariable("mesh2d", "i4", ())
+        nc_mesh2d = self._create_variable(ncfile, "mesh2d", "i4", ())
         nc_mesh2d.long_name = "Topology data of 2D network"
         nc_mesh2d.topology_dimension = 2
         nc_mesh2d.cf_role = "mesh_topology"
@@ -390,13 +590,14 @@ class UgridWriter:
         nc_mesh2d.face_coordinates = "mesh2d_face_x mesh2d_face_y"
 
         # Nodes:
-        mesh2d_node_x = ncfile.createVariable(
-            "mesh2d_node_x", np.float64, nc_mesh2d.node_dimension
+        mesh2d_node_x = self._create_variable(
+            ncfile, "mesh2d_node_x", np.float64, nc_mesh2d.node_dimension
         )
-        mesh2d_node_y = ncfile.createVariable(
-            "mesh2d_node_y", np.float64, nc_mesh2d.node_dimension
+        mesh2d_node_y = self._create_variable(
+            ncfile, "mesh2d_node_y", np.float64, nc_mesh2d.node_dimension
         )
-        mesh2d_node_z = ncfile.createVariable(
+        mesh2d_node_z = self._create_variable(
+            ncfile,
             "mesh2d_node_z",
             np.float64,
             nc_mesh2d.node_dimension,
@@ -416,10 +617,11 @@ class UgridWriter:
         mesh2d_node_z.coordinates = "mesh2d_node_x mesh2d_node_y"
         mesh2d_node_z.grid_mapping = ""
 
-        mesh2d_node_x[:] = mesh2d.mesh2d_node_x
-        mesh2d_node_y[:] = mesh2d.mesh2d_node_y
+        self._write_values(mesh2d_node_x, mesh2d.mesh2d_node_x)
+        self._write_values(mesh2d_node_y, mesh2d.mesh2d_node_y)
 
-        mesh2d_en = ncfile.createVariable(
+        mesh2d_en = self._create_variable(
+            ncfile,
             "mesh2d_edge_nodes",
             "i4",
             (nc_mesh2d.edge_dimension, "Two"),
@@ -427,13 +629,15 @@ class UgridWriter:
         )
 
         # add edge x and y
-        mesh2d_ex = ncfile.createVariable(
+        mesh2d_ex = self._create_variable(
+            ncfile,
             "mesh2d_edge_x",
             np.float64,
             nc_mesh2d.edge_dimension,
         )
 
-        mesh2d_ey = ncfile.createVariable(
+        mesh2d_ey = self._create_variable(
+            ncfile,
             "mesh2d_edge_y",
             np.float64,
             nc_mesh2d.edge_dimension,
@@ -450,17 +654,18 @@ class UgridWriter:
             )
             setattr(var, "long_name", f"{dim}-coordinate of the mesh edge")
 
-        mesh2d_ex[:] = mesh2d.mesh2d_edge_x
-        mesh2d_ey[:] = mesh2d.mesh2d_edge_y
+        self._write_values(mesh2d_ex, mesh2d.mesh2d_edge_x)
+        self._write_values(mesh2d_ey, mesh2d.mesh2d_edge_y)
 
         mesh2d_en.cf_role = "edge_node_connectivity"
         mesh2d_en.long_name = "maps every edge to the two nodes that it connects"
         mesh2d_en.start_index = 1
         mesh2d_en.location = "edge"
         mesh2d_en.mesh = "mesh2d"
-        mesh2d_en[:] = mesh2d.mesh2d_edge_nodes + mesh2d_en.start_index
+        self._write_values(mesh2d_en, mesh2d.mesh2d_edge_nodes, mesh2d_en.start_index)
 
-        mesh2d_fn = ncfile.createVariable(
+        mesh2d_fn = self._create_variable(
+            ncfile,
             "mesh2d_face_nodes",
             "i4",
             (nc_mesh2d.face_dimension, nc_mesh2d.max_face_nodes_dimension),
@@ -471,15 +676,16 @@ class UgridWriter:
         mesh2d_fn.location = "face"
         mesh2d_fn.long_name = "maps every face to the nodes that it defines"
         mesh2d_fn.start_index = 1
-        mesh2d_fn[:] = mesh2d.mesh2d_face_nodes + mesh2d_fn.start_index
+        self._write_values(mesh2d_fn, mesh2d.mesh2d_face_nodes, mesh2d_fn.start_index)
 
-        mesh2d_face_x = ncfile.createVariable(
-            "mesh2d_face_x", np.float64, nc_mesh2d.face_dimension
+        mesh2d_face_x = self._create_variable(
+            ncfile, "mesh2d_face_x", np.float64, nc_mesh2d.face_dimension
         )
-        mesh2d_face_y = ncfile.createVariable(
-            "mesh2d_face_y", np.float64, nc_mesh2d.face_dimension
+        mesh2d_face_y = self._create_variable(
+            ncfile, "mesh2d_face_y", np.float64, nc_mesh2d.face_dimension
         )
-        mesh2d_face_z = ncfile.createVariable(
+        mesh2d_face_z = self._create_variable(
+            ncfile,
             "mesh2d_face_z",
             np.float64,
             nc_mesh2d.face_dimension,
@@ -500,19 +706,20 @@ class UgridWriter:
         mesh2d_face_z.coordinates = "mesh2d_face_x mesh2d_face_y"
         mesh2d_face_z.grid_mapping = ""
 
-        mesh2d_face_x[:] = mesh2d.mesh2d_face_x
-        mesh2d_face_y[:] = mesh2d.mesh2d_face_y
+        self._write_values(mesh2d_face_x, mesh2d.mesh2d_face_x)
+        self._write_values(mesh2d_face_y, mesh2d.mesh2d_face_y)
 
         # Assign altitude data
         # To faces
         if mesh2d.mesh2d_face_z.size > 0:
-            mesh2d_face_z[:] = mesh2d.mesh2d_face_z
+            self._write_values(mesh2d_face_z, mesh2d.mesh2d_face_z)
         # Assign to nodes
         if mesh2d.mesh2d_node_z.size > 0:
-            mesh2d_node_z[:] = mesh2d.mesh2d_node_z
+            self._write_values(mesh2d_node_z, mesh2d.mesh2d_node_z)
 
     def _set_1d2dlinks(self, ncfile: nc.Dataset, link1d2d: Link1d2d) -> None:  # type: ignore[import]
-        nc_link1d2d = ncfile.createVariable(
+        nc_link1d2d = self._create_variable(
+            ncfile,
             "link1d2d",
             "i4",
             ("nLink1D2D_edge", "Two"),
@@ -523,29 +730,30 @@ class UgridWriter:
         nc_link1d2d.contact_ids = "link1d2d_ids"
         nc_link1d2d.contact_long_names = "link1d2d_long_names"
         nc_link1d2d.start_index = 1
-        nc_link1d2d[:, :] = link1d2d.link1d2d + nc_link1d2d.start_index
+        self._write_values(nc_link1d2d, link1d2d.link1d2d, nc_link1d2d.start_index)
 
-        link1d2d_ids = ncfile.createVariable(
-            "link1d2d_ids", "c", ("nLink1D2D_edge", "idstrlength")
+        link1d2d_ids = self._create_variable(
+            ncfile, "link1d2d_ids", "c", ("nLink1D2D_edge", "idstrlength")
         )
         link1d2d_ids.long_name = "ids of the contact"
-        link1d2d_ids[:] = self.to_char_list(link1d2d.link1d2d_id, self.idstrlength)
+        link1d2d_ids[:] = strings_to_chars(link1d2d.link1d2d_id, self.idstrlength)
 
-        link1d2d_long_names = ncfile.createVariable(
-            "link1d2d_long_names", "c", ("nLink1D2D_edge", "longstrlength")
+        link1d2d_long_names = self._create_variable(
+            ncfile, "link1d2d_long_names", "c", ("nLink1D2D_edge", "longstrlength")
         )
         link1d2d_long_names.long_name = "long names of the contact"
-        link1d2d_long_names[:] = self.to_char_list(
+        link1d2d_long_names[:] = strings_to_chars(
             link1d2d.link1d2d_long_name, self.longstrlength
         )
 
-        link1d2d_contact_type = ncfile.createVariable(
+        link1d2d_contact_type = self._create_variable(
+            ncfile,
             "link1d2d_contact_type",
             "i4",
             "nLink1D2D_edge",
             fill_value=self._fill_value_config.int32_fill_value,
         )
-        link1d2d_contact_type[:] = link1d2d.link1d2d_contact_type
+        self._write_values(link1d2d_contact_type, link1d2d.link1d2d_contact_type)
 
     def str2chars(self, string, size):
         return string.ljust(size)[:size]
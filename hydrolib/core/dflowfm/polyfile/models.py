@@ -1,8 +1,9 @@
 """Models for representing pol/pli(z) polyline and polygon files."""
 
-from typing import Callable, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
-from pydantic import Field
+import numpy as np
+from pydantic import ConfigDict, Field, field_validator, model_validator
 
 from hydrolib.core.base.models import BaseModel, ModelSaveSettings, ParsableFileModel
 
@@ -56,9 +57,39 @@ class Point(BaseModel):
         return f"x:{x} y:{y} z:{z}"
 
 
+class _ReadOnlyPoint(Point):
+    """A Point of a PolyObject, which cannot be modified since it is created from the arrays.
+
+    The point compares equal to a Point with the same values.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Point):
+            return NotImplemented
+        return (self.x, self.y, self.z, tuple(self.data)) == (
+            other.x,
+            other.y,
+            other.z,
+            tuple(other.data),
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.y, self.z, tuple(self.data)))
+
+    def __repr_name__(self) -> str:
+        return Point.__name__
+
+
 class PolyObject(BaseModel):
     """PolyObject describing a single block in a poly file.
 
+    The geometry of the block is stored column-wise in contiguous float64 arrays,
+    such that large polylines do not require a model per point. The points can
+    still be provided with the `points` argument, and are materialized on demand
+    as read-only points with the `points` property.
+
     The metadata should be consistent with the points:
     - The number of points should be equal to number of rows defined in the metadata
     - The data of each point should be equal to the number of columns defined in the
@@ -69,13 +100,159 @@ class PolyObject(BaseModel):
             An optional description of this PolyObject
         metadata (Metadata):
             The Metadata of this PolObject, describing the structure
-        points (List[Point]):
-            The points describing this PolyObject, structured according to the Metadata
+        xy (np.ndarray):
+            The x- and y-coordinates of the points, with shape (n_points, 2).
+        z (Optional[np.ndarray]):
+            The optional z-coordinates of the points, with shape (n_points,).
+        data (np.ndarray):
+            The additional data variables of the points, with shape
+            (n_points, n_data).
+
+    Examples:
+        ```python
+        >>> import numpy as np
+        >>> from hydrolib.core.dflowfm.polyfile.models import Metadata, PolyObject
+        >>> obj = PolyObject(
+        ...     metadata=Metadata(name="L1", n_rows=2, n_columns=2),
+        ...     xy=np.array([[0.0, 1.0], [2.0, 3.0]]),
+        ... )
+        >>> obj.points[1]
+        Point(x=2.0, y=3.0, z=None, data=())
+
+        ```
     """
 
     description: Optional[Description] = None
     metadata: Metadata
-    points: List[Point]
+    xy: np.ndarray = Field(default_factory=lambda: np.empty((0, 2), np.float64))
+    z: Optional[np.ndarray] = None
+    data: np.ndarray = Field(default_factory=lambda: np.empty((0, 0), np.float64))
+
+    @model_validator(mode="before")
+    @classmethod
+    def _convert_points(cls, values: Any) -> Any:
+        """Convert the points, if given, and a missing data array to arrays."""
+        if not isinstance(values, dict):
+            return values
+
+        if "points" in values:
+            values = dict(values)
+            points = values.pop("points")
+            values.update(cls._points_to_arrays(points, values.get("metadata")))
+        elif "data" not in values and "xy" in values:
+            values = dict(values)
+            values["data"] = np.empty((len(values["xy"]), 0), np.float64)
+        return values
+
+    @field_validator("xy", mode="before")
+    @classmethod
+    def _validate_xy(cls, xy: Any) -> np.ndarray:
+        array = np.ascontiguousarray(xy, dtype=np.float64)
+        if array.size == 0:
+            array = array.reshape(0, 2)
+        if array.ndim != 2 or array.shape[1] != 2:
+            raise ValueError("xy should be an array with shape (n_points, 2).")
+        return array
+
+    @field_validator("z", mode="before")
+    @classmethod
+    def _validate_z(cls, z: Any) -> Optional[np.ndarray]:
+        if z is None:
+            return None
+        array = np.ascontiguousarray(z, dtype=np.float64)
+        if array.ndim != 1:
+            raise ValueError("z should be an array with shape (n_points,).")
+        return array
+
+    @field_validator("data", mode="before")
+    @classmethod
+    def _validate_data(cls, data: Any) -> np.ndarray:
+        array = np.ascontiguousarray(data, dtype=np.float64)
+        if array.ndim == 1 and array.size == 0:
+            array = array.reshape(0, 0)
+        if array.ndim != 2:
+            raise ValueError("data should be an array with shape (n_points, n_data).")
+        return array
+
+    @model_validator(mode="after")
+    def _validate_number_of_points(self) -> "PolyObject":
+        n_points = len(self.xy)
+        if self.z is not None and len(self.z) != n_points:
+            raise ValueError("z should have the same number of points as xy.")
+        if len(self.data) != n_points:
+            raise ValueError("data should have the same number of points as xy.")
+        return self
+
+    @classmethod
+    def _points_to_arrays(
+        cls, points: Sequence[Any], metadata: Any
+    ) -> Dict[str, Optional[np.ndarray]]:
+        points = [
+            point if isinstance(point, Point) else Point.model_validate(point)
+            for point in points
+        ]
+
+        has_z = [point.z is not None for point in points]
+        if any(has_z) and not all(has_z):
+            raise ValueError(
+                "The z-coordinate should be given for either all or none of the points."
+            )
+
+        n_data = {len(point.data) for point in points}
+        if len(n_data) > 1:
+            raise ValueError("All points should have the same number of data values.")
+        if not points:
+            n_data = {max(cls._get_n_columns(metadata) - 2, 0)}
+
+        return {
+            "xy": np.array([(p.x, p.y) for p in points], np.float64).reshape(-1, 2),
+            "z": np.array([p.z for p in points], np.float64) if any(has_z) else None,
+            "data": np.array([p.data for p in points], np.float64).reshape(
+                len(points), n_data.pop()
+            ),
+        }
+
+    @staticmethod
+    def _get_n_columns(metadata: Any) -> int:
+        if isinstance(metadata, Metadata):
+            return metadata.n_columns
+        if isinstance(metadata, dict):
+            return metadata.get("n_columns", 0)
+        return 0
+
+    @property
+    def points(self) -> Tuple[Point, ...]:
+        """The points of this PolyObject.
+
+        The points are created from the arrays on each access, and cannot be
+        modified. To change the points, modify the arrays or assign a new list of
+        points.
+        """
+        z = [None] * len(self.xy) if self.z is None else self.z.tolist()
+        return tuple(
+            _ReadOnlyPoint.model_construct(x=x, y=y, z=z_value, data=tuple(data))
+            for (x, y), z_value, data in zip(self.xy.tolist(), z, self.data.tolist())
+        )
+
+    @points.setter
+    def points(self, points: Sequence[Any]) -> None:
+        obj = PolyObject(metadata=self.metadata, points=points)
+        self.__dict__.update(xy=obj.xy, z=obj.z, data=obj.data)
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare this PolyObject with another, where the arrays are compared by value."""
+        if not isinstance(other, PolyObject):
+            return NotImplemented
+        if (self.z is None) != (other.z is None):
+            return False
+
+        return (
+            self.description == other.description
+            and self.metadata == other.metadata
+            and np.array_equal(self.xy, other.xy)
+            and (self.z is None or np.array_equal(self.z, other.z))
+            and np.array_equal(self.data, other.data)
+        )
 
 
 class PolyFile(ParsableFileModel):
@@ -136,12 +313,17 @@ class PolyFile(ParsableFileModel):
     @property
     def x(self) -> List[float]:
         """X-coordinates of all points in the PolyFile."""
-        return [point.x for obj in self.objects for point in obj.points]
+        return self._get_coordinates(0)
 
     @property
     def y(self) -> List[float]:
         """Y-coordinates of all points in the PolyFile."""
-        return [point.y for obj in self.objects for point in obj.points]
+        return self._get_coordinates(1)
+
+    def _get_coordinates(self, column: int) -> List[float]:
+        if not self.objects:
+            return []
+        return np.concatenate([obj.xy[:, column] for obj in self.objects]).tolist()
 
     def get_z_sources_sinks(self) -> Tuple[List[float], List[float]]:
         """
@@ -182,15 +364,16 @@ class PolyFile(ParsableFileModel):
 
                 ```
         """
-        has_data = True if self.objects[0].points[0].data else False
+        obj = self.objects[0]
+        has_data = obj.data.shape[1] > 0
 
         z_source_sink = []
         for elem in [0, -1]:
-            point = self.objects[0].points[elem]
+            z = None if obj.z is None else float(obj.z[elem])
             if has_data:
-                z_source_sink.append([point.z, point.data[0]])
+                z_source_sink.append([z, float(obj.data[elem, 0])])
             else:
-                z_source_sink.append([point.z])
+                z_source_sink.append([z])
 
         z_sink: list[float | None] = z_source_sink[0]
         z_source: list[float | None] = z_source_sink[1]
@@ -199,4 +382,4 @@ class PolyFile(ParsableFileModel):
     @property
     def number_of_points(self) -> int:
         """Total number of points in the PolyFile."""
-        return len(self.x)
+        return sum(len(obj.xy) for obj in self.objects)
@@ -1,10 +1,12 @@
 """parser.py defines all classes and functions related to parsing pol/pli(z) files."""
 
 import warnings
+from collections import defaultdict
 from enum import IntEnum
 from pathlib import Path
 from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 from pydantic import Field
 
 from hydrolib.core.base.models import BaseModel
@@ -72,8 +74,9 @@ class Block(BaseModel):
         name (Optional[str]): The name of this block. Defaults to None.
         dimensions (Optional[Tuple[int, int]]):
             The dimensions (n_rows, n_columns) of this Block. Defaults to None.
-        points (Optional[List[Point]]):
-            The points of this block. Defaults to None.
+        points (Optional[List[List[float]]]):
+            The values of the points of this block, one list per point.
+            Defaults to None.
         ws_warnings (List[ParseMsg]):
             The whitespace warnings associated with this block.
             Defaults to an empty list.
@@ -86,16 +89,23 @@ class Block(BaseModel):
     description: Optional[List[str]] = None
     name: Optional[str] = None
     dimensions: Optional[Tuple[int, int]] = None
-    points: Optional[List[Point]] = None
+    points: Optional[List[List[float]]] = None
 
     ws_warnings: List[ParseMsg] = []
     empty_lines: List[int] = []
 
-    def finalize(self) -> Optional[Tuple[PolyObject, List[ParseMsg]]]:
+    def finalize(
+        self, has_z_value: bool = False
+    ) -> Optional[Tuple[PolyObject, List[ParseMsg]]]:
         """Finalize this Block and return the constructed PolyObject and warnings.
 
         If the metadata or the points are None, then None is returned.
 
+        Args:
+            has_z_value (bool, optional):
+                Whether the third column contains the z-coordinates.
+                Defaults to False.
+
         Returns:
             Optional[Tuple[PolyObject, List[ParseMsg]]]:
                 The constructed PolyObject and warnings encountered while parsing it.
@@ -105,8 +115,11 @@ class Block(BaseModel):
         if metadata is None or self.points is None:
             return None
 
-        obj = PolyObject(
-            description=self._get_description(), metadata=metadata, points=self.points
+        values = np.array(self.points, dtype=np.float64).reshape(
+            len(self.points), metadata.n_columns
+        )
+        obj = _create_poly_object(
+            self._get_description(), metadata, values, has_z_value
         )
 
         return obj, self.ws_warnings + self._get_empty_line_warnings()
@@ -149,6 +162,22 @@ class Block(BaseModel):
         )
 
 
+def _create_poly_object(
+    description: Optional[Description],
+    metadata: Metadata,
+    values: np.ndarray,
+    has_z_value: bool,
+) -> PolyObject:
+    n_coordinates = 3 if has_z_value else 2
+    return PolyObject(
+        description=description,
+        metadata=metadata,
+        xy=values[:, :2],
+        z=values[:, 2] if has_z_value else None,
+        data=values[:, n_coordinates:],
+    )
+
+
 class InvalidBlock(BaseModel):
     """InvalidBlock is a temporary object which will be converted into a ParseMsg.
 
@@ -348,7 +377,7 @@ class Parser:
         self._current_block = Block(start_line=(self._line + offset))
 
     def _finish_block(self):
-        (obj, warnings) = self._current_block.finalize()  # type: ignore
+        obj, warnings = self._current_block.finalize(self._has_z_value)  # type: ignore
         self._poly_objects.append(obj)
 
         for msg in warnings:
@@ -408,12 +437,12 @@ class Parser:
             self._handle_new_error("Expected valid dimensions")
 
     def _parse_next_point(self, line: str) -> None:
-        point = Parser._convert_to_point(
+        values = Parser._convert_to_values(
             line, self._current_block.dimensions[1], self._has_z_value  # type: ignore
         )
 
-        if point is not None:
-            self._current_block.points.append(point)  # type: ignore
+        if values is not None:
+            self._current_block.points.append(values)  # type: ignore
             self._current_point += 1
 
             if self._current_block.dimensions[0] == self._current_point:  # type: ignore
@@ -506,37 +535,144 @@ class Parser:
         except ValueError:
             return None
 
+    @staticmethod
+    def _convert_to_values(
+        line: str, expected_n_points: int, has_z: bool
+    ) -> Optional[List[float]]:
+        elems = line.split()
+
+        if len(elems) < expected_n_points or expected_n_points < (3 if has_z else 2):
+            return None
+
+        try:
+            return [float(x) for x in elems[:expected_n_points]]
+        except ValueError:
+            return None
+
     @staticmethod
     def _convert_to_point(
         line: str, expected_n_points: int, has_z: bool
     ) -> Optional[Point]:
-        stripped = line.strip()
-        elems = stripped.split()
+        values = Parser._convert_to_values(line, expected_n_points, has_z)
+        if values is None:
+            return None
+
+        if has_z:
+            x, y, z, *data = values
+        else:
+            x, y, *data = values
+            z = None  # type: ignore
+
+        return Point(x=x, y=y, z=z, data=data)
+
 
-        if len(elems) < expected_n_points:
+def _read_poly_objects_in_bulk(
+    lines: Sequence[str], has_z_value: bool
+) -> Optional[List[PolyObject]]:
+    """Read the PolyObject instances by converting the points in bulk.
+
+    Only the descriptions, names and dimensions are read line by line, after which
+    the points of a block are skipped. The points of all blocks with the same number
+    of columns are then converted in a single numeric conversion.
+
+    Args:
+        lines (Sequence[str]): The lines of the polyfile.
+        has_z_value (bool): Whether to interpret the third column as z-coordinates.
+
+    Returns:
+        Optional[List[PolyObject]]:
+            The PolyObject instances, or None when any of the blocks is invalid.
+    """
+    min_n_columns = 3 if has_z_value else 2
+    n_lines = len(lines)
+    blocks = []
+    description: Optional[List[str]] = None
+
+    i = 0
+    while i < n_lines:
+        stripped = lines[i].strip()
+        i += 1
+        if not stripped:
+            continue
+        if stripped[0] == "*":
+            if description is None:
+                description = []
+            description.append(stripped[1:])
+            continue
+
+        while i < n_lines and not lines[i].strip():
+            i += 1
+        if i == n_lines:
             return None
 
-        try:
-            values = list(float(x) for x in elems[:expected_n_points])
+        dimensions = Parser._convert_to_dimensions(lines[i])
+        if dimensions is None or dimensions[1] < min_n_columns:
+            return None
+        if i + dimensions[0] >= n_lines:
+            return None
 
-            if has_z:
-                x, y, z, *data = values
-            else:
-                x, y, *data = values
-                z = None  # type: ignore
+        blocks.append((description, stripped, dimensions, i + 1))
+        description = None
+        i += dimensions[0] + 1
 
-            return Point(x=x, y=y, z=z, data=data)
+    if description is not None:
+        return None
 
+    rows_per_n_columns: Dict[int, List[str]] = defaultdict(list)
+    for _, _, (n_rows, n_columns), first_row in blocks:
+        rows_per_n_columns[n_columns].extend(lines[first_row : first_row + n_rows])
+
+    values_per_n_columns = {}
+    for n_columns, rows in rows_per_n_columns.items():
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                values = np.loadtxt(
+                    rows,
+                    dtype=np.float64,
+                    comments=None,
+                    usecols=range(n_columns),
+                    ndmin=2,
+                )
         except ValueError:
             return None
 
+        # Empty lines are skipped in the conversion, in which case the block
+        # does not consist of its number of rows.
+        if len(values) != len(rows):
+            return None
+        values_per_n_columns[n_columns] = values
+
+    objects = []
+    offsets = dict.fromkeys(values_per_n_columns, 0)
+    for description, name, (n_rows, n_columns), _ in blocks:
+        offset = offsets[n_columns]
+        offsets[n_columns] += n_rows
+        objects.append(
+            _create_poly_object(
+                (
+                    Description(content="\n".join(description))
+                    if description is not None
+                    else None
+                ),
+                Metadata(name=name, n_rows=n_rows, n_columns=n_columns),
+                values_per_n_columns[n_columns][offset : offset + n_rows],
+                has_z_value,
+            )
+        )
+
+    return objects
+
 
 def _determine_has_z_value(input_val: Union[Path, Iterator[str]]) -> bool:
     return isinstance(input_val, Path) and input_val.suffix == ".pliz"
 
 
 def read_polyfile(
-    filepath: Path, has_z_values: Optional[bool] = None, verbose: bool = False
+    filepath: Path,
+    has_z_values: Optional[bool] = None,
+    verbose: bool = False,
+    fast: bool = True,
 ) -> Dict:
     """Read the specified file and return the corresponding data.
 
@@ -581,6 +717,11 @@ def read_polyfile(
     invalid blocks will be reported as a single invalid block. Such invalid blocks will
     be reported as warnings.
 
+    By default the file is read in a fast mode, in which only the block headers are
+    read line by line, and the points of the blocks are converted in bulk. If any
+    block is invalid, or when verbose is True, the file is read line by line with the
+    Parser instead, which reports the warnings and errors described above.
+
     Args:
         filepath:
             Path to the pli(z)/pol convention structured file.
@@ -588,6 +729,8 @@ def read_polyfile(
             Whether to create points containing a z-value. Defaults to None.
         verbose:
             Whether to show warnings when parsing the file. Defaults to False.
+        fast:
+            Whether to read the file in the fast mode. Defaults to True.
 
     Raises:
         ValueError: When the plifile is invalid.
@@ -598,12 +741,18 @@ def read_polyfile(
     if has_z_values is None:
         has_z_values = _determine_has_z_value(filepath)
 
-    parser = Parser(filepath, has_z_value=has_z_values, verbose=verbose)
-
     content = open_file_with_fallback_encoding(filepath)
-    for line in content.splitlines(keepends=True):
-        parser.feed_line(line)
+    lines = content.splitlines(keepends=True)
+
+    objs = None
+    if fast and not verbose:
+        objs = _read_poly_objects_in_bulk(lines, has_z_values)
+
+    if objs is None:
+        parser = Parser(filepath, has_z_value=has_z_values, verbose=verbose)
+        for line in lines:
+            parser.feed_line(line)
 
-    objs = parser.finalize()
+        objs = parser.finalize()
 
     return {"has_z_values": has_z_values, "objects": objs}
@@ -2,7 +2,9 @@
 
 from itertools import chain
 from pathlib import Path
-from typing import Generator, Iterable, Optional, Sequence
+from typing import Generator, Iterable, List, Optional, Sequence
+
+import numpy as np
 
 from hydrolib.core.base.models import SerializerConfig
 from hydrolib.core.dflowfm.polyfile.models import (
@@ -86,9 +88,24 @@ class Serializer:
         """
         description = Serializer.serialize_description(obj.description)
         metadata = Serializer.serialize_metadata(obj.metadata)
-        points = [Serializer.serialize_point(obj, config) for obj in obj.points]
+        points = Serializer._serialize_points(obj, config)
         return chain(description, metadata, points)
 
+    @staticmethod
+    def _serialize_points(obj: PolyObject, config: SerializerConfig) -> List[str]:
+        """Serialize the points of the PolyObject directly from its arrays.
+
+        The points are formatted the same as with `serialize_point`.
+        """
+        columns = [obj.xy] if obj.z is None else [obj.xy, obj.z[:, None]]
+        values = np.hstack(columns + [obj.data]).tolist()
+
+        space = 4 * " "
+        float_format = config.float_format
+        return [
+            space + space.join(format(v, float_format) for v in row) for row in values
+        ]
+
 
 def write_polyfile(
     path: Path, data: Sequence[PolyObject], config: SerializerConfig
@@ -1,8 +1,10 @@
 """Package for D-Flow FM sample/forcing (xyz) file models."""
 
-from .models import XYZModel, XYZPoint
+from .models import XYZModel
+from .points import XYZPoint, XYZPoints
 
 __all__ = [
     "XYZPoint",
+    "XYZPoints",
     "XYZModel",
 ]
@@ -1,53 +1,48 @@
 """Models for D-Flow FM sample/forcing (xyz) files."""
 
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Union
 
-from pydantic import Field
+from pydantic import Field, field_validator
 
 from hydrolib.core.base.models import (
-    BaseModel,
     ModelSaveSettings,
     ParsableFileModel,
     SerializerConfig,
 )
+from hydrolib.core.base.utils import XYZStorage
+from hydrolib.core.config import settings
 
 from .parser import XYZParser
+from .points import XYZPoint, XYZPoints
 from .serializer import XYZSerializer
 
 
-class XYZPoint(BaseModel):
-    """Single sample or forcing point.
-
-    Attributes:
-        x: x or λ coordinate
-        y: y or φ coordinate
-        z: sample value or group number (forcing)
-        comment: keyword for grouping (forcing)
-    """
-
-    x: float
-    y: float
-    z: float
-    comment: Optional[str] = Field(
-        None, alias="group", description="comment or group name"
-    )
-
-    def _get_identifier(self, data: dict) -> Optional[str]:
-        x = data.get("x")
-        y = data.get("y")
-        z = data.get("z")
-        return f"x:{x} y:{y} z:{z}"
-
-
 class XYZModel(ParsableFileModel):
     """Sample or forcing file.
 
+    The points are stored as a list of XYZPoint models, or, with the `XYZ_STORAGE`
+    setting set to "array", as XYZPoints. The latter reads and writes the values of
+    all points in bulk, which is much faster for large sample files.
+
     Attributes:
-        points: List of [`XYZPoint`][hydrolib.core.dflowfm.xyz.models.XYZPoint]
+        points: List of [`XYZPoint`][hydrolib.core.dflowfm.xyz.points.XYZPoint],
+            or [`XYZPoints`][hydrolib.core.dflowfm.xyz.points.XYZPoints]
     """
 
-    points: List[XYZPoint] = []
+    points: Union[XYZPoints, List[XYZPoint]] = Field(
+        default_factory=list, union_mode="left_to_right"
+    )
+
+    @field_validator("points", mode="before")
+    @classmethod
+    def _convert_to_storage(cls, points: Any) -> Any:
+        """Store the points in arrays when the `XYZ_STORAGE` setting is "array"."""
+        if settings.XYZ_STORAGE == XYZStorage.ARRAY and not isinstance(
+            points, XYZPoints
+        ):
+            return XYZPoints.from_points(points)
+        return points
 
     @classmethod
     def _ext(cls) -> str:
@@ -65,4 +60,6 @@ class XYZModel(ParsableFileModel):
 
     @classmethod
     def _get_parser(cls) -> Callable[[Path], Dict]:
+        if settings.XYZ_STORAGE == XYZStorage.ARRAY:
+            return XYZParser.parse_arrays
         return XYZParser.parse
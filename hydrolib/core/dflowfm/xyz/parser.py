@@ -1,10 +1,18 @@
 """Parser for D-Flow FM sample/forcing (xyz) files."""
 
 import re
+import warnings
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
-from hydrolib.core.base.parser import open_file_with_fallback_encoding
+import numpy as np
+
+from hydrolib.core.base.file_manager import PathOrStr
+from hydrolib.core.base.parser import (
+    iter_lines_with_fallback_encoding,
+    open_file_with_fallback_encoding,
+)
+from hydrolib.core.dflowfm.xyz.points import XYZPoints
 
 xyzpattern = re.compile(r"\s+")
 
@@ -37,10 +45,90 @@ class XYZParser:
             ValueError: if a line in the file contains no values that
                 could be parsed.
         """
-        data: Dict = dict(points=[])
+        content = open_file_with_fallback_encoding(filepath)
+        lines = content.splitlines(keepends=True)
+        points = [
+            dict(x=x, y=y, z=z, comment=c)
+            for _, x, y, z, c in XYZParser._iter_rows(filepath, lines)
+        ]
+        return dict(points=points)
+
+    @staticmethod
+    def parse_arrays(filepath: Path) -> Dict:
+        """Parse an .xyz file into a Dict with the points read into arrays.
+
+        The values of all points are converted in bulk. Only when some of the
+        points have a comment, or when the file cannot be converted in bulk,
+        the lines are parsed one by one.
+
+        Args:
+            filepath (Path): .xyz file to be read.
 
+        Returns:
+            Dict: dictionary with "points" value set to the XYZPoints read.
+
+        Raises:
+            ValueError: if a line in the file contains no values that
+                could be parsed.
+        """
         content = open_file_with_fallback_encoding(filepath)
-        for linenr, line in enumerate(content.splitlines(keepends=True)):
+        points = XYZParser._parse_lines(
+            filepath, content.splitlines(), has_comment_lines="*" in content
+        )
+        return dict(points=points)
+
+    @staticmethod
+    def _parse_lines(
+        filepath: Path,
+        lines: List[str],
+        first_linenr: int = 0,
+        has_comment_lines: bool = True,
+    ) -> XYZPoints:
+        """Parse the lines, of which the first has index first_linenr, into arrays.
+
+        The lines starting with '*' are only removed if has_comment_lines is True.
+        """
+        values = lines
+        if has_comment_lines:
+            values = [line for line in lines if not line.lstrip().startswith("*")]
+
+        try:
+            with warnings.catch_warnings():
+                # An empty file gives a warning that it does not contain data.
+                warnings.simplefilter("ignore")
+                xyz = np.loadtxt(values, dtype=np.float64, comments=None, ndmin=2)
+        except ValueError:
+            xyz = None
+
+        if xyz is not None and (xyz.size == 0 or xyz.shape[1] == 3):
+            return XYZPoints(xyz)
+
+        return XYZParser._parse_rows_into_arrays(filepath, lines, first_linenr)
+
+    @staticmethod
+    def _parse_rows_into_arrays(
+        filepath: Path, lines: Iterable[str], first_linenr: int
+    ) -> XYZPoints:
+        values = []
+        comments = []
+        for linenr, x, y, z, c in XYZParser._iter_rows(filepath, lines, first_linenr):
+            try:
+                values.append((float(x), float(y), float(z)))
+            except ValueError:
+                raise ValueError(
+                    f"Error parsing XYZ file '{filepath}', line {linenr + 1}."
+                )
+            comments.append(c)
+
+        if all(c is None for c in comments):
+            return XYZPoints(values)
+        return XYZPoints(values, comments)
+
+    @staticmethod
+    def _iter_rows(
+        filepath: Path, lines: Iterable[str], first_linenr: int = 0
+    ) -> Iterator[Tuple[int, str, str, str, Optional[str]]]:
+        for linenr, line in enumerate(lines, start=first_linenr):
 
             line = line.strip()
             if line.startswith("*") or len(line) == 0:
@@ -58,6 +146,94 @@ class XYZParser:
             if len(c) == 0:
                 c = None
 
-            data["points"].append(dict(x=x, y=y, z=z, comment=c))
-
-        return data
+            yield linenr, x, y, z, c
+
+
+def iter_xyz_chunks(
+    filepath: PathOrStr,
+    chunk_size: int = 65536,
+    bounding_box: Optional[Tuple[float, float, float, float]] = None,
+) -> Iterator[np.ndarray]:
+    """Iterate over the x, y and z values of an .xyz file in chunks of points.
+
+    The file is read line by line, and the values of each chunk of points are
+    converted in bulk. Only the current chunk is kept in memory, such that files
+    larger than memory can be processed. Comments are ignored.
+
+    Args:
+        filepath (PathOrStr): The path to the .xyz file.
+        chunk_size (int, optional):
+            The number of points in each chunk. Defaults to 65536.
+        bounding_box (Optional[Tuple[float, float, float, float]], optional):
+            The bounding box (xmin, ymin, xmax, ymax). If given, only the points of
+            each chunk inside the bounding box, including its boundary, are
+            yielded, and chunks without such points are skipped. Defaults to None.
+
+    Yields:
+        np.ndarray:
+            The x, y and z values of the next chunk of points, with shape
+            (chunk_size, 3). The last chunk, and chunks filtered by the bounding
+            box, can contain fewer points.
+
+    Raises:
+        ValueError: When chunk_size is smaller than 1, or when a line in the file
+            contains no values that could be parsed.
+
+    Examples:
+        Compute the mean sample value:
+            ```python
+            >>> from hydrolib.core.dflowfm.xyz.parser import iter_xyz_chunks
+            >>> filepath = "tests/data/input/dflowfm_individual_files/sample.xyz"
+            >>> total, count = 0.0, 0
+            >>> for chunk in iter_xyz_chunks(filepath, chunk_size=2):
+            ...     total += chunk[:, 2].sum()
+            ...     count += len(chunk)
+            >>> float(total / count)
+            300.0
+
+            ```
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size should be at least 1.")
+
+    filepath = Path(filepath)
+    lines: List[str] = []
+    first_linenr = 0
+    n_points = 0
+    has_comment_lines = False
+
+    for linenr, line in enumerate(iter_lines_with_fallback_encoding(filepath)):
+        lines.append(line)
+        stripped = line.strip()
+        if stripped.startswith("*"):
+            has_comment_lines = True
+        elif stripped:
+            n_points += 1
+
+        if n_points == chunk_size:
+            points = XYZParser._parse_lines(
+                filepath, lines, first_linenr, has_comment_lines
+            )
+            yield from _filter_chunk(points.xyz, bounding_box)
+            lines = []
+            first_linenr = linenr + 1
+            n_points = 0
+            has_comment_lines = False
+
+    if n_points > 0:
+        points = XYZParser._parse_lines(
+            filepath, lines, first_linenr, has_comment_lines
+        )
+        yield from _filter_chunk(points.xyz, bounding_box)
+
+
+def _filter_chunk(
+    xyz: np.ndarray, bounding_box: Optional[Tuple[float, float, float, float]]
+) -> Iterator[np.ndarray]:
+    if bounding_box is not None:
+        xmin, ymin, xmax, ymax = bounding_box
+        x, y = xyz[:, 0], xyz[:, 1]
+        xyz = xyz[(x >= xmin) & (x <= xmax) & (y >= ymin) & (y <= ymax)]
+
+    if len(xyz) > 0:
+        yield xyz
@@ -0,0 +1,158 @@
+"""Points of D-Flow FM sample/forcing (xyz) files."""
+
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, Optional, Union
+
+import numpy as np
+from pydantic import Field
+
+from hydrolib.core.base.models import BaseModel
+
+
+class XYZPoint(BaseModel):
+    """Single sample or forcing point.
+
+    Attributes:
+        x: x or λ coordinate
+        y: y or φ coordinate
+        z: sample value or group number (forcing)
+        comment: keyword for grouping (forcing)
+    """
+
+    x: float
+    y: float
+    z: float
+    comment: Optional[str] = Field(
+        None, alias="group", description="comment or group name"
+    )
+
+    def _get_identifier(self, data: dict) -> Optional[str]:
+        x = data.get("x")
+        y = data.get("y")
+        z = data.get("z")
+        return f"x:{x} y:{y} z:{z}"
+
+
+class XYZPoints(Sequence):
+    """Sample or forcing points stored in NumPy arrays.
+
+    The x, y and z values are stored in a single float64 array, and the comments
+    only when at least one of the points has a comment. XYZPoints can be used as a
+    sequence of [`XYZPoint`][hydrolib.core.dflowfm.xyz.points.XYZPoint], which are
+    created when they are accessed. Changes to these points are therefore not stored.
+
+    Attributes:
+        xyz (np.ndarray): The x, y and z values of the points, with shape (n, 3).
+        comments (Optional[np.ndarray]):
+            The comments of the points, with shape (n,), or None if no point has a
+            comment.
+
+    Examples:
+        ```python
+        >>> from hydrolib.core.dflowfm.xyz.points import XYZPoints
+        >>> points = XYZPoints([[1.0, 10.0, 100.0], [2.0, 20.0, 200.0]])
+        >>> len(points)
+        2
+        >>> points[1]
+        XYZPoint(x=2.0, y=20.0, z=200.0, comment=None)
+
+        ```
+    """
+
+    def __init__(
+        self, xyz: Any, comments: Optional[Iterable[Optional[str]]] = None
+    ) -> None:
+        """Create new XYZPoints from the values of the points.
+
+        The values are not copied if they already are a float64 array, such that
+        for example a memory-mapped array can be written without loading it.
+
+        Args:
+            xyz (Any): The x, y and z values of the points, with shape (n, 3).
+            comments (Optional[Iterable[Optional[str]]], optional):
+                The comments of the points. Defaults to None.
+
+        Raises:
+            ValueError: When xyz does not have three columns, or when the number of
+                comments differs from the number of points.
+        """
+        xyz = np.asarray(xyz, dtype=np.float64)
+        if xyz.size == 0:
+            xyz = xyz.reshape(0, 3)
+        if xyz.ndim != 2 or xyz.shape[1] != 3:
+            raise ValueError("xyz should be an array with shape (n_points, 3).")
+
+        if comments is not None:
+            comments = np.asarray(comments, dtype=object)
+            if comments.shape != (len(xyz),):
+                raise ValueError(
+                    "The number of comments should equal the number of points."
+                )
+
+        self.xyz: np.ndarray = xyz
+        self.comments: Optional[np.ndarray] = comments
+
+    @classmethod
+    def from_points(cls, points: Iterable[Union[XYZPoint, Dict]]) -> "XYZPoints":
+        """Create XYZPoints from XYZPoint models or their dictionaries.
+
+        Args:
+            points (Iterable[Union[XYZPoint, Dict]]): The points.
+
+        Returns:
+            XYZPoints: The points stored in arrays.
+        """
+        points = [
+            point if isinstance(point, XYZPoint) else XYZPoint.model_validate(point)
+            for point in points
+        ]
+        xyz = np.array([(p.x, p.y, p.z) for p in points], dtype=np.float64)
+        comments = [point.comment for point in points]
+        if all(comment is None for comment in comments):
+            return cls(xyz)
+        return cls(xyz, comments)
+
+    @property
+    def x(self) -> np.ndarray:
+        """The x or λ coordinates of the points."""
+        return self.xyz[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        """The y or φ coordinates of the points."""
+        return self.xyz[:, 1]
+
+    @property
+    def z(self) -> np.ndarray:
+        """The sample values or group numbers of the points."""
+        return self.xyz[:, 2]
+
+    def __len__(self) -> int:
+        """The number of points."""
+        return len(self.xyz)
+
+    def __getitem__(self, index: Any) -> Any:
+        """Create the XYZPoint at the index, or the XYZPoints of a slice."""
+        if isinstance(index, slice):
+            comments = None if self.comments is None else self.comments[index]
+            return XYZPoints(self.xyz[index], comments)
+
+        x, y, z = self.xyz[index].tolist()
+        comment = None if self.comments is None else self.comments[index]
+        return XYZPoint.model_construct(x=x, y=y, z=z, comment=comment)
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare the points by value with other XYZPoints or a sequence of points."""
+        if isinstance(other, XYZPoints):
+            if (self.comments is None) != (other.comments is None):
+                return False
+            return np.array_equal(self.xyz, other.xyz) and (
+                self.comments is None or np.array_equal(self.comments, other.comments)
+            )
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        """Represent the XYZPoints by their number of points."""
+        return f"XYZPoints(n_points={len(self)})"
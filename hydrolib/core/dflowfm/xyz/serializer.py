@@ -1,9 +1,12 @@
 """Serializer for D-Flow FM sample/forcing (xyz) files."""
 
 from pathlib import Path
-from typing import Dict, Generator
+from typing import Dict, Generator, TextIO
 
 from hydrolib.core.base.models import ModelSaveSettings, SerializerConfig
+from hydrolib.core.dflowfm.xyz.points import XYZPoints
+
+_write_chunk_size = 65536
 
 
 class XYZSerializer:
@@ -19,6 +22,8 @@ class XYZSerializer:
         """
         Serializes the XYZ data to the file at the specified path.
 
+        Points stored as XYZPoints are formatted in bulk, and written in chunks.
+
         Attributes:
             path (Path): The path to the destination file.
             data (Dict): The data to be serialized.
@@ -27,6 +32,11 @@ class XYZSerializer:
         """
         path.parent.mkdir(parents=True, exist_ok=True)
 
+        if isinstance(data["points"], XYZPoints):
+            with path.open("w", encoding="utf8") as f:
+                XYZSerializer._serialize_arrays(f, data["points"], config)
+            return
+
         space = 1 * " "
         format_float = lambda x: f"{x:{config.float_format}}"
 
@@ -40,6 +50,28 @@ class XYZSerializer:
                 else:
                     f.write(f"{geometry}\n")
 
+    @staticmethod
+    def _serialize_arrays(f: TextIO, points: XYZPoints, config: SerializerConfig):
+        # The same format as for a list of points, with one format string per line.
+        geometry_format = " ".join(3 * [f"{{:{config.float_format}}}"])
+        line_format = geometry_format + "\n"
+
+        for start in range(0, len(points), _write_chunk_size):
+            end = start + _write_chunk_size
+            x, y, z = points.xyz[start:end].T.tolist()
+
+            if points.comments is None:
+                f.write("".join(map(line_format.format, x, y, z)))
+                continue
+
+            geometries = map(geometry_format.format, x, y, z)
+            f.write(
+                "".join(
+                    f"{geometry} # {comment}\n" if comment else f"{geometry}\n"
+                    for geometry, comment in zip(geometries, points.comments[start:end])
+                )
+            )
+
     @staticmethod
     def _get_point_values(point: Dict[str, float]) -> Generator[float, None, None]:
         yield point["x"]
@@ -10,6 +10,7 @@ from hydrolib.core.base.models import DiskOnlyFileModel, FileModel
 from hydrolib.core.base.utils import (
     FileChecksumCalculator,
     FilePathStyleConverter,
+    FileStat,
     FortranScientificNotationConverter,
     FortranUtils,
     OperatingSystem,
@@ -513,6 +514,27 @@ class TestFileChecksumCalculator(unittest.TestCase):
             self.assertEqual(result, "test_checksum")
 
 
+class TestFileStat:
+    """Test cases for the FileStat class."""
+
+    def test_from_path_existing_file(self, tmp_path: Path):
+        path = tmp_path / "file.txt"
+        path.write_text("content")
+        stat = path.stat()
+
+        file_stat = FileStat.from_path(path)
+
+        assert file_stat == FileStat(
+            size=stat.st_size, mtime_ns=stat.st_mtime_ns, inode=stat.st_ino
+        )
+
+    def test_from_path_non_existing_file(self, tmp_path: Path):
+        assert FileStat.from_path(tmp_path / "non_existing_file.txt") is None
+
+    def test_from_path_directory(self, tmp_path: Path):
+        assert FileStat.from_path(tmp_path) is None
+
+
 class TestFortranUtils(unittest.TestCase):
     """Test cases for the FortranUtils class."""
 
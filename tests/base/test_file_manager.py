@@ -1,5 +1,7 @@
 """Unit tests for the file_manager module."""
 
+import logging
+import os
 import platform
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
@@ -14,6 +16,8 @@ from hydrolib.core.base.file_manager import (
     FileModelCache,
     FilePathResolver,
     ModelLoadSettings,
+    ParallelLoadMode,
+    ParsedFilePrefetcher,
     PathStyleValidator,
     ResolveRelativeMode,
     context_file_loading,
@@ -22,7 +26,7 @@ from hydrolib.core.base.file_manager import (
     resolve_relative_to_root,
 )
 from hydrolib.core.base.models import FileModel, ModelSaveSettings
-from hydrolib.core.base.utils import PathStyle
+from hydrolib.core.base.utils import FileChangeDetection, FileStat, PathStyle
 from tests.utils import test_input_dir
 
 
@@ -327,6 +331,23 @@ class TestPathStyleValidator:
         )
         assert expected_message in str(error.value)
 
+    def test_copy_has_independent_state(self):
+        """Test that a copy resolves paths like the original, but has its own parents."""
+        resolver = FilePathResolver()
+        resolver.push_new_parent(
+            test_input_dir / "anchor", ResolveRelativeMode.ToAnchor
+        )
+        resolver.push_new_parent(Path("parent"), ResolveRelativeMode.ToParent)
+
+        copied_resolver = resolver.copy()
+        copied_resolver.pop_last_parent()
+        copied_resolver.pop_last_parent()
+
+        assert (
+            resolver.resolve(Path("file.txt")) == test_input_dir / "anchor" / "file.txt"
+        )
+        assert copied_resolver.resolve(Path("file.txt")) == Path.cwd() / "file.txt"
+
 
 class TestModelLoadSettings:
     """Test class for the ModelLoadSettings class."""
@@ -341,6 +362,94 @@ class TestModelLoadSettings:
         assert settings.recurse == value
         assert settings.resolve_casing == value
         assert settings.path_style == path_style
+        assert settings.parallel_mode == ParallelLoadMode.NONE
+        assert settings.max_workers is None
+        assert not settings.lazy
+
+    def test_parallel_properties(self):
+        """Test that the parallel load properties return the correct values."""
+        settings = ModelLoadSettings(
+            recurse=True,
+            resolve_casing=False,
+            path_style=PathStyle.UNIXLIKE,
+            parallel_mode=ParallelLoadMode.THREADS,
+            max_workers=4,
+        )
+        assert settings.parallel_mode == ParallelLoadMode.THREADS
+        assert settings.max_workers == 4
+
+    def test_lazy_property(self):
+        """Test that the lazy load property returns the correct value."""
+        settings = ModelLoadSettings(
+            recurse=True,
+            resolve_casing=False,
+            path_style=PathStyle.UNIXLIKE,
+            lazy=True,
+        )
+        assert settings.lazy
+
+
+class ParseCountingModel:
+    """Model type stub that records the files it parses."""
+
+    parsed: List[Path] = []
+
+    @classmethod
+    def _parse(cls, path: Path) -> Dict:
+        cls.parsed.append(path)
+        if path.name == "invalid.txt":
+            raise ValueError("Invalid file.")
+        return {"name": path.stem}
+
+
+class TestParsedFilePrefetcher:
+    """Test class for the ParsedFilePrefetcher class."""
+
+    def setup_method(self):
+        ParseCountingModel.parsed = []
+
+    def test_none_mode_raises_error(self):
+        """Test that a prefetcher cannot be created without a worker pool."""
+        with pytest.raises(ValueError):
+            ParsedFilePrefetcher(ParallelLoadMode.NONE, None)
+
+    def test_retrieve_returns_parsed_data_once(self, tmp_path: Path):
+        """Test that the parsed data is handed out exactly once."""
+        prefetcher = ParsedFilePrefetcher(ParallelLoadMode.THREADS, 2)
+        path = tmp_path / "child.txt"
+
+        prefetcher.submit(path, ParseCountingModel)
+        prefetcher.submit(path, ParseCountingModel)
+
+        assert prefetcher.retrieve(path, ParseCountingModel) == {"name": "child"}
+        assert prefetcher.retrieve(path, ParseCountingModel) is None
+        assert ParseCountingModel.parsed == [path]
+        prefetcher.shutdown()
+
+    def test_retrieve_with_different_model_type_returns_none(self, tmp_path: Path):
+        """Test that parsed data is only handed out for the model type it was parsed with."""
+        prefetcher = ParsedFilePrefetcher(ParallelLoadMode.THREADS, 2)
+        path = tmp_path / "child.txt"
+
+        prefetcher.submit(path, ParseCountingModel)
+
+        assert prefetcher.retrieve(path, MockFileModel) is None
+        prefetcher.shutdown()
+
+    def test_retrieve_when_parsing_failed_returns_none(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ):
+        """Test that a failed parse is logged and left to the caller to redo and report."""
+        prefetcher = ParsedFilePrefetcher(ParallelLoadMode.THREADS, 2)
+        path = tmp_path / "invalid.txt"
+
+        prefetcher.submit(path, ParseCountingModel)
+
+        with caplog.at_level(logging.WARNING):
+            assert prefetcher.retrieve(path, ParseCountingModel) is None
+        assert f"Parsing {path} in parallel failed" in caplog.text
+        assert "Invalid file." in caplog.text
+        prefetcher.shutdown()
 
 
 class TestCachedFileModel:
@@ -353,6 +462,13 @@ class TestCachedFileModel:
         cached_model = CachedFileModel(model, checksum)
         assert cached_model.model is model
         assert cached_model.checksum == checksum
+        assert cached_model.stat is None
+
+    def test_stat_property(self):
+        """Test that the stat property returns the provided stat."""
+        stat = FileStat(size=1, mtime_ns=2, inode=3)
+        cached_model = CachedFileModel(MockFileModel(), "checksum", stat)
+        assert cached_model.stat == stat
 
 
 class TestFileModelCache:
@@ -404,6 +520,83 @@ class TestFileModelCache:
         path = tmp_path / "some-mock-file.txt"
         assert cache.has_changed(path)
 
+    def test_has_changed_with_unchanged_stat_does_not_calculate_checksum(
+        self, tmp_path: Path
+    ):
+        """Test that the stat strategy skips the checksum when the file stat is unchanged."""
+        cache = FileModelCache(FileChangeDetection.STAT)
+        path = create_test_file(tmp_path)
+        register_model_with_cache(cache, path)
+
+        with patch.object(cache, "_get_checksum") as get_checksum:
+            assert not cache.has_changed(path)
+            get_checksum.assert_not_called()
+
+    def test_has_changed_with_checksum_strategy_calculates_checksum(
+        self, tmp_path: Path
+    ):
+        """Test that the checksum strategy always calculates the checksum."""
+        cache = FileModelCache(FileChangeDetection.CHECKSUM)
+        path = create_test_file(tmp_path)
+        register_model_with_cache(cache, path)
+
+        with patch.object(
+            cache, "_get_checksum", wraps=cache._get_checksum
+        ) as get_checksum:
+            assert not cache.has_changed(path)
+            get_checksum.assert_called_once_with(path)
+
+    @pytest.mark.parametrize("change_detection", list(FileChangeDetection))
+    def test_has_changed_on_rewritten_file_with_same_content_returns_false(
+        self, tmp_path: Path, change_detection: FileChangeDetection
+    ):
+        """Test that a file rewritten with identical content is not considered changed."""
+        cache = FileModelCache(change_detection)
+        path = create_test_file(tmp_path)
+        register_model_with_cache(cache, path)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert not cache.has_changed(path)
+        assert cache._cache_dict[path].stat == FileStat.from_path(path)
+
+    @pytest.mark.parametrize("change_detection", list(FileChangeDetection))
+    def test_has_changed_on_same_size_changed_file_returns_true(
+        self, tmp_path: Path, change_detection: FileChangeDetection
+    ):
+        """Test that a changed file with the same size is detected with both strategies."""
+        cache = FileModelCache(change_detection)
+        path = create_test_file(tmp_path, "Hello World")
+        register_model_with_cache(cache, path)
+        stat = path.stat()
+        path.write_text("Hello Earth")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert cache.has_changed(path)
+
+    def test_register_model_without_checksum_with_stat_strategy(self, tmp_path: Path):
+        """Test that the checksum is omitted, and any stat change counts as a change."""
+        cache = FileModelCache(FileChangeDetection.STAT)
+        path = create_test_file(tmp_path)
+        cache.register_model(path, MockFileModel(), calculate_checksum=False)
+
+        assert cache._cache_dict[path].checksum is None
+        assert not cache.has_changed(path)
+
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert cache.has_changed(path)
+
+    def test_register_model_without_checksum_with_checksum_strategy(
+        self, tmp_path: Path
+    ):
+        """Test that the checksum strategy always calculates the checksum."""
+        cache = FileModelCache(FileChangeDetection.CHECKSUM)
+        path = create_test_file(tmp_path)
+        cache.register_model(path, MockFileModel(), calculate_checksum=False)
+
+        assert cache._cache_dict[path].checksum is not None
+
     def test_is_empty_returns_true_when_empty(self):
         """Test that is_empty returns True when the cache is empty."""
         cache = FileModelCache()
@@ -555,6 +748,73 @@ class TestFileLoadContext:
         assert context.load_settings.resolve_casing == first_bool
         assert context.load_settings.path_style == first_path_style
 
+    def test_prefetch_without_parallel_mode_does_nothing(self, tmp_path: Path):
+        """Test that prefetch is a no-op when parallel loading is disabled."""
+        ParseCountingModel.parsed = []
+        context = FileLoadContext()
+        context.initialize_load_settings(True, False, PathStyle.UNIXLIKE)
+        path = create_test_file(tmp_path)
+
+        context.prefetch(path, ParseCountingModel)
+
+        assert context.retrieve_prefetched(path, ParseCountingModel) is None
+        assert ParseCountingModel.parsed == []
+
+    def test_prefetch_resolves_relative_to_current_parent(self, tmp_path: Path):
+        """Test that prefetched files are resolved exactly like their model would be."""
+        ParseCountingModel.parsed = []
+        context = FileLoadContext()
+        context.initialize_load_settings(
+            True, False, PathStyle.UNIXLIKE, ParallelLoadMode.THREADS
+        )
+        path = create_test_file(tmp_path)
+        context.push_new_parent(tmp_path, ResolveRelativeMode.ToParent)
+
+        context.prefetch(Path(path.name), ParseCountingModel)
+        context.prefetch(Path("does-not-exist.txt"), ParseCountingModel)
+
+        assert context.retrieve_prefetched(path, ParseCountingModel) == {
+            "name": path.stem
+        }
+        assert ParseCountingModel.parsed == [path]
+        context.close()
+
+    def test_prefetch_with_lazy_load_does_nothing(self, tmp_path: Path):
+        """Test that lazily loaded child files are not parsed ahead of time."""
+        ParseCountingModel.parsed = []
+        context = FileLoadContext()
+        context.initialize_load_settings(
+            True, False, PathStyle.UNIXLIKE, ParallelLoadMode.THREADS, lazy=True
+        )
+        path = create_test_file(tmp_path)
+
+        context.prefetch(path, ParseCountingModel)
+
+        assert context.retrieve_prefetched(path, ParseCountingModel) is None
+        assert ParseCountingModel.parsed == []
+
+    def test_create_lazy_load_context(self, tmp_path: Path):
+        """Test that the lazy load context continues from the current state of the context."""
+        context = FileLoadContext()
+        context.initialize_load_settings(True, False, PathStyle.UNIXLIKE, lazy=True)
+        context.push_new_parent(tmp_path, ResolveRelativeMode.ToParent)
+        path = create_test_file(tmp_path)
+        register_model_with_cache(context, path)
+
+        lazy_load_context = context.create_lazy_load_context()
+        context.pop_last_parent()
+
+        assert lazy_load_context.get_current_parent() == tmp_path
+        assert lazy_load_context.load_settings is context.load_settings
+        assert lazy_load_context.retrieve_model(
+            Path(path.name)
+        ) is context.retrieve_model(path)
+
+        lazy_load_context.push_new_parent(
+            tmp_path / "child", ResolveRelativeMode.ToParent
+        )
+        assert context.get_current_parent() == Path.cwd()
+
     def test_is_content_changed_on_unchanged_file_returns_false(self, tmp_path: Path):
         """Test that is_content_changed returns False for unchanged files."""
         context = FileLoadContext()
@@ -691,6 +951,19 @@ class TestContextManagerFileLoadContext:
             with file_load_context() as flc_child:
                 assert flc_child is flc_root
 
+    def test_provided_context_is_used_until_it_goes_out_of_scope(self):
+        """Test that a provided context replaces the current context temporarily."""
+        provided_context = FileLoadContext()
+
+        with file_load_context() as flc_root:
+            with file_load_context(provided_context) as flc_provided:
+                assert flc_provided is provided_context
+                with file_load_context() as flc_child:
+                    assert flc_child is provided_context
+            assert context_file_loading.get(None) is flc_root
+
+        assert context_file_loading.get(None) is None
+
 
 class TestPathStyleValidatorGlobal:
     """Test class for the path_style_validator global instance."""
@@ -30,7 +30,7 @@ from hydrolib.core.dflowfm.bc.models import ForcingModel
 from hydrolib.core.dflowfm.ext.models import ExtModel
 from hydrolib.core.dflowfm.mdu.models import FMModel
 from hydrolib.core.dimr.models import DIMR
-from tests.utils import test_input_dir, test_output_dir
+from tests.utils import record_prefetched_data, test_input_dir, test_output_dir
 
 _external_path = test_output_dir / "test_save_and_load_maintains_correct_paths_external"
 
@@ -69,6 +69,108 @@ class TestFileModel:
 
         assert model_a is not model_b
 
+    @pytest.mark.parametrize("parallel_mode", ["threads", "processes"])
+    def test_parallel_load_results_in_same_model_tree(self, parallel_mode: str):
+        model_path = (
+            test_input_dir
+            / "e02"
+            / "c11_korte-woerden-1d"
+            / "dimr_model"
+            / "dflowfm"
+            / "FlowFM.mdu"
+        )
+
+        sequential_model = FMModel(model_path)
+        with record_prefetched_data() as prefetched:
+            parallel_model = FMModel(
+                model_path, parallel_mode=parallel_mode, max_workers=2
+            )
+
+        assert len(prefetched) > 0
+        assert all(data is not None for data in prefetched)
+        sequential_geometry = sequential_model.geometry
+        parallel_geometry = parallel_model.geometry
+        assert parallel_geometry.structurefile == sequential_geometry.structurefile
+        assert parallel_geometry.crossdeffile == sequential_geometry.crossdeffile
+        assert parallel_geometry.frictfile == sequential_geometry.frictfile
+        assert (
+            parallel_model.external_forcing.extforcefilenew
+            == sequential_model.external_forcing.extforcefilenew
+        )
+
+    def test_parallel_load_with_unknown_mode_raises_error(self):
+        with pytest.raises(ValueError):
+            FMModel(self._reference_model_path, parallel_mode="unknown")
+
+    def test_lazy_load_results_in_same_model_tree(self):
+        eager_model = FMModel(self._reference_model_path)
+        lazy_model = FMModel(self._reference_model_path, lazy=True)
+
+        eager_geometry = eager_model.geometry
+        lazy_geometry = lazy_model.geometry
+        assert lazy_geometry.structurefile == eager_geometry.structurefile
+        assert lazy_geometry.frictfile == eager_geometry.frictfile
+        assert lazy_geometry.inifieldfile == eager_geometry.inifieldfile
+        assert (
+            lazy_model.external_forcing.extforcefilenew
+            == eager_model.external_forcing.extforcefilenew
+        )
+
+    def test_lazy_load_only_loads_child_models_on_first_access(self):
+        model = FMModel(self._reference_model_path, lazy=True)
+        structure_model = model.geometry.structurefile[0]
+        network_model = model.geometry.netfile
+
+        assert model.is_loaded
+        assert not structure_model.is_loaded
+        assert not network_model.is_loaded
+        assert structure_model.filepath == Path("structures.ini")
+
+        assert len(structure_model.structure) > 0
+        assert structure_model.is_loaded
+        assert not network_model.is_loaded
+
+    def test_lazy_load_child_model_resolves_its_own_children(self):
+        model = FMModel(self._reference_model_path, lazy=True)
+        ext_model = model.external_forcing.extforcefilenew
+
+        forcing_models = [boundary.forcingfile for boundary in ext_model.boundary]
+
+        assert len(forcing_models) == 2
+        assert forcing_models[0] is forcing_models[1]
+        assert not forcing_models[0].is_loaded
+        eager_model = FMModel(self._reference_model_path)
+        eager_ext_model = eager_model.external_forcing.extforcefilenew
+        assert (
+            forcing_models[0].forcing == eager_ext_model.boundary[0].forcingfile.forcing
+        )
+
+    def test_lazy_load_with_invalid_child_raises_error_on_access(self, tmp_path: Path):
+        shutil.copytree(self._reference_model_path.parent, tmp_path, dirs_exist_ok=True)
+        (tmp_path / "structures.ini").write_text("[Structure]\ntype = unknown\n")
+
+        model = FMModel(tmp_path / "fm.mdu", lazy=True)
+        structure_model = model.geometry.structurefile[0]
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                structure_model.structure
+            assert not structure_model.is_loaded
+
+    def test_lazy_load_and_save_recursively_saves_same_files(self, tmp_path: Path):
+        lazy_model = FMModel(self._reference_model_path, lazy=True)
+        eager_model = FMModel(self._reference_model_path)
+
+        lazy_model.save(tmp_path / "lazy" / "fm.mdu", recurse=True)
+        eager_model.save(tmp_path / "eager" / "fm.mdu", recurse=True)
+
+        eager_files = sorted(p.name for p in (tmp_path / "eager").iterdir())
+        assert sorted(p.name for p in (tmp_path / "lazy").iterdir()) == eager_files
+        for name in eager_files:
+            assert filecmp.cmp(
+                tmp_path / "lazy" / name, tmp_path / "eager" / name, shallow=False
+            )
+
     def test_save_model_without_recurse_only_saves_the_model(self):
         model = FMModel(self._reference_model_path)
 
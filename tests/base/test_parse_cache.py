@@ -0,0 +1,235 @@
+"""Unit tests for the parse_cache module."""
+
+import os
+import pickle
+from pathlib import Path
+from typing import Dict, List
+from unittest.mock import patch
+
+import pytest
+
+from hydrolib.core.base.parse_cache import PersistentParseCache
+from hydrolib.core.dflowfm.mdu.models import FMModel
+from hydrolib.core.dflowfm.structure.models import StructureModel
+from tests.utils import record_prefetched_data, test_input_dir
+
+
+class CountingParser:
+    """Parser stub that records the files it parses."""
+
+    def __init__(self) -> None:
+        self.parsed: List[Path] = []
+
+    def __call__(self, path: Path) -> Dict:
+        self.parsed.append(path)
+        return {"content": path.read_text()}
+
+
+def create_file(tmp_path: Path, name: str = "file.txt", content: str = "a") -> Path:
+    path = tmp_path / name
+    path.write_text(content)
+    return path
+
+
+def touch_later(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestPersistentParseCache:
+    def test_retrieve_without_entry_returns_none(self, tmp_path: Path):
+        cache = PersistentParseCache(tmp_path / "cache")
+        path = create_file(tmp_path)
+
+        assert cache.retrieve(path, StructureModel) is None
+
+    def test_parse_unchanged_file_is_parsed_once(self, tmp_path: Path):
+        cache = PersistentParseCache(tmp_path / "cache")
+        path = create_file(tmp_path)
+        parser = CountingParser()
+
+        first = cache.parse(path, StructureModel, parser)
+        second = cache.parse(path, StructureModel, parser)
+
+        assert first == second == {"content": "a"}
+        assert parser.parsed == [path]
+
+    def test_parse_is_persistent_between_cache_instances(self, tmp_path: Path):
+        path = create_file(tmp_path)
+        parser = CountingParser()
+
+        PersistentParseCache(tmp_path / "cache").parse(path, StructureModel, parser)
+        data = PersistentParseCache(tmp_path / "cache").parse(
+            path, StructureModel, parser
+        )
+
+        assert data == {"content": "a"}
+        assert parser.parsed == [path]
+
+    def test_parse_changed_file_is_parsed_again(self, tmp_path: Path):
+        cache = PersistentParseCache(tmp_path / "cache")
+        path = create_file(tmp_path)
+        parser = CountingParser()
+
+        cache.parse(path, StructureModel, parser)
+        path.write_text("b")
+        touch_later(path)
+        data = cache.parse(path, StructureModel, parser)
+
+        assert data == {"content": "b"}
+        assert parser.parsed == [path, path]
+
+    def test_retrieve_touched_file_with_same_content_returns_data(self, tmp_path: Path):
+        cache = PersistentParseCache(tmp_path / "cache")
+        path = create_file(tmp_path)
+        cache.register(path, StructureModel, {"content": "a"})
+
+        touch_later(path)
+
+        assert cache.retrieve(path, StructureModel) == {"content": "a"}
+
+    def test_entries_are_separated_per_model_type(self, tmp_path: Path):
+        cache = PersistentParseCache(tmp_path / "cache")
+        path = create_file(tmp_path)
+        cache.register(path, StructureModel, {"content": "a"})
+
+        assert cache.retrieve(path, FMModel) is None
+
+    def test_invalidate_removes_entries_of_path(self, tmp_path: Path):
+        cache = PersistentParseCache(tmp_path / "cache")
+        path = create_file(tmp_path, "first.txt")
+        other_path = create_file(tmp_path, "second.txt")
+        cache.register(path, StructureModel, {"content": "a"})
+        cache.register(path, FMModel, {"content": "a"})
+        cache.register(other_path, StructureModel, {"content": "a"})
+
+        cache.invalidate(path)
+
+        assert cache.retrieve(path, StructureModel) is None
+        assert cache.retrieve(path, FMModel) is None
+        assert cache.retrieve(other_path, StructureModel) == {"content": "a"}
+
+    def test_clear_removes_all_entries(self, tmp_path: Path):
+        cache = PersistentParseCache(tmp_path / "cache")
+        path = create_file(tmp_path)
+        cache.register(path, StructureModel, {"content": "a"})
+
+        cache.clear()
+
+        assert list((tmp_path / "cache").iterdir()) == []
+
+    def test_unreadable_entry_is_removed(self, tmp_path: Path):
+        cache = PersistentParseCache(tmp_path / "cache")
+        path = create_file(tmp_path)
+        cache.register(path, StructureModel, {"content": "a"})
+        entry_path = cache._get_entry_path(path, StructureModel)
+        entry_path.write_bytes(b"corrupt")
+
+        assert cache.retrieve(path, StructureModel) is None
+        assert not entry_path.exists()
+
+    def test_unpicklable_data_is_not_cached(self, tmp_path: Path):
+        cache = PersistentParseCache(tmp_path / "cache")
+        path = create_file(tmp_path)
+
+        cache.register(path, StructureModel, {"content": lambda: None})
+
+        assert cache.retrieve(path, StructureModel) is None
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path: Path):
+        paths = [create_file(tmp_path, f"{i}.txt") for i in range(3)]
+        data = {"content": "x" * 1000}
+        cache = PersistentParseCache(tmp_path / "cache", max_size=None)
+        for i, path in enumerate(paths):
+            cache.register(path, StructureModel, data)
+            entry_path = cache._get_entry_path(path, StructureModel)
+            os.utime(entry_path, ns=(i * 1_000_000_000, i * 1_000_000_000))
+        entry_size = cache._get_entry_path(paths[0], StructureModel).stat().st_size
+
+        bounded_cache = PersistentParseCache(
+            tmp_path / "cache", max_size=3 * entry_size
+        )
+        bounded_cache.register(create_file(tmp_path, "3.txt"), StructureModel, data)
+
+        # The entries are evicted until the size is below 90% of the maximum size.
+        assert bounded_cache.retrieve(paths[0], StructureModel) is None
+        assert bounded_cache.retrieve(paths[1], StructureModel) is None
+        assert bounded_cache.retrieve(paths[2], StructureModel) == data
+
+    def test_pickled_cache_uses_same_directory(self, tmp_path: Path):
+        cache = PersistentParseCache(tmp_path / "cache")
+        path = create_file(tmp_path)
+        cache.register(path, StructureModel, {"content": "a"})
+
+        unpickled_cache = pickle.loads(pickle.dumps(cache))
+
+        assert unpickled_cache.directory == cache.directory
+        assert unpickled_cache.retrieve(path, StructureModel) == {"content": "a"}
+        unpickled_cache.clear()
+        assert cache.retrieve(path, StructureModel) is None
+
+    def test_cache_directory_is_only_scanned_when_size_is_exceeded(
+        self, tmp_path: Path
+    ):
+        data = {"content": "x" * 1000}
+        cache = PersistentParseCache(tmp_path / "cache", max_size=10**6)
+
+        with patch.object(
+            PersistentParseCache,
+            "_scan_entries",
+            autospec=True,
+            side_effect=PersistentParseCache._scan_entries,
+        ) as scan_entries:
+            for i in range(5):
+                cache.register(create_file(tmp_path, f"{i}.txt"), StructureModel, data)
+
+        assert scan_entries.call_count == 1
+        assert cache._size == sum(
+            path.stat().st_size for path in (tmp_path / "cache").iterdir()
+        )
+
+
+class TestFileModelWithPersistentParseCache:
+    _model_path = (
+        test_input_dir
+        / "e02"
+        / "c11_korte-woerden-1d"
+        / "dimr_model"
+        / "dflowfm"
+        / "FlowFM.mdu"
+    )
+
+    @pytest.mark.parametrize("parallel_mode", [None, "threads"])
+    def test_second_load_does_not_parse_files(self, tmp_path: Path, parallel_mode: str):
+        cache = PersistentParseCache(tmp_path / "cache")
+        first_model = FMModel(
+            self._model_path, parse_cache=cache, parallel_mode=parallel_mode
+        )
+
+        with patch(
+            "hydrolib.core.dflowfm.ini.parser.Parser.parse_as_dict"
+        ) as parse_as_dict:
+            second_model = FMModel(
+                self._model_path, parse_cache=cache, parallel_mode=parallel_mode
+            )
+            parse_as_dict.assert_not_called()
+
+        assert second_model.geometry.structurefile == first_model.geometry.structurefile
+        assert second_model.geometry.crossdeffile == first_model.geometry.crossdeffile
+
+    def test_load_in_processes_uses_prefetched_data(self, tmp_path: Path):
+        cache = PersistentParseCache(tmp_path / "cache")
+        expected = FMModel(self._model_path)
+
+        with record_prefetched_data() as prefetched:
+            model = FMModel(
+                self._model_path,
+                parse_cache=cache,
+                parallel_mode="processes",
+                max_workers=2,
+            )
+
+        assert len(prefetched) > 0
+        assert all(data is not None for data in prefetched)
+        assert model.geometry.structurefile == expected.geometry.structurefile
+        assert model.geometry.crossdeffile == expected.geometry.crossdeffile
@@ -104,6 +104,39 @@ class TestParserFallbackEncoding:
 
         assert DEGREE in str(result), f"Degree symbol lost in parsed .bc content: {result!r}"
 
+    def test_bc_forcing_model_iter_forcings(self, tmp_path: Path):
+        """Test `ForcingModel.iter_forcings` streams a non-UTF-8 .bc file.
+
+        Test scenario:
+            A .bc file whose first forcing block is valid UTF-8 and whose second
+            block carries `°` (byte 0xB0) is streamed without a decode error, and
+            the degree symbol is preserved in the second forcing.
+        """
+        from hydrolib.core.dflowfm.bc.models import ForcingModel
+
+        block = (
+            "[Forcing]\n"
+            "name = L1_000{index}\n"
+            "function = timeseries\n"
+            "timeInterpolation = linear\n"
+            "quantity = time\n"
+            "unit = minutes since 2015-01-01 00:00:00{suffix}\n"
+            "quantity = waterlevelbnd\n"
+            "unit = m\n"
+            "0.0 0.01\n"
+            "120.0 0.01\n"
+        )
+        content = block.format(index=1, suffix="") + block.format(
+            index=2, suffix=f" {DEGREE}"
+        )
+        path = _write_latin1(tmp_path / "forcing.bc", content)
+        _assert_is_invalid_utf8(path)
+
+        forcings = list(ForcingModel.iter_forcings(path))
+
+        assert [forcing.name for forcing in forcings] == ["L1_0001", "L1_0002"]
+        assert DEGREE in forcings[1].quantityunitpair[0].unit, f"Degree symbol lost in streamed .bc content: {forcings!r}"
+
     def test_extold_parser(self, tmp_path: Path):
         """Test the old external-forcing `Parser.parse` reads a non-UTF-8 file.
 
@@ -362,3 +395,30 @@ class TestParserFallbackEncoding:
             ini_parser.Parser.parse(path)
 
         assert spy.call_count == 1, f"Expected the fallback helper to be called once, got {spy.call_count}"
+
+    def test_iter_lines_switches_to_latin1_at_first_invalid_line(self, tmp_path: Path):
+        """Test `iter_lines_with_fallback_encoding` falls back per line.
+
+        Test scenario:
+            A file whose first line is valid UTF-8 (`é` as two bytes) and whose
+            second line holds `°` as byte 0xB0 yields the first line decoded as
+            UTF-8 and the following lines decoded as Latin-1, with their line
+            endings preserved.
+        """
+        from hydrolib.core.base.parser import iter_lines_with_fallback_encoding
+
+        path = tmp_path / "mixed.txt"
+        path.write_bytes(
+            "caf\N{LATIN SMALL LETTER E WITH ACUTE}\n".encode("utf-8")
+            + f"{DEGREE}C\n".encode("latin-1")
+            + "last".encode("latin-1")
+        )
+        _assert_is_invalid_utf8(path)
+
+        lines = list(iter_lines_with_fallback_encoding(path))
+
+        assert lines == [
+            "caf\N{LATIN SMALL LETTER E WITH ACUTE}\n",
+            f"{DEGREE}C\n",
+            "last",
+        ]